@@ -9,7 +9,7 @@ import os
 import sys
 import logging
 from pathlib import Path
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template, send_from_directory, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 import uuid
@@ -25,7 +25,7 @@ sys.path.append(str(Path(__file__).parent))
 # Import our custom modules
 from src.core.rag_engine import RAGEngine
 from src.core.ai_companion import AICompanion
-from src.core.voice_engine import VoiceEngine
+from src.core.voice_engine import get_voice_engine
 from src.core.emotion_detector import EmotionDetector
 from src.core.document_processor import DocumentProcessor
 from src.core.mental_health_assessor import MentalHealthAssessor
@@ -69,11 +69,19 @@ try:
         model_name="gemini-pro"
     )
 
-    voice_engine = VoiceEngine(
+    voice_engine = get_voice_engine(
         elevenlabs_api_key=app.config.get('ELEVENLABS_API_KEY'),
         default_voice_id=app.config.get('ELEVENLABS_VOICE_ID'),
-        tts_engine=app.config['TTS_ENGINE']
+        tts_engine=app.config['TTS_ENGINE'],
+        stream_output_format=app.config['ELEVENLABS_OUTPUT_FORMAT'],
+        file_output_format=app.config['ELEVENLABS_FILE_FORMAT'],
+        model_id=app.config['ELEVENLABS_MODEL_ID'],
+        optimize_streaming_latency=app.config['ELEVENLABS_LATENCY_MODE'],
+        tts_concurrency=app.config['TTS_CONCURRENCY'],
+        tts_cache_dir=app.config['TTS_CACHE_DIR'],
+        tts_cache_max_bytes=app.config['TTS_CACHE_MAX_BYTES']
     )
+    app.extensions['voice_engine'] = voice_engine
 
     emotion_detector = EmotionDetector(
         enable_face_detection=app.config['ENABLE_FACE_EMOTION_DETECTION'],
@@ -168,7 +176,7 @@ def chat():
         })
 
         # Detect emotion from text
-        emotion_result = emotion_detector.analyze_text_emotion(message)
+        emotion_result = emotion_detector.analyze_text_emotion(message).to_dict()
 
         # Get RAG context if enabled and documents exist
         context_docs = []
@@ -208,7 +216,7 @@ def chat():
         })
 
         # Save session to database
-        db_manager.save_session(session)
+        db_manager.save_session_async(session)
 
         return jsonify({
             'response': response['text'],
@@ -234,6 +242,7 @@ def synthesize_speech():
         text = data.get('text', '').strip()
         emotion = data.get('emotion', 'caring')
         voice_id = data.get('voice_id')
+        output_format = data.get('output_format')
 
         if not text:
             return jsonify({'error': 'Text is required'}), 400
@@ -243,7 +252,8 @@ def synthesize_speech():
         result = voice_engine.synthesize_speech(
             text=text,
             emotion=emotion,
-            voice_id=voice_id
+            voice_id=voice_id,
+            output_format=output_format
         )
 
         return jsonify({
@@ -258,7 +268,43 @@ def synthesize_speech():
         logger.error(f"Speech synthesis error: {str(e)}")
         return jsonify({'error': 'Failed to synthesize speech'}), 500
 
-@app.route('/api/v1/voice/audio/<filename>')
+@app.route('/api/v1/voice/stream', methods=['POST'])
+def stream_speech():
+    """Streaming text-to-speech endpoint (falls back to a saved file without ElevenLabs)"""
+    try:
+        data = request.get_json()
+        text = data.get('text', '').strip()
+        emotion = data.get('emotion', 'caring')
+        voice_id = data.get('voice_id')
+
+        if not text:
+            return jsonify({'error': 'Text is required'}), 400
+
+        logger.info(f"Streaming speech for: {text[:50]}...")
+
+        result = voice_engine.synthesize_speech(
+            text=text,
+            emotion=emotion,
+            voice_id=voice_id,
+            stream=True
+        )
+
+        if 'audio_stream' in result:
+            return Response(stream_with_context(result['audio_stream']), mimetype=result['mimetype'])
+
+        return jsonify({
+            'success': True,
+            'audio_url': f"/api/v1/voice/audio/{result['filename']}",
+            'duration': result.get('duration'),
+            'text': text,
+            'emotion': emotion
+        })
+
+    except Exception as e:
+        logger.error(f"Speech streaming error: {str(e)}")
+        return jsonify({'error': 'Failed to synthesize speech'}), 500
+
+@app.route('/api/v1/voice/audio/<path:filename>')
 def get_audio_file(filename):
     """Serve generated audio files"""
     try:
@@ -314,7 +360,7 @@ def upload_document():
             })
 
             # Save session
-            db_manager.save_session(session)
+            db_manager.save_session_async(session)
 
             return jsonify({
                 'success': True,
@@ -349,7 +395,7 @@ def analyze_emotion():
             if not text:
                 return jsonify({'error': 'Text is required for text emotion analysis'}), 400
 
-            result = emotion_detector.analyze_text_emotion(text)
+            result = emotion_detector.analyze_text_emotion(text).to_dict()
 
         elif emotion_type == 'voice':
             # This would handle voice emotion analysis
@@ -373,7 +419,7 @@ def analyze_emotion():
                 'type': emotion_type
             })
 
-            db_manager.save_session(session)
+            db_manager.save_session_async(session)
 
         return jsonify(result)
 
@@ -409,7 +455,7 @@ def mental_health_assessment():
             'timestamp': datetime.now().isoformat()
         })
 
-        db_manager.save_session(session)
+        db_manager.save_session_async(session)
 
         return jsonify({
             'success': True,
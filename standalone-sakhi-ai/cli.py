@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from src.core.ai_companion import AICompanion
-from src.core.voice_engine import VoiceEngine
+from src.core.voice_engine import get_voice_engine
 from src.core.emotion_detector import EmotionDetector
 from src.core.mental_health_assessor import MentalHealthAssessor
 from src.utils.config import Config
@@ -51,7 +51,7 @@ class SakhiCLI:
             )
 
             # Initialize Voice Engine
-            self.voice_engine = VoiceEngine(
+            self.voice_engine = get_voice_engine(
                 elevenlabs_api_key=os.getenv('ELEVENLABS_API_KEY')
             )
 
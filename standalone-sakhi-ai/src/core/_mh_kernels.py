@@ -0,0 +1,53 @@
+"""
+Compiled scoring kernels for the Mental Health Assessor
+"""
+
+import logging
+
+import numpy as np
+
+# JIT compilation (optional)
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    logging.warning("Numba not available. Install with: pip install numba")
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def score_batch(values, thresholds):
+        """
+        Score many users' responses to one questionnaire in parallel
+
+        Args:
+            values: (n_users, n_questions) int8 array of response values
+            thresholds: Ascending int8 array of inclusive category upper bounds
+
+        Returns:
+            Tuple of (int32 total scores, int8 category indices)
+        """
+        n_users = values.shape[0]
+        scores = np.empty(n_users, np.int32)
+        categories = np.empty(n_users, np.int8)
+        for i in prange(n_users):
+            total = 0
+            for j in range(values.shape[1]):
+                total += values[i, j]
+            scores[i] = total
+            categories[i] = np.searchsorted(thresholds, total)
+        return scores, categories
+else:
+    def score_batch(values, thresholds):
+        """
+        Score many users' responses to one questionnaire with whole-array NumPy operations
+
+        Args:
+            values: (n_users, n_questions) int8 array of response values
+            thresholds: Ascending int8 array of inclusive category upper bounds
+
+        Returns:
+            Tuple of (int32 total scores, int8 category indices)
+        """
+        scores = values.sum(axis=1, dtype=np.int32)
+        return scores, np.searchsorted(thresholds, scores).astype(np.int8)
@@ -0,0 +1,63 @@
+"""
+Compiled text chunking kernels for the RAG Engine
+"""
+
+import logging
+
+# JIT compilation (optional)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    logging.warning("Numba not available. Install with: pip install numba")
+
+_PERIOD, _EXCLAMATION, _QUESTION, _SPACE = ord('.'), ord('!'), ord('?'), ord(' ')
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def chunk_bounds(chars, chunk_size, overlap):
+        """
+        Find chunk boundaries in whitespace-normalized text
+
+        Mirrors the pure-Python loop in RAGEngine._iter_chunks: prefer a
+        sentence ending in the back half of each window, else the last space,
+        stepping back by overlap.
+
+        Args:
+            chars: uint32 array of the text's code points
+            chunk_size: Maximum chunk size
+            overlap: Overlap between chunks
+
+        Returns:
+            List of (start, end) character offsets, one per window
+        """
+        n = chars.shape[0]
+        bounds = []
+        start = 0
+
+        while start < n:
+            end = start + chunk_size
+
+            if end < n:
+                # Last sentence ending in the back half of the window
+                last_sentence = -1
+                for i in range(end - 1, start + chunk_size // 2, -1):
+                    c = chars[i]
+                    if c == _PERIOD or c == _EXCLAMATION or c == _QUESTION:
+                        last_sentence = i
+                        break
+
+                if last_sentence != -1:
+                    end = last_sentence + 1
+                else:
+                    # Last space after the window start
+                    for i in range(end - 1, start, -1):
+                        if chars[i] == _SPACE:
+                            end = i
+                            break
+
+            bounds.append((start, min(end, n)))
+            start = max(start + 1, end - overlap)
+
+        return bounds
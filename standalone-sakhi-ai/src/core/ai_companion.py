@@ -3,6 +3,10 @@ AI Companion for Sakhi - Mental Health Support with RAG
 """
 
 import os
+import io
+import re
+import time
+import random
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -20,6 +24,65 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_choice = random.choice
+
+# Canned emotion-specific replies used when the model is unavailable
+_EMOTION_RESPONSES = {
+    'anxious': (
+        "I can hear that you're feeling anxious. That's completely valid, and you're not alone in these feelings. Let's talk through what's worrying you. Sometimes just putting our thoughts into words can help reduce their power.",
+        "Anxiety can feel overwhelming, but you've already taken a positive step by reaching out. I'm here to listen without judgment. What specific thoughts or situations are causing you distress?"
+    ),
+    'sad': (
+        "I'm really sorry you're feeling this way. Sadness is a natural human emotion, and it's okay to feel it. I'm here to sit with you in this feeling and listen whenever you're ready to share more.",
+        "It sounds like you're going through a difficult time. Please know that your feelings are valid, and you don't have to go through this alone. I'm here to support you with warmth and understanding."
+    ),
+    'angry': (
+        "I can sense your frustration, and it's completely valid to feel angry. These emotions often tell us that something important needs attention. What's been making you feel this way?",
+        "Anger is a natural emotion, and it's okay to feel it. I'm here to help you understand these feelings and find constructive ways to work through them."
+    )
+}
+
+# How long a successful health probe is trusted before calling the API again
+HEALTH_CHECK_TTL_SECONDS = 60
+
+# Keyword patterns for the fallback responder
+_CRISIS_RE = re.compile(r"(?:suicide|kill myself|end my life|harm myself)", re.IGNORECASE)
+_PROFESSIONAL_RE = re.compile(r"(?:therapy|therapist|professional help|counselor)", re.IGNORECASE)
+
+# AI self-references stripped from generated responses
+_AI_SELF_REFERENCE_RE = re.compile(r"As an AI|As a language model|I(?:'m| am) an AI")
+
+# Static prompt sections shared by every request
+_SYSTEM_PROMPT = """
+You are Sakhi, a compassionate and intelligent mental health companion AI. Your purpose is to provide emotional support, guidance, and information while maintaining professional boundaries.
+
+PERSONA CHARACTERISTICS:
+- Warm, empathetic, and caring
+- Knowledgeable about mental health and wellness
+- Non-judgmental and supportive
+- Professional but conversational
+- Culturally sensitive and inclusive
+
+RESPONSE GUIDELINES:
+- Always respond with genuine care and empathy
+- Provide practical, actionable advice when appropriate
+- Recognize and validate emotions
+- Encourage professional help for serious concerns
+- Use natural, conversational language
+- Include relevant context from provided documents when helpful
+- Be concise but thorough
+
+SAFETY BOUNDARIES:
+- I am not a replacement for professional mental healthcare
+- Always recommend professional help for serious conditions
+- Do not provide diagnoses
+- Focus on support, guidance, and information
+        """
+
+_RESPONSE_INSTRUCTION = """
+Please respond as Sakhi with empathy and care. If medical information is provided in the context, use it to give more informed guidance, but always remind the user to consult healthcare professionals for medical advice.
+        """
+
 class AICompanion:
     """AI Companion for mental health support and conversation"""
 
@@ -35,6 +98,9 @@ class AICompanion:
         self.model_name = model_name
         self.model = None
         self.is_initialized = False
+        self._generation_config = None
+        self._safety_settings = None
+        self._last_healthy_ts = 0.0
 
         self._initialize()
 
@@ -68,6 +134,10 @@ class AICompanion:
                 "max_output_tokens": 2048,
             }
 
+            # Keep config so reset_model can rebuild an identical model
+            self._generation_config = generation_config
+            self._safety_settings = safety_settings
+
             # Initialize model
             self.model = genai.GenerativeModel(
                 model_name=self.model_name,
@@ -101,10 +171,19 @@ class AICompanion:
                 'message': 'Google Generative AI not available'
             }
 
+        # Skip the API round-trip if the model answered recently
+        if time.monotonic() - self._last_healthy_ts < HEALTH_CHECK_TTL_SECONDS:
+            return {
+                'status': 'healthy',
+                'message': 'AI Companion is working',
+                'model': self.model_name
+            }
+
         try:
             # Test model with simple query
             test_response = self.model.generate_content("Hello")
             if test_response and test_response.text:
+                self._last_healthy_ts = time.monotonic()
                 return {
                     'status': 'healthy',
                     'message': 'AI Companion is working',
@@ -137,6 +216,7 @@ class AICompanion:
         Returns:
             Generated response with metadata
         """
+        timestamp = datetime.now().isoformat()
         try:
             logger.info(f"Generating response for: {message[:100]}...")
 
@@ -164,15 +244,7 @@ class AICompanion:
             # Extract sources if available
             sources = []
             if context:
-                sources = [
-                    {
-                        'id': doc.get('id', ''),
-                        'title': doc.get('metadata', {}).get('filename', 'Unknown Document'),
-                        'similarity': doc.get('similarity', 0.0),
-                        'snippet': doc.get('content', '')[:200] + "..." if len(doc.get('content', '')) > 200 else doc.get('content', '')
-                    }
-                    for doc in context[:3]  # Top 3 sources
-                ]
+                sources = [self._make_source(doc) for doc in context[:3]]  # Top 3 sources
 
             return {
                 'text': processed_response,
@@ -180,7 +252,7 @@ class AICompanion:
                 'model_used': self.model_name,
                 'context_used': len(context) > 0,
                 'emotion_responded': emotion.get('emotion') if emotion else None,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
 
         except Exception as e:
@@ -202,40 +274,16 @@ class AICompanion:
         Returns:
             Enhanced prompt
         """
-        prompt_parts = []
-
-        # System prompt
-        prompt_parts.append("""
-You are Sakhi, a compassionate and intelligent mental health companion AI. Your purpose is to provide emotional support, guidance, and information while maintaining professional boundaries.
-
-PERSONA CHARACTERISTICS:
-- Warm, empathetic, and caring
-- Knowledgeable about mental health and wellness
-- Non-judgmental and supportive
-- Professional but conversational
-- Culturally sensitive and inclusive
-
-RESPONSE GUIDELINES:
-- Always respond with genuine care and empathy
-- Provide practical, actionable advice when appropriate
-- Recognize and validate emotions
-- Encourage professional help for serious concerns
-- Use natural, conversational language
-- Include relevant context from provided documents when helpful
-- Be concise but thorough
-
-SAFETY BOUNDARIES:
-- I am not a replacement for professional mental healthcare
-- Always recommend professional help for serious conditions
-- Do not provide diagnoses
-- Focus on support, guidance, and information
-        """)
+        # Parts are written newline-separated, matching a "\n".join of the sections
+        buf = io.StringIO()
+        buf.write(_SYSTEM_PROMPT)
 
         # Add emotion context
         if emotion:
             emotion_name = emotion.get('emotion', 'neutral')
             confidence = emotion.get('confidence', 0.0)
-            prompt_parts.append(f"""
+            buf.write("\n")
+            buf.write(f"""
 CURRENT EMOTIONAL CONTEXT:
 The user appears to be feeling {emotion_name} (confidence: {confidence:.2f}).
 Please respond with appropriate empathy and support for this emotional state.
@@ -243,29 +291,46 @@ Please respond with appropriate empathy and support for this emotional state.
 
         # Add conversation history
         if conversation_history:
-            prompt_parts.append("\nRECENT CONVERSATION:")
+            buf.write("\n\nRECENT CONVERSATION:")
             for msg in conversation_history[-6:]:  # Last 6 messages
                 role = msg.get('role', 'unknown')
                 content = msg.get('content', '')[:200]  # Limit length
-                prompt_parts.append(f"{role.title()}: {content}")
+                buf.write(f"\n{role.title()}: {content}")
 
         # Add RAG context
         if context:
-            prompt_parts.append("\nRELEVANT MEDICAL/HEALTH CONTEXT:")
+            buf.write("\n\nRELEVANT MEDICAL/HEALTH CONTEXT:")
             for i, doc in enumerate(context[:3], 1):  # Top 3 documents
-                doc_content = doc.get('content', '')[:500]  # Limit length
+                content = doc.get('content', '')
                 doc_title = doc.get('metadata', {}).get('filename', 'Document')
-                prompt_parts.append(f"Document {i} ({doc_title}):\n{doc_content}")
+                buf.write(f"\nDocument {i} ({doc_title}):\n{content[:500]}")  # Limit length
 
         # Add user message
-        prompt_parts.append(f"\nUSER MESSAGE: {message}")
+        buf.write(f"\n\nUSER MESSAGE: {message}")
 
         # Add response instruction
-        prompt_parts.append("""
-Please respond as Sakhi with empathy and care. If medical information is provided in the context, use it to give more informed guidance, but always remind the user to consult healthcare professionals for medical advice.
-        """)
+        buf.write("\n")
+        buf.write(_RESPONSE_INSTRUCTION)
 
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
+
+    def _make_source(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a source reference for a RAG context document
+
+        Args:
+            doc: Context document
+
+        Returns:
+            Source entry with a truncated snippet
+        """
+        content = doc.get('content', '')
+        return {
+            'id': doc.get('id', ''),
+            'title': doc.get('metadata', {}).get('filename', 'Unknown Document'),
+            'similarity': doc.get('similarity', 0.0),
+            'snippet': content[:200] + "..." if len(content) > 200 else content
+        }
 
     def _process_response(self, response_text: str) -> str:
         """
@@ -284,8 +349,7 @@ Please respond as Sakhi with empathy and care. If medical information is provide
         processed = response_text.strip()
 
         # Remove any AI self-references
-        processed = processed.replace("As an AI", "").replace("As a language model", "")
-        processed = processed.replace("I'm an AI", "").replace("I am an AI", "")
+        processed = _AI_SELF_REFERENCE_RE.sub("", processed)
 
         # Ensure proper formatting
         if not processed.endswith(('.', '!', '?')):
@@ -308,30 +372,16 @@ Please respond as Sakhi with empathy and care. If medical information is provide
         Returns:
             Fallback response
         """
+        timestamp = datetime.now().isoformat()
         logger.info("Using fallback response generation")
 
         # Emotion-based responses
         emotion_name = emotion.get('emotion', 'neutral') if emotion else 'neutral'
 
-        emotion_responses = {
-            'anxious': [
-                "I can hear that you're feeling anxious. That's completely valid, and you're not alone in these feelings. Let's talk through what's worrying you. Sometimes just putting our thoughts into words can help reduce their power.",
-                "Anxiety can feel overwhelming, but you've already taken a positive step by reaching out. I'm here to listen without judgment. What specific thoughts or situations are causing you distress?"
-            ],
-            'sad': [
-                "I'm really sorry you're feeling this way. Sadness is a natural human emotion, and it's okay to feel it. I'm here to sit with you in this feeling and listen whenever you're ready to share more.",
-                "It sounds like you're going through a difficult time. Please know that your feelings are valid, and you don't have to go through this alone. I'm here to support you with warmth and understanding."
-            ],
-            'angry': [
-                "I can sense your frustration, and it's completely valid to feel angry. These emotions often tell us that something important needs attention. What's been making you feel this way?",
-                "Anger is a natural emotion, and it's okay to feel it. I'm here to help you understand these feelings and find constructive ways to work through them."
-            ]
-        }
-
         # Select appropriate response
-        if emotion_name in emotion_responses:
-            import random
-            response_text = random.choice(emotion_responses[emotion_name])
+        responses = _EMOTION_RESPONSES.get(emotion_name)
+        if responses:
+            response_text = _choice(responses)
         else:
             response_text = self._get_general_response(message)
 
@@ -341,7 +391,7 @@ Please respond as Sakhi with empathy and care. If medical information is provide
             'model_used': 'fallback',
             'context_used': False,
             'emotion_responded': emotion_name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'fallback_mode': True
         }
 
@@ -355,11 +405,8 @@ Please respond as Sakhi with empathy and care. If medical information is provide
         Returns:
             General response
         """
-        message_lower = message.lower()
-
         # Check for crisis indicators
-        crisis_words = ['suicide', 'kill myself', 'end my life', 'harm myself']
-        if any(word in message_lower for word in crisis_words):
+        if _CRISIS_RE.search(message):
             return """I'm very concerned about what you're sharing. Please reach out for immediate help:
 
 🚨 Emergency Support:
@@ -370,8 +417,7 @@ Please respond as Sakhi with empathy and care. If medical information is provide
 Your life matters, and there are people who want to help you through this. Please reach out to one of these resources right now."""
 
         # Check for professional help needs
-        professional_words = ['therapy', 'therapist', 'professional help', 'counselor']
-        if any(word in message_lower for word in professional_words):
+        if _PROFESSIONAL_RE.search(message):
             return """That's a wonderful step to consider. Professional support can be incredibly helpful for mental wellness. A mental health professional can provide personalized guidance and evidence-based treatments tailored to your specific needs.
 
 Would you like me to help you think through what to look for in a therapist, or do you have questions about the therapy process?"""
@@ -384,7 +430,11 @@ Would you like me to help you think through what to look for in a therapist, or
         try:
             if HAS_GOOGLE_AI and self.api_key:
                 genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel(model_name=self.model_name)
+                self.model = genai.GenerativeModel(
+                    model_name=self.model_name,
+                    generation_config=self._generation_config,
+                    safety_settings=self._safety_settings
+                )
                 logger.info("✅ AI model reset successfully")
             else:
                 logger.warning("Cannot reset model - Google AI not available or no API key")
@@ -3,9 +3,15 @@ Document Processor for Sakhi AI - PDF and text document processing
 """
 
 import os
-import uuid
+import secrets
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Iterator
 from datetime import datetime
 from werkzeug.utils import secure_filename
 
@@ -18,21 +24,161 @@ except ImportError:
     HAS_PDF_PROCESSING = False
     logging.warning("PDF processing libraries not available. Install with: pip install pypdf pdfplumber")
 
+# Fast C-backed PDF parser (preferred when installed)
+try:
+    import fitz
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+    logging.warning("PyMuPDF not available, using pypdf for PDFs. Install with: pip install pymupdf")
+
 # Text processing
 import re
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Content cleaning patterns
+_WS_RE = re.compile(r'\s+')
+_PAGE_NUM_RE = re.compile(r'^\d+$')
+
+# Sentence boundary for summaries: end punctuation followed by a capitalized start
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9])')
+SUMMARY_PREFIX_CHARS = 4000
+
+# Entries kept per cache for detect_document_type / get_document_summary
+DOCUMENT_CACHE_SIZE = 256
+
+@functools.lru_cache(maxsize=1)
+def _ensure_punkt():
+    """Load NLTK and its Punkt data on first use, downloading the data if missing"""
+    import nltk
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+
+def _content_digest(content: str) -> bytes:
+    """Cheap fixed-size key for caching results computed from document content"""
+    return hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=16).digest()
+
+# Medical document keywords
+MEDICAL_KEYWORDS = (
+    'patient', 'diagnosis', 'treatment', 'prescription', 'medication',
+    'blood', 'test', 'report', 'doctor', 'hospital', 'clinical',
+    'medical', 'health', 'symptoms', 'therapy', 'surgery'
+)
+
+# Keyword score at which a document counts as medical
+MEDICAL_SCORE_THRESHOLD = 5
+
+# Counts every keyword occurrence in one case-insensitive pass over the content
+_MEDICAL_RE = re.compile('|'.join(map(re.escape, MEDICAL_KEYWORDS)), re.IGNORECASE)
+
+# Subtypes of a medical document, chosen from the (lowercased) filename in priority order
+_FILENAME_TYPE_PATTERNS = (
+    (re.compile(r'blood|lab'), 'blood_report'),
+    (re.compile(r'prescription|medication'), 'prescription'),
+    (re.compile(r'x-ray|radiology'), 'imaging'),
+)
+
+# PDFs with more pages than this are extracted across workers
+# (threads for pypdf, processes for pdfplumber)
+PARALLEL_PAGE_THRESHOLD = 4
+MAX_PDF_WORKERS = 4
+
+# pypdf issues many small seeks/reads (xref, trailer, objects); buffer them
+PDF_READ_BUFFER_SIZE = 1 << 20
+
+# PyMuPDF is fast enough that only long PDFs are worth splitting across processes
+PYMUPDF_PARALLEL_PAGE_THRESHOLD = 20
+
+# Start PDF worker processes without forking the server: a forked child inherits
+# its threads' held locks and open handles
+_PDF_PROCESS_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+def _page_has_images(page) -> bool:
+    """Check whether a pypdf page references image XObjects"""
+    return '/XObject' in page.get('/Resources', {})
+
+def _page_ranges(page_count: int, workers: int) -> List[tuple[int, int]]:
+    """Split page indices into contiguous (start, stop) ranges, one per worker"""
+    step = -(-page_count // workers)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+def _extract_page_range_pypdf(file_path: str, start: int, stop: int) -> List[tuple[Optional[str], bool]]:
+    """
+    Extract text from a range of PDF pages with pypdf in a worker thread
+
+    Each call opens its own reader: pypdf resolves page objects lazily from
+    the underlying stream, so a shared reader is not safe across threads.
+
+    Args:
+        file_path: Path to PDF file
+        start: First zero-based page index
+        stop: Page index to stop before
+
+    Returns:
+        (page text, has images) tuples in page order (text is None for pages that failed)
+    """
+    page_results = []
+    with open(file_path, 'rb', buffering=PDF_READ_BUFFER_SIZE) as file:
+        pdf_reader = pypdf.PdfReader(file)
+        for page_index in range(start, stop):
+            try:
+                page = pdf_reader.pages[page_index]
+                page_results.append((page.extract_text(), _page_has_images(page)))
+            except Exception as e:
+                logger.warning(f"Failed to extract page {page_index + 1}: {str(e)}")
+                page_results.append((None, False))
+    return page_results
+
+def _extract_page_range_pdfplumber(file_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """
+    Extract text from a range of PDF pages with pdfplumber in a worker process
+
+    Args:
+        file_path: Path to PDF file
+        start: First zero-based page index
+        stop: Page index to stop before
+
+    Returns:
+        Page texts in page order (None for pages that failed)
+    """
+    page_texts = []
+    with pdfplumber.open(file_path) as pdf:
+        for page_index in range(start, stop):
+            try:
+                page_texts.append(pdf.pages[page_index].extract_text())
+            except Exception as e:
+                logger.warning(f"Failed to extract page {page_index + 1} with pdfplumber: {str(e)}")
+                page_texts.append(None)
+    return page_texts
+
+def _extract_page_range_pymupdf(file_path: str, start: int, stop: int) -> tuple[List[str], bool]:
+    """
+    Extract text from a range of PDF pages with PyMuPDF in a worker process
+
+    Args:
+        file_path: Path to PDF file
+        start: First zero-based page index
+        stop: Page index to stop before
+
+    Returns:
+        Tuple of (page texts, whether any page has images)
+    """
+    page_texts = []
+    has_images = False
+    with fitz.open(file_path) as doc:
+        for page_index in range(start, stop):
+            page = doc[page_index]
+            page_texts.append(page.get_text("text"))
+            has_images = has_images or bool(page.get_images())
+    return page_texts, has_images
+
 class DocumentProcessor:
     """Document processor for handling PDF and text files"""
 
@@ -47,6 +193,11 @@ class DocumentProcessor:
         self.upload_folder = upload_folder
         self.max_file_size = max_file_size
         self.allowed_extensions = {'pdf', 'txt', 'md'}
+        self._allowed_suffixes = frozenset('.' + extension for extension in self.allowed_extensions)
+
+        # LRU cache keyed by content digest, so repeat calls skip the work
+        self._summary_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         # Create upload folder if it doesn't exist
         os.makedirs(upload_folder, exist_ok=True)
@@ -61,8 +212,7 @@ class DocumentProcessor:
         Returns:
             True if file is allowed, False otherwise
         """
-        return '.' in filename and \
-               filename.rsplit('.', 1)[1].lower() in self.allowed_extensions
+        return os.path.splitext(filename)[1].lower() in self._allowed_suffixes
 
     def process_document(self, file, user_id: str = "default") -> Dict[str, Any]:
         """
@@ -83,18 +233,23 @@ class DocumentProcessor:
                 }
 
             filename = secure_filename(file.filename)
-            if not self.allowed_file(filename):
+            suffix = os.path.splitext(filename)[1].lower()
+            if suffix not in self._allowed_suffixes:
                 return {
                     'success': False,
                     'error': f'File type not allowed. Allowed types: {", ".join(self.allowed_extensions)}'
                 }
 
-            # Check file size
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
+            # Generate unique document ID
+            document_id = f"doc_{secrets.token_hex(6)}"
+
+            # Save file, then check its size on disk (avoids seeking the upload stream)
+            file_path = os.path.join(self.upload_folder, f"{document_id}_{filename}")
+            file.save(file_path)
+            file_size = os.stat(file_path).st_size
 
             if file_size > self.max_file_size:
+                os.remove(file_path)
                 return {
                     'success': False,
                     'error': f'File too large. Maximum size: {self.max_file_size // (1024*1024)}MB'
@@ -102,15 +257,8 @@ class DocumentProcessor:
 
             logger.info(f"Processing document: {filename} ({file_size} bytes)")
 
-            # Generate unique document ID
-            document_id = f"doc_{uuid.uuid4().hex[:12]}"
-
-            # Save file
-            file_path = os.path.join(self.upload_folder, f"{document_id}_{filename}")
-            file.save(file_path)
-
             # Extract content based on file type
-            file_extension = filename.rsplit('.', 1)[1].lower()
+            file_extension = suffix[1:]
             content, metadata = self._extract_content(file_path, file_extension)
 
             if not content:
@@ -119,8 +267,14 @@ class DocumentProcessor:
                     'error': 'Failed to extract content from document'
                 }
 
-            # Clean and process content
-            processed_content = self._clean_content(content)
+            # Clean and process content; lines are whitespace-collapsed so
+            # words can be counted from spaces without re-splitting the text
+            cleaned_lines = []
+            word_count = 0
+            for line in self._clean_content(content):
+                cleaned_lines.append(line)
+                word_count += line.count(' ') + 1
+            processed_content = '\n'.join(cleaned_lines)
 
             # Prepare result
             result = {
@@ -137,7 +291,7 @@ class DocumentProcessor:
                     'upload_date': datetime.now().isoformat(),
                     'user_id': user_id,
                     'pages': metadata.get('pages', 0),
-                    'word_count': len(processed_content.split()),
+                    'word_count': word_count,
                     'char_count': len(processed_content),
                     **metadata
                 }
@@ -153,7 +307,7 @@ class DocumentProcessor:
                 'error': f'Document processing failed: {str(e)}'
             }
 
-    def _extract_content(self, file_path: str, file_extension: str) -> tuple[str, Dict[str, Any]]:
+    def _extract_content(self, file_path: str, file_extension: str) -> tuple[List[str], Dict[str, Any]]:
         """
         Extract content from file
 
@@ -162,7 +316,7 @@ class DocumentProcessor:
             file_extension: File extension
 
         Returns:
-            Tuple of (content, metadata)
+            Tuple of (content chunks, metadata)
         """
         try:
             if file_extension == 'pdf':
@@ -170,13 +324,13 @@ class DocumentProcessor:
             elif file_extension in ['txt', 'md']:
                 return self._extract_text_content(file_path)
             else:
-                return "", {}
+                return [], {}
 
         except Exception as e:
             logger.error(f"Content extraction failed: {str(e)}")
-            return "", {}
+            return [], {}
 
-    def _extract_pdf_content(self, file_path: str) -> tuple[str, Dict[str, Any]]:
+    def _extract_pdf_content(self, file_path: str) -> tuple[List[str], Dict[str, Any]]:
         """
         Extract content from PDF file
 
@@ -184,8 +338,14 @@ class DocumentProcessor:
             file_path: Path to PDF file
 
         Returns:
-            Tuple of (content, metadata)
+            Tuple of (per-page content chunks, metadata)
         """
+        if HAS_PYMUPDF:
+            try:
+                return self._extract_pdf_content_pymupdf(file_path)
+            except Exception as e:
+                logger.warning(f"PyMuPDF extraction failed, trying pypdf: {str(e)}")
+
         if not HAS_PDF_PROCESSING:
             raise Exception("PDF processing libraries not available")
 
@@ -198,23 +358,27 @@ class DocumentProcessor:
 
         try:
             # Try pypdf first
-            with open(file_path, 'rb') as file:
+            with open(file_path, 'rb', buffering=PDF_READ_BUFFER_SIZE) as file:
                 pdf_reader = pypdf.PdfReader(file)
                 metadata['pages'] = len(pdf_reader.pages)
 
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            content.append(f"Page {page_num}:\n{page_text.strip()}")
-                    except Exception as e:
-                        logger.warning(f"Failed to extract page {page_num}: {str(e)}")
+                if metadata['pages'] > PARALLEL_PAGE_THRESHOLD:
+                    page_results = self._extract_pypdf_pages_threaded(file_path, metadata['pages'])
+                else:
+                    # Text and image check share a single visit to each page
+                    page_results = []
+                    for page_num, page in enumerate(pdf_reader.pages, 1):
+                        try:
+                            page_results.append((page.extract_text(), _page_has_images(page)))
+                        except Exception as e:
+                            logger.warning(f"Failed to extract page {page_num}: {str(e)}")
+                            page_results.append((None, False))
 
-                # Check for images
-                for page in pdf_reader.pages:
-                    if '/XObject' in page.get('/Resources', {}):
+                for page_num, (page_text, has_images) in enumerate(page_results, 1):
+                    if page_text and page_text.strip():
+                        content.append(f"Page {page_num}:\n{page_text.strip()}")
+                    if has_images:
                         metadata['has_images'] = True
-                        break
 
         except Exception as e:
             logger.warning(f"pypdf extraction failed, trying pdfplumber: {str(e)}")
@@ -225,111 +389,214 @@ class DocumentProcessor:
                     metadata['pages'] = len(pdf.pages)
                     metadata['processing_method'] = 'pdfplumber'
 
-                    for page_num, page in enumerate(pdf.pages, 1):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text and page_text.strip():
-                                content.append(f"Page {page_num}:\n{page_text.strip()}")
-                        except Exception as e:
-                            logger.warning(f"Failed to extract page {page_num} with pdfplumber: {str(e)}")
+                    if metadata['pages'] > PARALLEL_PAGE_THRESHOLD:
+                        page_texts = self._extract_pdfplumber_pages_parallel(file_path, metadata['pages'])
+                    else:
+                        page_texts = []
+                        for page_num, page in enumerate(pdf.pages, 1):
+                            try:
+                                page_texts.append(page.extract_text())
+                            except Exception as e:
+                                logger.warning(f"Failed to extract page {page_num} with pdfplumber: {str(e)}")
+                                page_texts.append(None)
+
+                    for page_num, page_text in enumerate(page_texts, 1):
+                        if page_text and page_text.strip():
+                            content.append(f"Page {page_num}:\n{page_text.strip()}")
 
             except Exception as e:
                 logger.error(f"Both PDF extraction methods failed: {str(e)}")
                 raise
 
-        return "\n\n".join(content), metadata
+        return content, metadata
 
-    def _extract_text_content(self, file_path: str) -> tuple[str, Dict[str, Any]]:
+    def _extract_pdf_content_pymupdf(self, file_path: str) -> tuple[List[str], Dict[str, Any]]:
         """
-        Extract content from text file
+        Extract content from PDF file with PyMuPDF
 
         Args:
-            file_path: Path to text file
+            file_path: Path to PDF file
 
         Returns:
-            Tuple of (content, metadata)
+            Tuple of (per-page content chunks, metadata)
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+
+        if page_count > PYMUPDF_PARALLEL_PAGE_THRESHOLD:
+            workers = min(os.cpu_count() or 1, MAX_PDF_WORKERS)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_PDF_PROCESS_CONTEXT) as executor:
+                futures = [
+                    executor.submit(_extract_page_range_pymupdf, file_path, start, stop)
+                    for start, stop in _page_ranges(page_count, workers)
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [_extract_page_range_pymupdf(file_path, 0, page_count)]
 
-            # Detect line endings and normalize
-            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        page_texts = [text for texts, _ in results for text in texts]
+        content = [
+            f"Page {page_num}:\n{page_text.strip()}"
+            for page_num, page_text in enumerate(page_texts, 1)
+            if page_text.strip()
+        ]
+        metadata = {
+            'pages': page_count,
+            'has_images': any(has_images for _, has_images in results),
+            'processing_method': 'pymupdf'
+        }
 
-            # Count lines
-            lines = content.split('\n')
-            non_empty_lines = [line for line in lines if line.strip()]
+        return content, metadata
 
-            metadata = {
-                'pages': 1,  # Text files considered as 1 page
-                'lines': len(lines),
-                'non_empty_lines': len(non_empty_lines),
-                'processing_method': 'text'
-            }
+    def _extract_pypdf_pages_threaded(self, file_path: str, page_count: int) -> List[tuple[Optional[str], bool]]:
+        """
+        Extract PDF page text with pypdf concurrently in a thread pool
 
+        Args:
+            file_path: Path to PDF file
+            page_count: Number of pages in the PDF
+
+        Returns:
+            (page text, has images) tuples in page order (text is None for pages that failed)
+        """
+        ranges = _page_ranges(page_count, MAX_PDF_WORKERS)
+
+        # Threads avoid pickling; zlib stream decompression releases the GIL
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            results = executor.map(lambda page_range: _extract_page_range_pypdf(file_path, *page_range), ranges)
+            return [page_result for range_results in results for page_result in range_results]
+
+    def _extract_pdfplumber_pages_parallel(self, file_path: str, page_count: int) -> List[Optional[str]]:
+        """
+        Extract PDF page text with pdfplumber concurrently in a process pool
+
+        Args:
+            file_path: Path to PDF file
+            page_count: Number of pages in the PDF
+
+        Returns:
+            Page texts in page order (None for pages that failed)
+        """
+        ranges = _page_ranges(page_count, min(os.cpu_count() or 1, MAX_PDF_WORKERS))
+        page_texts = []
+
+        # pdfplumber is not thread-safe, so page ranges go to separate processes,
+        # each opening the PDF once
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=_PDF_PROCESS_CONTEXT) as executor:
+            futures = [executor.submit(_extract_page_range_pdfplumber, file_path, start, stop) for start, stop in ranges]
+            for (start, stop), future in zip(ranges, futures):
+                try:
+                    page_texts.extend(future.result())
+                except Exception as e:
+                    logger.warning(f"Failed to extract pages {start + 1}-{stop} with pdfplumber: {str(e)}")
+                    page_texts.extend([None] * (stop - start))
+
+        return page_texts
+
+    def _extract_text_content(self, file_path: str) -> tuple[List[str], Dict[str, Any]]:
+        """
+        Extract content from text file
+
+        Args:
+            file_path: Path to text file
+
+        Returns:
+            Tuple of (content lines, metadata)
+        """
+        try:
+            content, metadata = self._read_text_file(file_path, 'utf-8')
+            metadata['processing_method'] = 'text'
             return content, metadata
 
         except UnicodeDecodeError:
             # Try with different encoding
             try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    content = file.read()
-                return content, {'pages': 1, 'processing_method': 'text_latin1'}
+                content, metadata = self._read_text_file(file_path, 'latin-1')
+                metadata['processing_method'] = 'text_latin1'
+                return content, metadata
             except Exception as e:
                 raise Exception(f"Failed to read text file: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to extract text content: {str(e)}")
 
-    def _clean_content(self, content: str) -> str:
+    def _read_text_file(self, file_path: str, encoding: str) -> tuple[List[str], Dict[str, Any]]:
         """
-        Clean and normalize text content
+        Read a text file line by line, counting lines as it goes
 
         Args:
-            content: Raw text content
+            file_path: Path to text file
+            encoding: Text encoding
 
         Returns:
-            Cleaned text content
+            Tuple of (content lines, metadata)
         """
-        if not content:
-            return ""
+        lines = []
+        non_empty_lines = 0
 
-        # Remove excessive whitespace
-        content = re.sub(r'\s+', ' ', content)
+        # Universal newlines mode normalizes \r\n and \r to \n while reading
+        with open(file_path, 'r', encoding=encoding, newline=None, buffering=1 << 20) as file:
+            for line in file:
+                lines.append(line)
+                if line.strip():
+                    non_empty_lines += 1
 
-        # Remove page headers/footers (simple heuristic)
-        lines = content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            line = line.strip()
-            # Skip very short lines that are likely headers/footers
-            if len(line) > 3:
-                # Skip lines that look like page numbers
-                if not re.match(r'^\d+$', line):
-                    cleaned_lines.append(line)
+        metadata = {
+            'pages': 1,  # Text files considered as 1 page
+            'lines': len(lines),
+            'non_empty_lines': non_empty_lines
+        }
 
-        # Rejoin content
-        cleaned_content = '\n'.join(cleaned_lines)
+        return lines, metadata
 
-        # Remove multiple consecutive newlines
-        cleaned_content = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned_content)
+    def _clean_content(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Clean and normalize text content
 
-        return cleaned_content.strip()
+        Args:
+            chunks: Raw text content chunks (pages or lines)
 
-    def get_document_summary(self, content: str, max_sentences: int = 3) -> str:
+        Yields:
+            Cleaned, non-empty text lines
+        """
+        # Single pass over lines: drop headers/footers, collapse whitespace
+        for chunk in chunks:
+            for line in chunk.split('\n'):
+                line = line.strip()
+                # Skip very short lines that are likely headers/footers
+                # and lines that look like page numbers
+                if len(line) > 3 and not _PAGE_NUM_RE.match(line):
+                    yield _WS_RE.sub(' ', line)
+
+    def get_document_summary(self, content: str, max_sentences: int = 3,
+                             high_quality: bool = False) -> str:
         """
         Generate a summary of document content
 
         Args:
             content: Document content
             max_sentences: Maximum sentences in summary
+            high_quality: Use NLTK's Punkt tokenizer instead of the fast regex splitter
 
         Returns:
             Document summary
         """
+        # The fast path reads only a prefix, so only the prefix is hashed for its key
+        keyed_content = content if high_quality else content[:SUMMARY_PREFIX_CHARS]
+        cache_key = (_content_digest(keyed_content), max_sentences, high_quality)
+        summary = self._cache_get(self._summary_cache, cache_key)
+        if summary is not None:
+            return summary
+
         try:
             # Split into sentences
-            sentences = sent_tokenize(content)
+            if high_quality:
+                _ensure_punkt()
+                from nltk.tokenize import sent_tokenize
+                sentences = sent_tokenize(content)
+            else:
+                # Only a prefix is needed for the first few sentences
+                prefix = content[:SUMMARY_PREFIX_CHARS].strip()
+                sentences = _SENT_SPLIT_RE.split(prefix, maxsplit=max_sentences) if prefix else []
 
             if not sentences:
                 return "No content available for summary."
@@ -338,7 +605,9 @@ class DocumentProcessor:
             # In a real implementation, you might want more sophisticated summarization
             summary_sentences = sentences[:max_sentences]
 
-            return " ".join(summary_sentences)
+            summary = " ".join(summary_sentences)
+            self._cache_put(self._summary_cache, cache_key, summary)
+            return summary
 
         except Exception as e:
             logger.error(f"Summary generation failed: {str(e)}")
@@ -356,41 +625,46 @@ class DocumentProcessor:
             Detected document type
         """
         filename_lower = filename.lower()
-        content_lower = content.lower()
-
-        # Medical document keywords
-        medical_keywords = [
-            'patient', 'diagnosis', 'treatment', 'prescription', 'medication',
-            'blood', 'test', 'report', 'doctor', 'hospital', 'clinical',
-            'medical', 'health', 'symptoms', 'therapy', 'surgery'
-        ]
 
         # Check filename and content for medical keywords
         medical_score = 0
 
         # Check filename
-        for keyword in medical_keywords:
+        for keyword in MEDICAL_KEYWORDS:
             if keyword in filename_lower:
                 medical_score += 2
 
-        # Check content
-        for keyword in medical_keywords:
-            if keyword in content_lower:
-                medical_score += content_lower.count(keyword)
+        # Check content, stopping as soon as the threshold is reached
+        if medical_score < MEDICAL_SCORE_THRESHOLD:
+            for _ in _MEDICAL_RE.finditer(content):
+                medical_score += 1
+                if medical_score >= MEDICAL_SCORE_THRESHOLD:
+                    break
 
         # Determine document type
-        if medical_score >= 5:
-            if 'blood' in filename_lower or 'lab' in filename_lower:
-                return 'blood_report'
-            elif 'prescription' in filename_lower or 'medication' in filename_lower:
-                return 'prescription'
-            elif 'x-ray' in filename_lower or 'radiology' in filename_lower:
-                return 'imaging'
-            else:
-                return 'medical_report'
+        if medical_score >= MEDICAL_SCORE_THRESHOLD:
+            for pattern, document_type in _FILENAME_TYPE_PATTERNS:
+                if pattern.search(filename_lower):
+                    return document_type
+            return 'medical_report'
         else:
             return 'general'
 
+    def _cache_get(self, cache: OrderedDict, key):
+        """Return a cached value and mark it as recently used, or None"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            if len(cache) > DOCUMENT_CACHE_SIZE:
+                cache.popitem(last=False)
+
     def delete_document_file(self, file_path: str) -> bool:
         """
         Delete document file from storage
@@ -424,16 +698,16 @@ class DocumentProcessor:
             'upload_folder': self.upload_folder,
             'max_file_size_mb': self.max_file_size // (1024 * 1024),
             'allowed_extensions': list(self.allowed_extensions),
-            'pdf_processing_available': HAS_PDF_PROCESSING
+            'pdf_processing_available': HAS_PDF_PROCESSING or HAS_PYMUPDF
         }
 
         # Count files in upload folder
         try:
-            if os.path.exists(self.upload_folder):
-                files = os.listdir(self.upload_folder)
-                stats['uploaded_files_count'] = len([f for f in files if os.path.isfile(os.path.join(self.upload_folder, f))])
-            else:
-                stats['uploaded_files_count'] = 0
+            # DirEntry.is_file() reuses the readdir result instead of a stat per file
+            with os.scandir(self.upload_folder) as entries:
+                stats['uploaded_files_count'] = sum(1 for entry in entries if entry.is_file())
+        except FileNotFoundError:
+            stats['uploaded_files_count'] = 0
         except Exception as e:
             logger.error(f"Failed to get upload folder stats: {str(e)}")
             stats['uploaded_files_count'] = 0
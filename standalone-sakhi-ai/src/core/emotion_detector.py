@@ -2,89 +2,533 @@
 Emotion Detector for Sakhi AI - Text and voice emotion analysis
 """
 
+import os
 import re
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-
-# Text analysis
+import functools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Mapping, Tuple
+
+# Heavy optional dependencies (TextBlob, torch/transformers, ONNX Runtime, OpenCV,
+# face_recognition) are imported on first use, so rule-based callers never pay for
+# them. Their HAS_* flags stay None until the first attempt resolves them.
+HAS_TEXTBLOB = None
+HAS_TRANSFORMERS = None
+HAS_ONNX_RUNTIME = None
+HAS_FACE_RECOGNITION = None
+
+def _has_textblob() -> bool:
+    """Import TextBlob on first use; returns whether it is available"""
+    global HAS_TEXTBLOB, TextBlob
+    if HAS_TEXTBLOB is None:
+        try:
+            from textblob import TextBlob
+            HAS_TEXTBLOB = True
+        except ImportError:
+            HAS_TEXTBLOB = False
+            logging.warning("TextBlob not available. Install with: pip install textblob")
+    return HAS_TEXTBLOB
+
+def _has_transformers() -> bool:
+    """Import torch and transformers on first use; returns whether they are available"""
+    global HAS_TRANSFORMERS, torch, pipeline
+    if HAS_TRANSFORMERS is None:
+        try:
+            import torch
+            from transformers import pipeline
+            HAS_TRANSFORMERS = True
+        except ImportError:
+            HAS_TRANSFORMERS = False
+            logging.warning("Transformers not available. Install with: pip install transformers torch")
+    return HAS_TRANSFORMERS
+
+def _has_onnx_runtime() -> bool:
+    """Import ONNX Runtime and optimum on first use; returns whether they are available"""
+    global HAS_ONNX_RUNTIME, onnxruntime, ORTModelForSequenceClassification, ORTQuantizer
+    global AutoQuantizationConfig, AutoTokenizer
+    if HAS_ONNX_RUNTIME is None:
+        try:
+            import onnxruntime
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            from transformers import AutoTokenizer
+            HAS_ONNX_RUNTIME = True
+        except ImportError:
+            HAS_ONNX_RUNTIME = False
+            logging.warning("ONNX Runtime not available. Install with: pip install optimum[onnxruntime]")
+    return HAS_ONNX_RUNTIME
+
+def _has_face_recognition() -> bool:
+    """Import OpenCV and face_recognition on first use; returns whether they are available"""
+    global HAS_FACE_RECOGNITION, cv2, face_recognition
+    if HAS_FACE_RECOGNITION is None:
+        try:
+            import cv2
+            import face_recognition
+            HAS_FACE_RECOGNITION = True
+        except ImportError:
+            HAS_FACE_RECOGNITION = False
+            logging.warning("Face recognition not available. Install with: pip install opencv-python face-recognition")
+    return HAS_FACE_RECOGNITION
+
+# Lexicon sentiment (optional, much cheaper than TextBlob)
 try:
-    from textblob import TextBlob
-    HAS_TEXTBLOB = True
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    HAS_VADER = True
 except ImportError:
-    HAS_TEXTBLOB = False
-    logging.warning("TextBlob not available. Install with: pip install textblob")
+    HAS_VADER = False
+    logging.warning("VADER not available. Install with: pip install vaderSentiment")
 
-# Sentiment analysis
+# JIT-compiled keyword scoring (optional)
 try:
-    from transformers import pipeline
-    HAS_TRANSFORMERS = True
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
 except ImportError:
-    HAS_TRANSFORMERS = False
-    logging.warning("Transformers not available. Install with: pip install transformers torch")
+    HAS_NUMBA = False
+    logging.warning("Numba not available. Install with: pip install numba")
 
-# Face recognition (optional)
+# Persistent result cache (optional)
 try:
-    import cv2
-    import face_recognition
-    HAS_FACE_RECOGNITION = True
+    import diskcache
+    HAS_DISKCACHE = True
 except ImportError:
-    HAS_FACE_RECOGNITION = False
-    logging.warning("Face recognition not available. Install with: pip install opencv-python face-recognition")
+    HAS_DISKCACHE = False
+    logging.warning("diskcache not available. Install with: pip install diskcache")
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of distinct texts whose analysis is memoized per detector
+TEXT_CACHE_SIZE = 4096
+
+# Hugging Face models for text analysis
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+# Model revisions; changing one invalidates persisted results and ONNX exports
+SENTIMENT_MODEL_REVISION = "main"
+EMOTION_MODEL_REVISION = "main"
+
+# Identifies the model pair in persistent cache keys
+MODEL_TAG = f"{EMOTION_MODEL}@{EMOTION_MODEL_REVISION}+{SENTIMENT_MODEL}@{SENTIMENT_MODEL_REVISION}"
+
+# How long persisted transformer results stay valid
+DISK_CACHE_TTL_SECONDS = 86400
+
+# Emotion keywords for rule-based analysis
+EMOTION_KEYWORDS = {
+    'happy': frozenset({'happy', 'joy', 'excited', 'glad', 'delighted', 'pleased', 'cheerful'}),
+    'sad': frozenset({'sad', 'unhappy', 'depressed', 'down', 'blue', 'melancholy', 'grief'}),
+    'angry': frozenset({'angry', 'mad', 'furious', 'irritated', 'annoyed', 'frustrated', 'outraged'}),
+    'anxious': frozenset({'anxious', 'worried', 'nervous', 'stressed', 'afraid', 'scared', 'panic'}),
+    'caring': frozenset({'care', 'love', 'concern', 'support', 'help', 'comfort', 'empathy'}),
+    'confused': frozenset({'confused', 'uncertain', 'unsure', 'puzzled', 'unclear', 'lost'}),
+    'hopeful': frozenset({'hope', 'optimistic', 'positive', 'looking forward', 'expectant'})
+}
+
+# Emotion categories with display metadata (read-only)
+EMOTION_CATEGORIES = MappingProxyType({
+    'happy': MappingProxyType({
+        'description': 'Feeling or showing pleasure or contentment',
+        'color': '#FFD700',
+        'icon': '😊'
+    }),
+    'sad': MappingProxyType({
+        'description': 'Feeling or showing sorrow; unhappy',
+        'color': '#4169E1',
+        'icon': '😢'
+    }),
+    'angry': MappingProxyType({
+        'description': 'Feeling or showing strong annoyance, displeasure, or hostility',
+        'color': '#DC143C',
+        'icon': '😠'
+    }),
+    'anxious': MappingProxyType({
+        'description': 'Experiencing worry, unease, or nervousness',
+        'color': '#FF8C00',
+        'icon': '😰'
+    }),
+    'caring': MappingProxyType({
+        'description': 'Displaying kindness and concern for others',
+        'color': '#FF69B4',
+        'icon': '🤗'
+    }),
+    'neutral': MappingProxyType({
+        'description': 'Not having or showing strong emotion',
+        'color': '#808080',
+        'icon': '😐'
+    }),
+    'hopeful': MappingProxyType({
+        'description': 'Feeling or inspiring optimism about a future event',
+        'color': '#32CD32',
+        'icon': '🌟'
+    }),
+    'confused': MappingProxyType({
+        'description': 'Unable to think clearly; bewildered',
+        'color': '#9370DB',
+        'icon': '😕'
+    })
+})
+
+# Supported emotion names, in display order
+_EMOTION_KEYS: Tuple[str, ...] = tuple(EMOTION_CATEGORIES)
+
+# Emotion groups used for sentiment mapping
+POSITIVE_EMOTIONS = frozenset({'happy', 'hopeful', 'caring'})
+NEGATIVE_EMOTIONS = frozenset({'sad', 'angry', 'anxious', 'fearful'})
+
+# Rule-based emotions scored negative ('fearful' is never produced by the rules)
+_RULE_NEGATIVE_EMOTIONS = frozenset({'sad', 'angry', 'anxious'})
+
+# Sentiment label -> representative emotion
+_SENTIMENT_TO_EMOTION = MappingProxyType({
+    'positive': 'happy',
+    'negative': 'sad',
+    'neutral': 'neutral'
+})
+
+# All keywords compiled into one whole-word alternation, matched in a single pass
+# Rule-based emotions by integer id, in EMOTION_KEYWORDS order (ties resolve to the earlier one)
+_RULE_EMOTIONS = tuple(EMOTION_KEYWORDS)
+_KEYWORD_TO_EMOTION_ID = {
+    keyword: emotion_id
+    for emotion_id, emotion in enumerate(_RULE_EMOTIONS)
+    for keyword in EMOTION_KEYWORDS[emotion]
+}
+_EMOTION_KEYWORD_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _KEYWORD_TO_EMOTION_ID)) + r')\b',
+    re.IGNORECASE
+)
+
+def _score_emotion_ids(emotion_ids, n_emotions):
+    """Count keyword hits per emotion id; return (dominant id or -1, its hit count)"""
+    counts = [0] * n_emotions
+    for emotion_id in emotion_ids:
+        counts[emotion_id] += 1
+
+    dominant_id = -1
+    dominant_hits = 0
+    for emotion_id in range(n_emotions):
+        if counts[emotion_id] > dominant_hits:
+            dominant_id = emotion_id
+            dominant_hits = counts[emotion_id]
+    return dominant_id, dominant_hits
+
+# Same kernel compiled to native code; the pure-Python version above is the fallback
+if HAS_NUMBA:
+    _score_emotion_ids_jit = njit(cache=True)(_score_emotion_ids)
+
+# Shared VADER analyzer; it only holds its lexicons, so one serves every thread
+_VADER_ANALYZER = SentimentIntensityAnalyzer() if HAS_VADER else None
+
+# Texts shorter than this, or without letters, skip the models entirely
+MIN_MODEL_TEXT_LENGTH = 4
+
+# Confidence assigned to an emoji match
+EMOJI_CONFIDENCE = 0.6
+
+# Emoji -> emotion for the fast path (category icons plus common variants)
+_EMOJI_TO_EMOTION = {info['icon']: emotion for emotion, info in EMOTION_CATEGORIES.items()}
+_EMOJI_TO_EMOTION.update({
+    '🙂': 'happy', '😀': 'happy', '😄': 'happy', '😁': 'happy',
+    '😭': 'sad', '😞': 'sad', '💔': 'sad',
+    '😡': 'angry', '🤬': 'angry',
+    '😟': 'anxious', '😨': 'anxious', '😱': 'anxious',
+    '❤': 'caring', '💕': 'caring', '🙏': 'caring',
+    '🤔': 'confused'
+})
+
+def _is_trivial_text(text: str) -> bool:
+    """Whether text is too short or has no letters, so models add nothing"""
+    return len(text) < MIN_MODEL_TEXT_LENGTH or not any(c.isalpha() for c in text)
+
+# One worker per modality (text, voice, face)
+MULTIMODAL_WORKERS = 3
+
+# Results that carry no real signal and are left out of multimodal fusion
+_NON_VOTING_METHODS = frozenset({'placeholder', 'unavailable', 'error'})
+
+# Text analysis modes, fixed once the models have loaded
+MODE_SHARED = 'shared'                  # both models, one shared tokenization
+MODE_BOTH = 'both'                      # both models, tokenized separately
+MODE_EMOTION_ONLY = 'emotion_only'
+MODE_SENTIMENT_ONLY = 'sentiment_only'
+MODE_FALLBACK = 'fallback'              # no models; lexicon or rules
+_EMOTION_MODES = frozenset({MODE_SHARED, MODE_BOTH, MODE_EMOTION_ONLY})
+_SENTIMENT_MODES = frozenset({MODE_SHARED, MODE_BOTH, MODE_SENTIMENT_ONLY})
+
+# Placeholder for a model that has not been loaded yet
+_NOT_LOADED = object()
+
+# Shared pipeline settings: batched forward passes, token-level truncation
+PIPELINE_KWARGS = {
+    'batch_size': 32,
+    'truncation': True,
+    'max_length': 512
+}
+
+# Where exported int8 ONNX models are kept between runs
+ONNX_CACHE_DIR = Path.home() / '.cache' / 'sakhi' / 'onnx'
+ONNX_QUANTIZED_FILE = 'model_quantized.onnx'
+
+# Inputs per padded forward pass; small buckets of length-sorted texts keep padding low
+LENGTH_BUCKET_SIZE = 8
+
+# Throwaway input used to warm up freshly loaded pipelines
+WARMUP_TEXT = "warmup"
+
+# Serializes first loads, so concurrent callers never build the same model twice
+_PIPELINE_LOCK = threading.Lock()
+
+def _quantized_onnx_model(model: str, revision: str):
+    """
+    Load an int8 ONNX export of a sequence classifier, exporting it on first use
+
+    Args:
+        model: Hugging Face model name
+        revision: Model revision
+
+    Returns:
+        Tuple of (ONNX Runtime model, tokenizer)
+    """
+    model_dir = ONNX_CACHE_DIR / f"{model.replace('/', '--')}@{revision}"
+
+    if not (model_dir / ONNX_QUANTIZED_FILE).exists():
+        logger.info(f"Exporting {model} to int8 ONNX (one-time)...")
+        exported = ORTModelForSequenceClassification.from_pretrained(model, revision=revision, export=True)
+        quantizer = ORTQuantizer.from_pretrained(exported)
+        quantizer.quantize(
+            save_dir=model_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        )
+        AutoTokenizer.from_pretrained(model, revision=revision).save_pretrained(model_dir)
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = os.cpu_count() or 1
+
+    provider = 'CPUExecutionProvider'
+    if 'CUDAExecutionProvider' in onnxruntime.get_available_providers():
+        provider = 'CUDAExecutionProvider'
+
+    ort_model = ORTModelForSequenceClassification.from_pretrained(
+        model_dir,
+        file_name=ONNX_QUANTIZED_FILE,
+        session_options=session_options,
+        provider=provider
+    )
+    return ort_model, AutoTokenizer.from_pretrained(model_dir)
+
+@functools.cache
+def _configure_torch():
+    """Cap intra-op threads once so multi-worker servers do not oversubscribe cores"""
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+    if torch.cuda.is_available():
+        torch.backends.cuda.matmul.allow_tf32 = True
+
+@functools.cache
+def _get_pipeline(task: str, model: str, revision: str):
+    """Build a pipeline once per process; every detector instance shares it"""
+    use_cuda = torch.cuda.is_available()
+
+    # int8 ONNX targets CPUs; on a GPU the fp16 PyTorch model is faster
+    if not use_cuda and _has_onnx_runtime():
+        try:
+            ort_model, tokenizer = _quantized_onnx_model(model, revision)
+            # Same pipeline wrapper, so outputs keep the usual label/score shape
+            return _warm_up(pipeline(task, model=ort_model, tokenizer=tokenizer, **PIPELINE_KWARGS))
+        except Exception as e:
+            logger.warning(f"ONNX export failed for {model}, using PyTorch: {str(e)}")
+
+    _configure_torch()
+    loaded = pipeline(
+        task,
+        model=model,
+        revision=revision,
+        device=0 if use_cuda else -1,
+        torch_dtype=torch.float16 if use_cuda else torch.float32,
+        **PIPELINE_KWARGS
+    )
+    loaded.model.eval()
+    return _warm_up(loaded)
+
+def _warm_up(loaded):
+    """
+    Run throwaway inputs through a new pipeline so kernel selection and allocator
+    warmup happen at load time instead of on the first real request
+
+    Args:
+        loaded: Freshly built pipeline
+
+    Returns:
+        The same pipeline
+    """
+    try:
+        with torch.inference_mode():
+            loaded(WARMUP_TEXT)
+            loaded([WARMUP_TEXT] * LENGTH_BUCKET_SIZE, batch_size=LENGTH_BUCKET_SIZE)
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+        logger.debug("Pipeline warmup complete")
+    except Exception as e:
+        logger.debug(f"Pipeline warmup failed: {str(e)}")
+    return loaded
+
+def _with_oom_backoff(run, batch_size: int = LENGTH_BUCKET_SIZE):
+    """
+    Call run(batch_size), halving the batch size each time CUDA runs out of memory
+
+    Args:
+        run: Callable taking the batch size to use
+        batch_size: Initial batch size
+
+    Returns:
+        Whatever run returns
+    """
+    while True:
+        try:
+            return run(batch_size)
+        except torch.cuda.OutOfMemoryError:
+            if batch_size <= 1:
+                raise
+            torch.cuda.empty_cache()
+            batch_size //= 2
+            logger.warning(f"CUDA out of memory, retrying with batch size {batch_size}")
+
+# __slots__ on dataclasses needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class EmotionResult:
+    """Result of an emotion analysis; fields left as None were not produced by the method"""
+    emotion: str
+    confidence: float
+    sentiment: Optional[str] = None
+    sentiment_score: Optional[float] = None
+    method: str = ''
+    subjectivity: Optional[float] = None
+    error: Optional[str] = None
+    note: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary for JSON responses and storage
+
+        Returns:
+            Result fields, omitting those that are None
+        """
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
 class EmotionDetector:
     """Emotion detection for text, voice, and facial expressions"""
 
     def __init__(self, enable_face_detection: bool = True,
-                 enable_voice_analysis: bool = True):
+                 enable_voice_analysis: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         Initialize Emotion Detector
 
         Args:
             enable_face_detection: Enable facial emotion detection
             enable_voice_analysis: Enable voice emotion analysis
+            cache_dir: Directory for a persistent transformer result cache (disabled if None)
         """
-        self.enable_face_detection = enable_face_detection and HAS_FACE_RECOGNITION
+        # Face libraries are imported when facial analysis is first requested
+        self.enable_face_detection = enable_face_detection
         self.enable_voice_analysis = enable_voice_analysis
 
-        # Initialize models
-        self.sentiment_analyzer = None
-        self.emotion_classifier = None
+        # Models are loaded on first use (see the properties below)
+        self._sentiment_analyzer = _NOT_LOADED
+        self._emotion_classifier = _NOT_LOADED
+        self._tokenizers_match = None
+        self._mode = None
+
+        # Runs the text, voice, and facial analyses of one multimodal request side by side
+        self._executor = ThreadPoolExecutor(max_workers=MULTIMODAL_WORKERS, thread_name_prefix='emotion')
+
+        # Transformer results persisted across restarts, keyed by model tag and text digest
+        self._disk_cache = None
+        if cache_dir and HAS_DISKCACHE:
+            self._disk_cache = diskcache.Cache(cache_dir)
+            logger.info(f"✅ Emotion result cache at {cache_dir}")
+
+        # Number of texts answered by the model-free fast path
+        self._fast_path_hits = 0
 
         self._initialize_models()
 
+        # Memoize text analysis per instance so repeated messages skip inference
+        self._cached_analyze = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(self._analyze_text_uncached)
+
     def _initialize_models(self):
-        """Initialize emotion detection models"""
-        try:
-            # Initialize sentiment analyzer
-            if HAS_TRANSFORMERS:
-                logger.info("Initializing sentiment analysis models...")
-                try:
-                    self.sentiment_analyzer = pipeline(
-                        "sentiment-analysis",
-                        model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+        """Initialize emotion detection models (deferred until first use)"""
+        if HAS_TRANSFORMERS is not False:
+            logger.info("Emotion detection models will load on first use")
+
+    @property
+    def sentiment_analyzer(self):
+        """Sentiment analysis pipeline, loaded on first access (None if unavailable)"""
+        if self._sentiment_analyzer is _NOT_LOADED:
+            with _PIPELINE_LOCK:
+                if self._sentiment_analyzer is _NOT_LOADED:
+                    self._sentiment_analyzer = self._load_pipeline(
+                        "sentiment-analysis", SENTIMENT_MODEL, SENTIMENT_MODEL_REVISION, "Sentiment analyzer"
                     )
-                    logger.info("✅ Sentiment analyzer initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to load sentiment analyzer: {str(e)}")
-                    self.sentiment_analyzer = None
-
-                try:
-                    self.emotion_classifier = pipeline(
-                        "text-classification",
-                        model="j-hartmann/emotion-english-distilroberta-base"
+        return self._sentiment_analyzer
+
+    @property
+    def emotion_classifier(self):
+        """Emotion classification pipeline, loaded on first access (None if unavailable)"""
+        if self._emotion_classifier is _NOT_LOADED:
+            with _PIPELINE_LOCK:
+                if self._emotion_classifier is _NOT_LOADED:
+                    self._emotion_classifier = self._load_pipeline(
+                        "text-classification", EMOTION_MODEL, EMOTION_MODEL_REVISION, "Emotion classifier"
                     )
-                    logger.info("✅ Emotion classifier initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to load emotion classifier: {str(e)}")
-                    self.emotion_classifier = None
+        return self._emotion_classifier
+
+    @staticmethod
+    def clear_model_cache():
+        """Drop shared pipelines so later loads read the models again"""
+        with _PIPELINE_LOCK:
+            _get_pipeline.cache_clear()
 
+    def _load_pipeline(self, task: str, model: str, revision: str, name: str):
+        """
+        Load a Hugging Face pipeline
+
+        Args:
+            task: Pipeline task
+            model: Model name
+            revision: Model revision
+            name: Human-readable name for logging
+
+        Returns:
+            Pipeline, or None if it could not be loaded
+        """
+        if not _has_transformers():
+            return None
+
+        try:
+            logger.info(f"Loading {name.lower()}...")
+            loaded = _get_pipeline(task, model, revision)
+            logger.info(f"✅ {name} initialized")
+            return loaded
         except Exception as e:
-            logger.error(f"❌ Failed to initialize emotion detection models: {str(e)}")
+            logger.warning(f"Failed to load {name.lower()}: {str(e)}")
+            return None
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -94,11 +538,13 @@ class EmotionDetector:
             Health check result
         """
         capabilities = {
-            'text_sentiment': self.sentiment_analyzer is not None,
-            'text_emotion': self.emotion_classifier is not None,
-            'face_detection': self.enable_face_detection,
+            # Not-yet-loaded models and libraries count as available; probes never import them
+            'text_sentiment': HAS_TRANSFORMERS is not False and self._sentiment_analyzer is not None,
+            'text_emotion': HAS_TRANSFORMERS is not False and self._emotion_classifier is not None,
+            'face_detection': self.enable_face_detection and HAS_FACE_RECOGNITION is not False,
             'voice_analysis': self.enable_voice_analysis,
-            'textblob_available': HAS_TEXTBLOB
+            'vader_available': HAS_VADER,
+            'textblob_available': HAS_TEXTBLOB is not False
         }
 
         available_capabilities = [name for name, available in capabilities.items() if available]
@@ -106,109 +552,422 @@ class EmotionDetector:
         return {
             'status': 'healthy' if available_capabilities else 'degraded',
             'available_capabilities': available_capabilities,
-            'capabilities': capabilities
+            'capabilities': capabilities,
+            'fast_path_hits': self._fast_path_hits
         }
 
-    def analyze_text_emotion(self, text: str) -> Dict[str, Any]:
+    def analyze_text_emotion(self, text: str, use_cache: bool = True) -> EmotionResult:
         """
         Analyze emotion from text
 
         Args:
             text: Text to analyze
+            use_cache: Reuse memoized and persisted results
 
         Returns:
             Emotion analysis result
         """
         try:
             if not text or not text.strip():
-                return {
-                    'emotion': 'neutral',
-                    'confidence': 0.0,
-                    'sentiment': 'neutral',
-                    'sentiment_score': 0.0,
-                    'method': 'rule_based'
-                }
+                return EmotionResult(
+                    emotion='neutral',
+                    confidence=0.0,
+                    sentiment='neutral',
+                    sentiment_score=0.0,
+                    method='rule_based'
+                )
 
             logger.info(f"Analyzing text emotion: {text[:50]}...")
 
-            # Try transformer models first
-            if self.emotion_classifier or self.sentiment_analyzer:
-                return self._analyze_with_transformers(text)
+            if not use_cache:
+                return self._analyze_texts([text.strip()], use_cache=False)[0]
 
-            # Fall back to TextBlob
-            elif HAS_TEXTBLOB:
-                return self._analyze_with_textblob(text)
+            result = self._cached_analyze(text.strip())
+            logger.debug(f"Text emotion cache: {self._cached_analyze.cache_info()}")
 
-            # Fall back to rule-based analysis
-            else:
-                return self._analyze_with_rules(text)
+            # Results are frozen, so the cached entry can be shared safely
+            return result
 
         except Exception as e:
             logger.error(f"❌ Text emotion analysis failed: {str(e)}")
-            return {
-                'emotion': 'neutral',
-                'confidence': 0.0,
-                'error': str(e),
-                'method': 'error'
-            }
+            return EmotionResult(
+                emotion='neutral',
+                confidence=0.0,
+                error=str(e),
+                method='error'
+            )
+
+    def analyze_text_emotions(self, texts: List[str], use_cache: bool = True) -> List[EmotionResult]:
+        """
+        Analyze emotion for many texts, batching model inference
+
+        Args:
+            texts: Texts to analyze
+            use_cache: Reuse persisted results
 
-    def _analyze_with_transformers(self, text: str) -> Dict[str, Any]:
+        Returns:
+            Emotion analysis results in input order
         """
-        Analyze emotion using transformer models
+        try:
+            results = [None] * len(texts)
+            pending = []
+            for i, text in enumerate(texts):
+                if not text or not text.strip():
+                    results[i] = EmotionResult(
+                        emotion='neutral',
+                        confidence=0.0,
+                        sentiment='neutral',
+                        sentiment_score=0.0,
+                        method='rule_based'
+                    )
+                else:
+                    pending.append(i)
+
+            logger.info(f"Analyzing text emotion for {len(pending)} texts")
+
+            if pending:
+                analyzed = self._analyze_texts([texts[i].strip() for i in pending], use_cache)
+                for i, result in zip(pending, analyzed):
+                    results[i] = result
+
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ Batch text emotion analysis failed: {str(e)}")
+            return [
+                EmotionResult(
+                    emotion='neutral',
+                    confidence=0.0,
+                    error=str(e),
+                    method='error'
+                )
+                for _ in texts
+            ]
+
+    def _analyze_text_uncached(self, text: str) -> EmotionResult:
+        """
+        Analyze emotion from text without consulting the cache
 
         Args:
-            text: Text to analyze
+            text: Stripped, non-empty text to analyze
 
         Returns:
             Emotion analysis result
         """
-        result = {
-            'method': 'transformers'
-        }
+        return self._analyze_texts([text])[0]
+
+    def _analyze_texts(self, texts: List[str], use_cache: bool = True) -> List[EmotionResult]:
+        """
+        Analyze emotion for stripped, non-empty texts with the best available method
+
+        Args:
+            texts: Texts to analyze
+            use_cache: Reuse persisted results
+
+        Returns:
+            Emotion analysis results in input order
+        """
+        results = [None] * len(texts)
+        model_indices = []
+        for i, text in enumerate(texts):
+            if _is_trivial_text(text):
+                results[i] = self._fast_path(text)
+            else:
+                model_indices.append(i)
+
+        if model_indices:
+            analyzed = self._analyze_with_best_method([texts[i] for i in model_indices], use_cache)
+            for i, result in zip(model_indices, analyzed):
+                results[i] = result
+
+        return results
+
+    def _analyze_with_best_method(self, texts: List[str], use_cache: bool = True) -> List[EmotionResult]:
+        """
+        Analyze emotion for texts with the best available method
+
+        Args:
+            texts: Texts to analyze
+            use_cache: Reuse persisted results
+
+        Returns:
+            Emotion analysis results in input order
+        """
+        # Try transformer models first
+        if self._analysis_mode() != MODE_FALLBACK:
+            return self._analyze_with_transformers(texts, use_cache)
+
+        # Fall back to the VADER lexicon
+        elif HAS_VADER:
+            return [self._analyze_with_vader(text) for text in texts]
+
+        # Fall back to TextBlob
+        elif _has_textblob():
+            return [self._analyze_with_textblob(text) for text in texts]
+
+        # Fall back to rule-based analysis
+        else:
+            return [self._analyze_with_rules(text) for text in texts]
+
+    def _fast_path(self, text: str) -> EmotionResult:
+        """
+        Analyze very short or non-alphabetic text without any model
+
+        Args:
+            text: Stripped text to analyze
+
+        Returns:
+            Emotion analysis result
+        """
+        self._fast_path_hits += 1
+
+        for char in text:
+            emotion = _EMOJI_TO_EMOTION.get(char)
+            if emotion:
+                sentiment = self._emotion_to_sentiment(emotion)
+                return EmotionResult(
+                    emotion=emotion,
+                    confidence=EMOJI_CONFIDENCE,
+                    sentiment=sentiment,
+                    sentiment_score={'positive': EMOJI_CONFIDENCE, 'negative': -EMOJI_CONFIDENCE}.get(sentiment, 0.0),
+                    method='emoji'
+                )
+
+        return self._analyze_with_rules(text)
+
+    def clear_cache(self):
+        """Clear memoized text emotion results"""
+        self._cached_analyze.cache_clear()
+
+    def _analyze_with_transformers(self, texts: List[str], use_cache: bool = True) -> List[EmotionResult]:
+        """
+        Analyze emotion for a batch of texts using transformer models, consulting the persistent cache
+
+        Args:
+            texts: Texts to analyze
+            use_cache: Reuse persisted results
+
+        Returns:
+            Emotion analysis results in input order
+        """
+        if self._disk_cache is None or not use_cache:
+            return self._infer_with_transformers(texts)
+
+        keys = [f"{MODEL_TAG}:{hashlib.blake2b(text.encode('utf-8')).hexdigest()}" for text in texts]
+        results = [None] * len(texts)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._disk_cache.get(key)
+            if cached is not None:
+                results[i] = EmotionResult(**cached)
+            else:
+                misses.append(i)
+
+        if misses:
+            inferred = self._infer_with_transformers([texts[i] for i in misses])
+            for i, result in zip(misses, inferred):
+                results[i] = result
+                self._disk_cache.set(keys[i], result.to_dict(), expire=DISK_CACHE_TTL_SECONDS)
+
+        return results
+
+    def _infer_with_transformers(self, texts: List[str]) -> List[EmotionResult]:
+        """
+        Run the transformer models on a batch of texts
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Emotion analysis results in input order
+        """
+        # Fields are collected per text, then frozen into results at the end
+        results = [{'method': 'transformers'} for _ in texts]
+
+        # Sort by token length so each padded bucket holds similar-sized inputs
+        order = self._token_length_order(texts)
+        batch = [texts[i] for i in order]  # Truncated to 512 tokens by the tokenizer
+
+        mode = self._analysis_mode()
+        emotion_outputs = sentiment_outputs = None
+
+        # Both models share a tokenizer: encode once, run both on the same tensors
+        if mode == MODE_SHARED:
+            try:
+                emotion_outputs, sentiment_outputs = _with_oom_backoff(
+                    lambda batch_size: self._classify_shared(batch, batch_size)
+                )
+            except Exception as e:
+                logger.warning(f"Shared-encoding classification failed: {str(e)}")
 
         # Emotion classification
-        if self.emotion_classifier:
+        if emotion_outputs is None and mode in _EMOTION_MODES:
             try:
-                emotion_result = self.emotion_classifier(text[:512])  # Limit text length
-                if emotion_result:
-                    top_emotion = emotion_result[0]
-                    result.update({
-                        'emotion': top_emotion['label'].lower(),
-                        'confidence': top_emotion['score']
-                    })
+                with torch.inference_mode():
+                    emotion_outputs = _with_oom_backoff(
+                        lambda batch_size: self.emotion_classifier(batch, batch_size=batch_size)
+                    )
             except Exception as e:
                 logger.warning(f"Emotion classification failed: {str(e)}")
 
         # Sentiment analysis
-        if self.sentiment_analyzer:
+        if sentiment_outputs is None and mode in _SENTIMENT_MODES:
             try:
-                sentiment_result = self.sentiment_analyzer(text[:512])
-                if sentiment_result:
-                    top_sentiment = sentiment_result[0]
-                    sentiment_label = top_sentiment['label'].lower()
-
-                    # Map sentiment to emotion
-                    if sentiment_label in ['positive', 'pos']:
-                        result['sentiment'] = 'positive'
-                        result['sentiment_score'] = top_sentiment['score']
-                    elif sentiment_label in ['negative', 'neg']:
-                        result['sentiment'] = 'negative'
-                        result['sentiment_score'] = -top_sentiment['score']
-                    else:
-                        result['sentiment'] = 'neutral'
-                        result['sentiment_score'] = 0.0
-
+                with torch.inference_mode():
+                    sentiment_outputs = _with_oom_backoff(
+                        lambda batch_size: self.sentiment_analyzer(batch, batch_size=batch_size)
+                    )
             except Exception as e:
                 logger.warning(f"Sentiment analysis failed: {str(e)}")
 
+        if emotion_outputs is not None:
+            for i, top_emotion in zip(order, emotion_outputs):
+                results[i].update({
+                    'emotion': top_emotion['label'].lower(),
+                    'confidence': top_emotion['score']
+                })
+
+        if sentiment_outputs is not None:
+            for i, top_sentiment in zip(order, sentiment_outputs):
+                result = results[i]
+                sentiment_label = top_sentiment['label'].lower()
+
+                # Map sentiment to emotion
+                if sentiment_label in ['positive', 'pos']:
+                    result['sentiment'] = 'positive'
+                    result['sentiment_score'] = top_sentiment['score']
+                elif sentiment_label in ['negative', 'neg']:
+                    result['sentiment'] = 'negative'
+                    result['sentiment_score'] = -top_sentiment['score']
+                else:
+                    result['sentiment'] = 'neutral'
+                    result['sentiment_score'] = 0.0
+
         # Ensure emotion is set
-        if 'emotion' not in result:
-            result['emotion'] = self._sentiment_to_emotion(result.get('sentiment', 'neutral'))
-            result['confidence'] = 0.5
+        for result in results:
+            if 'emotion' not in result:
+                result['emotion'] = self._sentiment_to_emotion(result.get('sentiment', 'neutral'))
+                result['confidence'] = 0.5
 
-        return result
+        return [EmotionResult(**collected) for collected in results]
 
-    def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
+    def _token_length_order(self, texts: List[str]) -> List[int]:
+        """
+        Order text indices by token count, shortest first
+
+        Args:
+            texts: Texts to order
+
+        Returns:
+            Indices of texts sorted by token length
+        """
+        if len(texts) < 2:
+            return list(range(len(texts)))
+
+        classifier = self.emotion_classifier or self.sentiment_analyzer
+        try:
+            input_ids = classifier.tokenizer(texts, add_special_tokens=False)['input_ids']
+            lengths = [len(ids) for ids in input_ids]
+        except Exception as e:
+            logger.debug(f"Token length sort fell back to characters: {str(e)}")
+            lengths = [len(text) for text in texts]
+
+        return sorted(range(len(texts)), key=lengths.__getitem__)
+
+    def _analysis_mode(self) -> str:
+        """Which text models are usable, decided once after they have loaded"""
+        if self._mode is None:
+            has_emotion = bool(self.emotion_classifier)
+            has_sentiment = bool(self.sentiment_analyzer)
+            if has_emotion and has_sentiment:
+                self._mode = MODE_SHARED if self._tokenizers_compatible() else MODE_BOTH
+            elif has_emotion:
+                self._mode = MODE_EMOTION_ONLY
+            elif has_sentiment:
+                self._mode = MODE_SENTIMENT_ONLY
+            else:
+                self._mode = MODE_FALLBACK
+            logger.info(f"Text emotion analysis mode: {self._mode}")
+        return self._mode
+
+    def _tokenizers_compatible(self) -> bool:
+        """Whether both classifiers tokenize identically (both are RoBERTa-family models)"""
+        if self._tokenizers_match is None:
+            emotion_tokenizer = self.emotion_classifier.tokenizer
+            sentiment_tokenizer = self.sentiment_analyzer.tokenizer
+            self._tokenizers_match = (
+                type(emotion_tokenizer) is type(sentiment_tokenizer)
+                and emotion_tokenizer.get_vocab() == sentiment_tokenizer.get_vocab()
+            )
+        return self._tokenizers_match
+
+    def _classify_shared(self, batch: List[str], batch_size: int = LENGTH_BUCKET_SIZE):
+        """
+        Classify texts with both models from a single tokenization pass
+
+        Args:
+            batch: Texts to classify
+            batch_size: Texts per forward pass
+
+        Returns:
+            Tuple of (emotion outputs, sentiment outputs), each a list of label/score dicts
+        """
+        tokenizer = self.emotion_classifier.tokenizer
+        emotion_outputs, sentiment_outputs = [], []
+
+        with torch.inference_mode():
+            for start in range(0, len(batch), batch_size):
+                encoding = tokenizer(
+                    batch[start:start + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=PIPELINE_KWARGS['max_length'],
+                    return_tensors='pt'
+                )
+                for classifier, outputs in ((self.emotion_classifier, emotion_outputs),
+                                            (self.sentiment_analyzer, sentiment_outputs)):
+                    model = classifier.model
+                    logits = model(**encoding.to(classifier.device)).logits
+                    scores, label_ids = logits.softmax(dim=-1).max(dim=-1)
+                    outputs.extend(
+                        {'label': model.config.id2label[label_id], 'score': score}
+                        for label_id, score in zip(label_ids.tolist(), scores.tolist())
+                    )
+
+        return emotion_outputs, sentiment_outputs
+
+    def _analyze_with_vader(self, text: str) -> EmotionResult:
+        """
+        Analyze emotion with VADER's compound score, which handles negation and intensifiers
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Emotion analysis result
+        """
+        polarity = _VADER_ANALYZER.polarity_scores(text)['compound']
+
+        # Map polarity to sentiment
+        if polarity > 0.1:
+            sentiment = 'positive'
+            sentiment_score = polarity
+        elif polarity < -0.1:
+            sentiment = 'negative'
+            sentiment_score = polarity
+        else:
+            sentiment = 'neutral'
+            sentiment_score = 0.0
+
+        return EmotionResult(
+            emotion=self._sentiment_to_emotion(sentiment),
+            confidence=min(abs(polarity) + 0.5, 1.0),
+            sentiment=sentiment,
+            sentiment_score=sentiment_score,
+            method='vader'
+        )
+
+    def _analyze_with_textblob(self, text: str) -> EmotionResult:
         """
         Analyze emotion using TextBlob
 
@@ -237,20 +996,20 @@ class EmotionDetector:
             # Map to emotion
             emotion = self._sentiment_to_emotion(sentiment)
 
-            return {
-                'emotion': emotion,
-                'confidence': min(abs(polarity) + 0.5, 1.0),
-                'sentiment': sentiment,
-                'sentiment_score': sentiment_score,
-                'subjectivity': subjectivity,
-                'method': 'textblob'
-            }
+            return EmotionResult(
+                emotion=emotion,
+                confidence=min(abs(polarity) + 0.5, 1.0),
+                sentiment=sentiment,
+                sentiment_score=sentiment_score,
+                subjectivity=subjectivity,
+                method='textblob'
+            )
 
         except Exception as e:
             logger.error(f"TextBlob analysis failed: {str(e)}")
             return self._analyze_with_rules(text)
 
-    def _analyze_with_rules(self, text: str) -> Dict[str, Any]:
+    def _analyze_with_rules(self, text: str) -> EmotionResult:
         """
         Analyze emotion using rule-based approach
 
@@ -260,41 +1019,29 @@ class EmotionDetector:
         Returns:
             Emotion analysis result
         """
-        text_lower = text.lower()
-
-        # Emotion keywords
-        emotion_keywords = {
-            'happy': ['happy', 'joy', 'excited', 'glad', 'delighted', 'pleased', 'cheerful'],
-            'sad': ['sad', 'unhappy', 'depressed', 'down', 'blue', 'melancholy', 'grief'],
-            'angry': ['angry', 'mad', 'furious', 'irritated', 'annoyed', 'frustrated', 'outraged'],
-            'anxious': ['anxious', 'worried', 'nervous', 'stressed', 'afraid', 'scared', 'panic'],
-            'caring': ['care', 'love', 'concern', 'support', 'help', 'comfort', 'empathy'],
-            'confused': ['confused', 'uncertain', 'unsure', 'puzzled', 'unclear', 'lost'],
-            'hopeful': ['hope', 'optimistic', 'positive', 'looking forward', 'expectant']
-        }
-
-        # Count emotion keywords
-        emotion_scores = {}
-        for emotion, keywords in emotion_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                emotion_scores[emotion] = score
+        # Map every keyword hit to its emotion id in a single scan
+        emotion_ids = [_KEYWORD_TO_EMOTION_ID[match.lower()] for match in _EMOTION_KEYWORD_RE.findall(text)]
 
         # Determine dominant emotion
-        if emotion_scores:
-            dominant_emotion = max(emotion_scores, key=emotion_scores.get)
-            confidence = min(emotion_scores[dominant_emotion] / 10.0, 1.0)
+        if HAS_NUMBA:
+            dominant_id, hits = _score_emotion_ids_jit(np.array(emotion_ids, dtype=np.int8), len(_RULE_EMOTIONS))
+        else:
+            dominant_id, hits = _score_emotion_ids(emotion_ids, len(_RULE_EMOTIONS))
+
+        if dominant_id >= 0:
+            dominant_emotion = _RULE_EMOTIONS[dominant_id]
+            confidence = min(hits / 10.0, 1.0)
         else:
             dominant_emotion = 'neutral'
             confidence = 0.3
 
-        return {
-            'emotion': dominant_emotion,
-            'confidence': confidence,
-            'sentiment': self._emotion_to_sentiment(dominant_emotion),
-            'sentiment_score': confidence if dominant_emotion in ['happy', 'hopeful', 'caring'] else (-confidence if dominant_emotion in ['sad', 'angry', 'anxious'] else 0.0),
-            'method': 'rule_based'
-        }
+        return EmotionResult(
+            emotion=dominant_emotion,
+            confidence=confidence,
+            sentiment=self._emotion_to_sentiment(dominant_emotion),
+            sentiment_score=confidence if dominant_emotion in POSITIVE_EMOTIONS else (-confidence if dominant_emotion in _RULE_NEGATIVE_EMOTIONS else 0.0),
+            method='rule_based'
+        )
 
     def _sentiment_to_emotion(self, sentiment: str) -> str:
         """
@@ -306,12 +1053,7 @@ class EmotionDetector:
         Returns:
             Emotion label
         """
-        mapping = {
-            'positive': 'happy',
-            'negative': 'sad',
-            'neutral': 'neutral'
-        }
-        return mapping.get(sentiment, 'neutral')
+        return _SENTIMENT_TO_EMOTION.get(sentiment, 'neutral')
 
     def _emotion_to_sentiment(self, emotion: str) -> str:
         """
@@ -323,17 +1065,14 @@ class EmotionDetector:
         Returns:
             Sentiment label
         """
-        positive_emotions = ['happy', 'hopeful', 'caring']
-        negative_emotions = ['sad', 'angry', 'anxious', 'fearful']
-
-        if emotion in positive_emotions:
+        if emotion in POSITIVE_EMOTIONS:
             return 'positive'
-        elif emotion in negative_emotions:
+        elif emotion in NEGATIVE_EMOTIONS:
             return 'negative'
         else:
             return 'neutral'
 
-    def analyze_voice_emotion(self, audio_data: bytes) -> Dict[str, Any]:
+    def analyze_voice_emotion(self, audio_data: bytes) -> EmotionResult:
         """
         Analyze emotion from voice audio
 
@@ -345,12 +1084,12 @@ class EmotionDetector:
         """
         try:
             if not self.enable_voice_analysis:
-                return {
-                    'emotion': 'neutral',
-                    'confidence': 0.0,
-                    'error': 'Voice analysis not enabled',
-                    'method': 'unavailable'
-                }
+                return EmotionResult(
+                    emotion='neutral',
+                    confidence=0.0,
+                    error='Voice analysis not enabled',
+                    method='unavailable'
+                )
 
             # This is a placeholder for voice emotion analysis
             # In a real implementation, you would use libraries like:
@@ -360,23 +1099,23 @@ class EmotionDetector:
 
             logger.info("Voice emotion analysis (placeholder implementation)")
 
-            return {
-                'emotion': 'neutral',
-                'confidence': 0.5,
-                'method': 'placeholder',
-                'note': 'Voice emotion analysis not implemented yet'
-            }
+            return EmotionResult(
+                emotion='neutral',
+                confidence=0.5,
+                method='placeholder',
+                note='Voice emotion analysis not implemented yet'
+            )
 
         except Exception as e:
             logger.error(f"❌ Voice emotion analysis failed: {str(e)}")
-            return {
-                'emotion': 'neutral',
-                'confidence': 0.0,
-                'error': str(e),
-                'method': 'error'
-            }
-
-    def analyze_facial_emotion(self, image_data: bytes) -> Dict[str, Any]:
+            return EmotionResult(
+                emotion='neutral',
+                confidence=0.0,
+                error=str(e),
+                method='error'
+            )
+
+    def analyze_facial_emotion(self, image_data: bytes) -> EmotionResult:
         """
         Analyze emotion from facial expression
 
@@ -387,13 +1126,13 @@ class EmotionDetector:
             Facial emotion analysis result
         """
         try:
-            if not self.enable_face_detection:
-                return {
-                    'emotion': 'neutral',
-                    'confidence': 0.0,
-                    'error': 'Face detection not enabled',
-                    'method': 'unavailable'
-                }
+            if not (self.enable_face_detection and _has_face_recognition()):
+                return EmotionResult(
+                    emotion='neutral',
+                    confidence=0.0,
+                    error='Face detection not enabled',
+                    method='unavailable'
+                )
 
             # This is a placeholder for facial emotion analysis
             # In a real implementation, you would use:
@@ -403,71 +1142,74 @@ class EmotionDetector:
 
             logger.info("Facial emotion analysis (placeholder implementation)")
 
-            return {
-                'emotion': 'neutral',
-                'confidence': 0.5,
-                'method': 'placeholder',
-                'note': 'Facial emotion analysis not implemented yet'
-            }
+            return EmotionResult(
+                emotion='neutral',
+                confidence=0.5,
+                method='placeholder',
+                note='Facial emotion analysis not implemented yet'
+            )
 
         except Exception as e:
             logger.error(f"❌ Facial emotion analysis failed: {str(e)}")
-            return {
-                'emotion': 'neutral',
-                'confidence': 0.0,
-                'error': str(e),
-                'method': 'error'
-            }
+            return EmotionResult(
+                emotion='neutral',
+                confidence=0.0,
+                error=str(e),
+                method='error'
+            )
+
+    def analyze_multimodal(self, text: Optional[str] = None,
+                           audio_data: Optional[bytes] = None,
+                           image_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Analyze text, voice, and facial emotion concurrently and fuse the results
 
-    def get_emotion_categories(self) -> Dict[str, Dict[str, Any]]:
+        Args:
+            text: Text to analyze
+            audio_data: Audio data bytes
+            image_data: Image data bytes
+
+        Returns:
+            Dictionary of per-modality result dicts ('text', 'voice', 'facial')
+            plus the confidence-weighted 'fused_emotion' and 'fused_confidence'
+        """
+        futures = {}
+        if text is not None:
+            futures['text'] = self._executor.submit(self.analyze_text_emotion, text)
+        if audio_data is not None:
+            futures['voice'] = self._executor.submit(self.analyze_voice_emotion, audio_data)
+        if image_data is not None:
+            futures['facial'] = self._executor.submit(self.analyze_facial_emotion, image_data)
+
+        results = {name: future.result() for name, future in futures.items()}
+
+        # Late fusion: each modality votes for its emotion, weighted by its confidence
+        votes = Counter()
+        for result in results.values():
+            if result.method in _NON_VOTING_METHODS:
+                continue
+            votes[result.emotion] += result.confidence
+
+        total = sum(votes.values())
+        if total > 0:
+            fused_emotion, weight = votes.most_common(1)[0]
+            fused_confidence = weight / total
+        else:
+            fused_emotion, fused_confidence = 'neutral', 0.0
+
+        analysis = {name: result.to_dict() for name, result in results.items()}
+        analysis['fused_emotion'] = fused_emotion
+        analysis['fused_confidence'] = fused_confidence
+        return analysis
+
+    def get_emotion_categories(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Get available emotion categories and descriptions
 
         Returns:
-            Emotion categories dictionary
+            Read-only emotion categories mapping
         """
-        return {
-            'happy': {
-                'description': 'Feeling or showing pleasure or contentment',
-                'color': '#FFD700',
-                'icon': '😊'
-            },
-            'sad': {
-                'description': 'Feeling or showing sorrow; unhappy',
-                'color': '#4169E1',
-                'icon': '😢'
-            },
-            'angry': {
-                'description': 'Feeling or showing strong annoyance, displeasure, or hostility',
-                'color': '#DC143C',
-                'icon': '😠'
-            },
-            'anxious': {
-                'description': 'Experiencing worry, unease, or nervousness',
-                'color': '#FF8C00',
-                'icon': '😰'
-            },
-            'caring': {
-                'description': 'Displaying kindness and concern for others',
-                'color': '#FF69B4',
-                'icon': '🤗'
-            },
-            'neutral': {
-                'description': 'Not having or showing strong emotion',
-                'color': '#808080',
-                'icon': '😐'
-            },
-            'hopeful': {
-                'description': 'Feeling or inspiring optimism about a future event',
-                'color': '#32CD32',
-                'icon': '🌟'
-            },
-            'confused': {
-                'description': 'Unable to think clearly; bewildered',
-                'color': '#9370DB',
-                'icon': '😕'
-            }
-        }
+        return EMOTION_CATEGORIES
 
     def get_detection_capabilities(self) -> Dict[str, Any]:
         """
@@ -479,22 +1221,23 @@ class EmotionDetector:
         return {
             'text_analysis': {
                 'available': True,
-                'methods': ['transformers', 'textblob', 'rule_based'],
-                'supported_emotions': list(self.get_emotion_categories().keys()),
-                'max_text_length': 512 if HAS_TRANSFORMERS else None
+                'methods': ['transformers', 'vader', 'textblob', 'rule_based'],
+                'supported_emotions': list(_EMOTION_KEYS),
+                'max_text_length': 512 if HAS_TRANSFORMERS is not False else None
             },
             'voice_analysis': {
                 'available': self.enable_voice_analysis,
                 'status': 'placeholder' if self.enable_voice_analysis else 'disabled'
             },
             'facial_analysis': {
-                'available': self.enable_face_detection,
-                'status': 'placeholder' if self.enable_face_detection else 'disabled'
+                'available': self.enable_face_detection and HAS_FACE_RECOGNITION is not False,
+                'status': 'placeholder' if self.enable_face_detection and HAS_FACE_RECOGNITION is not False else 'disabled'
             },
             'libraries': {
                 'transformers': HAS_TRANSFORMERS,
+                'vader': HAS_VADER,
                 'textblob': HAS_TEXTBLOB,
                 'face_recognition': HAS_FACE_RECOGNITION,
-                'opencv': 'cv2' in globals()
+                'opencv': HAS_FACE_RECOGNITION
             }
         }
\ No newline at end of file
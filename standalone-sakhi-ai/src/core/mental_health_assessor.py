@@ -2,296 +2,741 @@
 Mental Health Assessor for Sakhi AI - Mental health screening and assessment
 """
 
+import os
+import sys
+import time
 import logging
-import uuid
+import functools
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 # Statistical analysis
 try:
     import numpy as np
-    from sklearn.preprocessing import MinMaxScaler
     HAS_SCIENTIFIC_STACK = True
 except ImportError:
     HAS_SCIENTIFIC_STACK = False
-    logging.warning("Scientific libraries not available. Install with: pip install numpy scikit-learn")
+    logging.warning("Scientific libraries not available. Install with: pip install numpy")
+
+if HAS_SCIENTIFIC_STACK:
+    from ._mh_kernels import score_batch
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_GET_VALUE = itemgetter('value')
+
+# Questionnaire template behind each single-tool assessment type
+ASSESSMENT_TEMPLATE_KEYS = {
+    'depression': 'depression_phq9',
+    'anxiety': 'anxiety_gad7',
+    'stress': 'stress_pss4'
+}
+
+# Widest answer scale across the questionnaires (PSS-4 has five options)
+MAX_OPTIONS = 5
+
+# Question id prefix -> tool code (depression, anxiety, stress order)
+TOOL_CODES = {'phq9_': 0, 'gad7_': 1, 'pss4_': 2}
+TOOL_PREFIX_LENGTH = 5
+NO_TOOL = 255
+
+# Recommendation texts, interned once so deduplication hashes and compares by identity
+_REC = {
+    'seek_immediate_help': sys.intern("Seek immediate professional help from a mental health provider"),
+    'crisis_helpline': sys.intern("Consider contacting a crisis helpline if you have thoughts of self-harm"),
+    'discuss_treatment': sys.intern("Discuss treatment options with a healthcare provider"),
+    'schedule_appointment': sys.intern("Schedule an appointment with a mental health professional"),
+    'start_therapy': sys.intern("Consider starting therapy or counseling"),
+    'discuss_medication': sys.intern("Discuss medication options with your doctor"),
+    'talk_to_counselor': sys.intern("Consider talking to a counselor or therapist"),
+    'regular_physical_activity': sys.intern("Practice regular physical activity"),
+    'consistent_sleep': sys.intern("Maintain a consistent sleep schedule"),
+    'reach_out': sys.intern("Reach out to friends and family for support"),
+    'self_care_activities': sys.intern("Practice self-care activities"),
+    'regular_exercise': sys.intern("Engage in regular exercise"),
+    'adequate_sleep': sys.intern("Ensure adequate sleep"),
+    'mindfulness_or_meditation': sys.intern("Consider mindfulness or meditation"),
+    'keep_healthy_habits': sys.intern("Continue maintaining healthy habits"),
+    'supportive_relationships': sys.intern("Stay connected with supportive relationships"),
+    'stress_management': sys.intern("Practice stress management techniques"),
+    'seek_professional_help': sys.intern("Seek professional help from a mental health provider"),
+    'cbt': sys.intern("Consider cognitive behavioral therapy (CBT)"),
+    'structured_relaxation': sys.intern("Practice structured relaxation techniques"),
+    'counselor_for_anxiety': sys.intern("Consider talking to a counselor about anxiety management"),
+    'deep_breathing': sys.intern("Practice regular deep breathing exercises"),
+    'muscle_relaxation': sys.intern("Try progressive muscle relaxation"),
+    'limit_caffeine': sys.intern("Limit caffeine and alcohol intake"),
+    'mindfulness_meditation': sys.intern("Practice mindfulness meditation"),
+    'engage_physical_activity': sys.intern("Engage in regular physical activity"),
+    'journaling': sys.intern("Try journaling to process anxious thoughts"),
+    'keep_stress_management': sys.intern("Continue healthy stress management practices"),
+    'maintain_work_life_balance': sys.intern("Maintain work-life balance"),
+    'regular_self_care': sys.intern("Practice regular self-care"),
+    'seek_help_for_stress': sys.intern("Seek professional help for stress management"),
+    'coping_therapy': sys.intern("Consider therapy to develop coping strategies"),
+    'daily_stress_reduction': sys.intern("Practice daily stress reduction techniques"),
+    'reduce_stressors': sys.intern("Evaluate and reduce major stressors if possible"),
+    'regular_relaxation': sys.intern("Practice regular relaxation techniques"),
+    'sleep_and_rest': sys.intern("Ensure adequate sleep and rest"),
+    'time_management': sys.intern("Consider time management strategies"),
+    'keep_coping_strategies': sys.intern("Maintain current healthy coping strategies"),
+    'keep_exercise_and_sleep': sys.intern("Continue regular exercise and good sleep habits"),
+    'practice_work_life_balance': sys.intern("Practice work-life balance"),
+    'seek_support': sys.intern("Consider seeking professional mental health support"),
+    'self_care_and_stress_management': sys.intern("Practice regular self-care and stress management"),
+    'healthy_lifestyle': sys.intern("Maintain a healthy lifestyle with exercise and good nutrition"),
+    'friends_and_family': sys.intern("Stay connected with supportive friends and family")
+}
+
+# Depression recommendations by risk level
+_DEP_RECS = {
+    'severe': (
+        _REC['seek_immediate_help'],
+        _REC['crisis_helpline'],
+        _REC['discuss_treatment']
+    ),
+    'moderately_severe': (
+        _REC['schedule_appointment'],
+        _REC['start_therapy'],
+        _REC['discuss_medication']
+    ),
+    'moderate': (
+        _REC['talk_to_counselor'],
+        _REC['regular_physical_activity'],
+        _REC['consistent_sleep'],
+        _REC['reach_out']
+    ),
+    'mild': (
+        _REC['self_care_activities'],
+        _REC['regular_exercise'],
+        _REC['adequate_sleep'],
+        _REC['mindfulness_or_meditation']
+    ),
+    'minimal': (
+        _REC['keep_healthy_habits'],
+        _REC['supportive_relationships'],
+        _REC['stress_management']
+    )
+}
+
+# Anxiety recommendations by risk level
+_ANX_RECS = {
+    'severe': (
+        _REC['seek_professional_help'],
+        _REC['cbt'],
+        _REC['discuss_medication'],
+        _REC['structured_relaxation']
+    ),
+    'moderate': (
+        _REC['counselor_for_anxiety'],
+        _REC['deep_breathing'],
+        _REC['muscle_relaxation'],
+        _REC['limit_caffeine']
+    ),
+    'mild': (
+        _REC['mindfulness_meditation'],
+        _REC['engage_physical_activity'],
+        _REC['consistent_sleep'],
+        _REC['journaling']
+    ),
+    'minimal': (
+        _REC['keep_stress_management'],
+        _REC['maintain_work_life_balance'],
+        _REC['regular_self_care']
+    )
+}
+
+# Stress recommendations by risk level
+_STR_RECS = {
+    'high': (
+        _REC['seek_help_for_stress'],
+        _REC['coping_therapy'],
+        _REC['daily_stress_reduction'],
+        _REC['reduce_stressors']
+    ),
+    'moderate': (
+        _REC['regular_relaxation'],
+        _REC['sleep_and_rest'],
+        _REC['engage_physical_activity'],
+        _REC['time_management']
+    ),
+    'low': (
+        _REC['keep_coping_strategies'],
+        _REC['keep_exercise_and_sleep'],
+        _REC['practice_work_life_balance']
+    )
+}
+
+# Upper bounds of the overall 0-100 score bands (a score equal to a bound falls in the next band)
+OVERALL_CATEGORY_THRESHOLDS = (25, 40, 60, 80)
+OVERALL_CATEGORY_LABELS = ('excellent', 'good', 'mild_concerns', 'moderate_concerns', 'significant_concerns')
+
+def _as_thresholds(bounds):
+    """Store bucket bounds as a contiguous int8 array when NumPy is available"""
+    return np.array(bounds, dtype=np.int8) if HAS_SCIENTIFIC_STACK else tuple(bounds)
+
+def _sum_values(responses: List[Dict[str, Any]]) -> int:
+    """
+    Sum the 'value' field of assessment responses
+
+    Args:
+        responses: Assessment responses
+
+    Returns:
+        Total score
+    """
+    try:
+        # Validated responses always carry 'value'; itemgetter does the lookup in C
+        if HAS_SCIENTIFIC_STACK:
+            values = np.fromiter(map(_GET_VALUE, responses), dtype=np.int32, count=len(responses))
+            return int(np.add.reduce(values, dtype=np.int32))
+        return sum(map(_GET_VALUE, responses))
+    except KeyError:
+        return sum(r.get('value', 0) for r in responses)
+
+def _pack_responses(responses: List[Dict[str, Any]]):
+    """
+    Pack responses into parallel arrays in a single pass
+
+    Args:
+        responses: Assessment responses
+
+    Returns:
+        Tuple of (int32 values, uint8 tool codes); responses to no known tool get NO_TOOL
+    """
+    values = []
+    tool_codes = []
+    for response in responses:
+        values.append(response.get('value', 0))
+        tool_codes.append(TOOL_CODES.get(response.get('question_id', '')[:TOOL_PREFIX_LENGTH], NO_TOOL))
+    return np.array(values, dtype=np.int32), np.array(tool_codes, dtype=np.uint8)
+
+def _tool_totals(responses: List[Dict[str, Any]]) -> List[Optional[int]]:
+    """
+    Total the responses of each questionnaire
+
+    Args:
+        responses: Mixed PHQ-9 / GAD-7 / PSS-4 responses
+
+    Returns:
+        Total per tool code, or None for a questionnaire with no responses
+    """
+    if HAS_SCIENTIFIC_STACK:
+        values, tool_codes = _pack_responses(responses)
+        totals = []
+        for code in range(len(TOOL_CODES)):
+            mask = tool_codes == code
+            totals.append(int(values[mask].sum(dtype=np.int32)) if mask.any() else None)
+        return totals
+
+    totals = [None] * len(TOOL_CODES)
+    for response in responses:
+        code = TOOL_CODES.get(response.get('question_id', '')[:TOOL_PREFIX_LENGTH])
+        if code is not None:
+            totals[code] = (totals[code] or 0) + response.get('value', 0)
+    return totals
+
+def _bucket_index(thresholds, score, side: str = 'left') -> int:
+    """
+    Find which bucket a score falls into by binary search over ascending bounds
+
+    Args:
+        thresholds: Ascending bucket bounds
+        score: Score to place
+        side: 'left' if a score equal to a bound belongs to that bound's bucket, 'right' otherwise
+
+    Returns:
+        Bucket index (len(thresholds) when the score is above every bound)
+    """
+    if HAS_SCIENTIFIC_STACK:
+        return int(np.searchsorted(thresholds, score, side=side))
+    return (bisect_left if side == 'left' else bisect_right)(thresholds, score)
+
+def _build_templates() -> Dict[str, Dict[str, Any]]:
+    """Build assessment question templates"""
+    return {
+        'depression_phq9': {
+            'name': 'PHQ-9 Depression Screening',
+            'description': 'Patient Health Questionnaire-9 for depression screening',
+            'questions': [
+                {
+                    'id': 'phq9_1',
+                    'text': 'Little interest or pleasure in doing things',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_2',
+                    'text': 'Feeling down, depressed, or hopeless',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_3',
+                    'text': 'Trouble falling or staying asleep, or sleeping too much',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_4',
+                    'text': 'Feeling tired or having little energy',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_5',
+                    'text': 'Poor appetite or overeating',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_6',
+                    'text': 'Feeling bad about yourself—or that you are a failure or have let yourself or your family down',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_7',
+                    'text': 'Trouble concentrating on things, such as reading the newspaper or watching television',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_8',
+                    'text': 'Moving or speaking so slowly that other people could have noticed. Or the opposite—being so fidgety or restless that you have been moving around a lot more than usual',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'phq9_9',
+                    'text': 'Thoughts that you would be better off dead, or of hurting yourself in some way',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                }
+            ],
+            'scoring': {
+                'min_score': 0,
+                'max_score': 27,
+                'categories': {
+                    'minimal': (0, 4),
+                    'mild': (5, 9),
+                    'moderate': (10, 14),
+                    'moderately_severe': (15, 19),
+                    'severe': (20, 27)
+                }
+            }
+        },
+        'anxiety_gad7': {
+            'name': 'GAD-7 Anxiety Screening',
+            'description': 'Generalized Anxiety Disorder-7 for anxiety screening',
+            'questions': [
+                {
+                    'id': 'gad7_1',
+                    'text': 'Feeling nervous, anxious, or on edge',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_2',
+                    'text': 'Not being able to stop or control worrying',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_3',
+                    'text': 'Worrying too much about different things',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_4',
+                    'text': 'Trouble relaxing',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_5',
+                    'text': 'Being so restless that it is hard to sit still',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_6',
+                    'text': 'Becoming easily annoyed or irritable',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                },
+                {
+                    'id': 'gad7_7',
+                    'text': 'Feeling afraid, as if something awful might happen',
+                    'options': [
+                        {'value': 0, 'text': 'Not at all'},
+                        {'value': 1, 'text': 'Several days'},
+                        {'value': 2, 'text': 'More than half the days'},
+                        {'value': 3, 'text': 'Nearly every day'}
+                    ]
+                }
+            ],
+            'scoring': {
+                'min_score': 0,
+                'max_score': 21,
+                'categories': {
+                    'minimal': (0, 4),
+                    'mild': (5, 9),
+                    'moderate': (10, 14),
+                    'severe': (15, 21)
+                }
+            }
+        },
+        'stress_pss4': {
+            'name': 'PSS-4 Perceived Stress Scale',
+            'description': '4-item Perceived Stress Scale for stress assessment',
+            'questions': [
+                {
+                    'id': 'pss4_1',
+                    'text': 'In the last month, how often have you felt that you were unable to control the important things in your life?',
+                    'options': [
+                        {'value': 0, 'text': 'Never'},
+                        {'value': 1, 'text': 'Almost never'},
+                        {'value': 2, 'text': 'Sometimes'},
+                        {'value': 3, 'text': 'Fairly often'},
+                        {'value': 4, 'text': 'Very often'}
+                    ]
+                },
+                {
+                    'id': 'pss4_2',
+                    'text': 'In the last month, how often have you felt confident about your ability to handle your personal problems?',
+                    'options': [
+                        {'value': 4, 'text': 'Never'},
+                        {'value': 3, 'text': 'Almost never'},
+                        {'value': 2, 'text': 'Sometimes'},
+                        {'value': 1, 'text': 'Fairly often'},
+                        {'value': 0, 'text': 'Very often'}
+                    ]
+                },
+                {
+                    'id': 'pss4_3',
+                    'text': 'In the last month, how often have you felt that things were going your way?',
+                    'options': [
+                        {'value': 4, 'text': 'Never'},
+                        {'value': 3, 'text': 'Almost never'},
+                        {'value': 2, 'text': 'Sometimes'},
+                        {'value': 1, 'text': 'Fairly often'},
+                        {'value': 0, 'text': 'Very often'}
+                    ]
+                },
+                {
+                    'id': 'pss4_4',
+                    'text': 'In the last month, how often have you felt difficulties were piling up so high that you could not overcome them?',
+                    'options': [
+                        {'value': 0, 'text': 'Never'},
+                        {'value': 1, 'text': 'Almost never'},
+                        {'value': 2, 'text': 'Sometimes'},
+                        {'value': 3, 'text': 'Fairly often'},
+                        {'value': 4, 'text': 'Very often'}
+                    ]
+                }
+            ],
+            'scoring': {
+                'min_score': 0,
+                'max_score': 16,
+                'categories': {
+                    'low_stress': (0, 6),
+                    'moderate_stress': (7, 10),
+                    'high_stress': (11, 16)
+                }
+            }
+        }
+    }
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _read_only(table):
+    """Mark a NumPy lookup table read-only, since every assessor shares it"""
+    if HAS_SCIENTIFIC_STACK:
+        table.flags.writeable = False
+    return table
+
+def _build_category_tables(templates: Dict[str, Dict[str, Any]]) -> Dict[str, tuple]:
+    """
+    Precompute per-tool category lookups from the template scoring bands
+
+    Kept apart from the templates themselves, which hold only questionnaire content.
+
+    Args:
+        templates: Assessment templates
+
+    Returns:
+        Mapping of template key to (inclusive upper bounds, category labels)
+    """
+    tables = {}
+    for key, template in templates.items():
+        bands = sorted(template['scoring']['categories'].items(), key=lambda item: item[1][0])
+        tables[key] = (
+            _as_thresholds([max_score for _, (_, max_score) in bands]),
+            tuple(label for label, _ in bands)
+        )
+    return tables
+
+def _build_score_luts(templates: Dict[str, Dict[str, Any]]):
+    """
+    Precompute option-index -> score tables, with reverse-scored items already applied
+
+    Args:
+        templates: Assessment templates
+
+    Returns:
+        Tuple of (template key -> (n_questions, MAX_OPTIONS) score table,
+        template key -> question id -> table row,
+        template key -> number of options per table row)
+    """
+    luts = {}
+    question_rows = {}
+    option_counts = {}
+    for key, template in templates.items():
+        rows = [
+            [option['value'] for option in question['options']] + [0] * (MAX_OPTIONS - len(question['options']))
+            for question in template['questions']
+        ]
+        luts[key] = np.array(rows, dtype=np.int8) if HAS_SCIENTIFIC_STACK else rows
+        question_rows[key] = {question['id']: row for row, question in enumerate(template['questions'])}
+        option_counts[key] = tuple(len(question['options']) for question in template['questions'])
+    return luts, question_rows, option_counts
+
+# Templates and derived lookup tables are built once at import and shared by all instances
+_TEMPLATES = _freeze(_build_templates())
+# Weights of each questionnaire in the comprehensive score
+_SCORING_WEIGHTS = MappingProxyType({
+    'depression_weight': 0.4,
+    'anxiety_weight': 0.3,
+    'stress_weight': 0.3
+})
+_CATEGORY_TABLES = {
+    key: (_read_only(thresholds), labels)
+    for key, (thresholds, labels) in _build_category_tables(_TEMPLATES).items()
+}
+# Score tables are zero-padded to MAX_OPTIONS columns; _OPTION_COUNTS bounds valid indexes
+_SCORE_LUTS, _QUESTION_ROWS, _OPTION_COUNTS = _build_score_luts(_TEMPLATES)
+_SCORE_LUTS = {key: _read_only(lut) for key, lut in _SCORE_LUTS.items()}
+_OVERALL_THRESHOLDS = _read_only(_as_thresholds(OVERALL_CATEGORY_THRESHOLDS))
+_AVAILABLE_ASSESSMENTS = tuple(
+    {
+        'type': key,
+        'name': template['name'],
+        'description': template['description']
+    }
+    for key, template in _TEMPLATES.items()
+)
+
+# Risk levels: a score equal to a bound belongs to the higher level
+_RISK_LEVELS = {
+    'depression': (_read_only(_as_thresholds((5, 10, 15, 20))),
+                   ('minimal', 'mild', 'moderate', 'moderately_severe', 'severe')),
+    'anxiety': (_read_only(_as_thresholds((5, 10, 15))),
+                ('minimal', 'mild', 'moderate', 'severe')),
+    'stress': (_read_only(_as_thresholds((7, 13))),
+               ('low', 'moderate', 'high'))
+}
+
+@functools.lru_cache(maxsize=64)
+def _risk_level(assessment_type: str, score: int) -> str:
+    """Risk level for one score; scores are small integers, so the cache saturates quickly"""
+    thresholds, labels = _RISK_LEVELS[assessment_type]
+    return labels[_bucket_index(thresholds, score, side='right')]
+
+@functools.lru_cache(maxsize=128)
+def _overall_category(overall_score: int) -> str:
+    """Overall category for a whole-number 0-100 score"""
+    return OVERALL_CATEGORY_LABELS[_bucket_index(_OVERALL_THRESHOLDS, overall_score, side='right')]
+
+def _risk_level_batch(assessment_type: str, scores):
+    """
+    Map many scores onto risk levels in one vectorized lookup
+
+    Args:
+        assessment_type: Type of assessment ('depression', 'anxiety', 'stress')
+        scores: Scores to classify
+
+    Returns:
+        Array of risk level labels (a list without NumPy)
+    """
+    thresholds, labels = _RISK_LEVELS[assessment_type]
+    if HAS_SCIENTIFIC_STACK:
+        return np.asarray(labels)[np.searchsorted(thresholds, scores, side='right')]
+    return [labels[bisect_right(thresholds, score)] for score in scores]
+
+def _fast_uuid4() -> str:
+    """Random RFC 4122 version-4 UUID string, formatted without building a uuid.UUID"""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+class _TimestampCache:
+    """Local ISO-8601 timestamps that re-format the date and time only when the second changes"""
+
+    def __init__(self):
+        self._cached = (None, '')
+
+    def now(self) -> str:
+        """Current local time, e.g. 2024-01-01T12:00:00.123456"""
+        t = time.time()
+        second = int(t)
+        cached_second, cached_iso = self._cached
+        if second != cached_second:
+            cached_iso = datetime.fromtimestamp(second).isoformat()
+            self._cached = (second, cached_iso)
+        return f"{cached_iso}.{int((t - second) * 1_000_000):06d}"
+
+_timestamps = _TimestampCache()
+
+@functools.cache
+def _warm_up_batch_kernel():
+    """Compile the batch kernel once per process rather than on the first real batch"""
+    thresholds, _ = _CATEGORY_TABLES['depression_phq9']
+    score_batch(np.zeros((1, 1), dtype=np.int8), thresholds)
+
 class MentalHealthAssessor:
     """Mental health assessment and screening tool"""
 
     def __init__(self):
         """Initialize Mental Health Assessor"""
-        self.assessment_templates = self._load_assessment_templates()
-        self.scoring_weights = self._load_scoring_weights()
+        self.assessment_templates = _TEMPLATES
+        self.scoring_weights = _SCORING_WEIGHTS
+        self._category_tables = _CATEGORY_TABLES
+        self._score_luts = _SCORE_LUTS
+        self._question_rows = _QUESTION_ROWS
+        self._option_counts = _OPTION_COUNTS
+        self._available_assessments = _AVAILABLE_ASSESSMENTS
+
+        if HAS_SCIENTIFIC_STACK:
+            _warm_up_batch_kernel()
+
+    def _score_responses(self, template_key: str, responses: List[Dict[str, Any]]) -> int:
+        """
+        Total one questionnaire's responses
 
-    def _load_assessment_templates(self) -> Dict[str, Dict[str, Any]]:
-        """Load assessment question templates"""
-        return {
-            'depression_phq9': {
-                'name': 'PHQ-9 Depression Screening',
-                'description': 'Patient Health Questionnaire-9 for depression screening',
-                'questions': [
-                    {
-                        'id': 'phq9_1',
-                        'text': 'Little interest or pleasure in doing things',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_2',
-                        'text': 'Feeling down, depressed, or hopeless',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_3',
-                        'text': 'Trouble falling or staying asleep, or sleeping too much',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_4',
-                        'text': 'Feeling tired or having little energy',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_5',
-                        'text': 'Poor appetite or overeating',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_6',
-                        'text': 'Feeling bad about yourself—or that you are a failure or have let yourself or your family down',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_7',
-                        'text': 'Trouble concentrating on things, such as reading the newspaper or watching television',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_8',
-                        'text': 'Moving or speaking so slowly that other people could have noticed. Or the opposite—being so fidgety or restless that you have been moving around a lot more than usual',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'phq9_9',
-                        'text': 'Thoughts that you would be better off dead, or of hurting yourself in some way',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    }
-                ],
-                'scoring': {
-                    'min_score': 0,
-                    'max_score': 27,
-                    'categories': {
-                        'minimal': (0, 4),
-                        'mild': (5, 9),
-                        'moderate': (10, 14),
-                        'moderately_severe': (15, 19),
-                        'severe': (20, 27)
-                    }
-                }
-            },
-            'anxiety_gad7': {
-                'name': 'GAD-7 Anxiety Screening',
-                'description': 'Generalized Anxiety Disorder-7 for anxiety screening',
-                'questions': [
-                    {
-                        'id': 'gad7_1',
-                        'text': 'Feeling nervous, anxious, or on edge',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_2',
-                        'text': 'Not being able to stop or control worrying',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_3',
-                        'text': 'Worrying too much about different things',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_4',
-                        'text': 'Trouble relaxing',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_5',
-                        'text': 'Being so restless that it is hard to sit still',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_6',
-                        'text': 'Becoming easily annoyed or irritable',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    },
-                    {
-                        'id': 'gad7_7',
-                        'text': 'Feeling afraid, as if something awful might happen',
-                        'options': [
-                            {'value': 0, 'text': 'Not at all'},
-                            {'value': 1, 'text': 'Several days'},
-                            {'value': 2, 'text': 'More than half the days'},
-                            {'value': 3, 'text': 'Nearly every day'}
-                        ]
-                    }
-                ],
-                'scoring': {
-                    'min_score': 0,
-                    'max_score': 21,
-                    'categories': {
-                        'minimal': (0, 4),
-                        'mild': (5, 9),
-                        'moderate': (10, 14),
-                        'severe': (15, 21)
-                    }
-                }
-            },
-            'stress_pss4': {
-                'name': 'PSS-4 Perceived Stress Scale',
-                'description': '4-item Perceived Stress Scale for stress assessment',
-                'questions': [
-                    {
-                        'id': 'pss4_1',
-                        'text': 'In the last month, how often have you felt that you were unable to control the important things in your life?',
-                        'options': [
-                            {'value': 0, 'text': 'Never'},
-                            {'value': 1, 'text': 'Almost never'},
-                            {'value': 2, 'text': 'Sometimes'},
-                            {'value': 3, 'text': 'Fairly often'},
-                            {'value': 4, 'text': 'Very often'}
-                        ]
-                    },
-                    {
-                        'id': 'pss4_2',
-                        'text': 'In the last month, how often have you felt confident about your ability to handle your personal problems?',
-                        'options': [
-                            {'value': 4, 'text': 'Never'},
-                            {'value': 3, 'text': 'Almost never'},
-                            {'value': 2, 'text': 'Sometimes'},
-                            {'value': 1, 'text': 'Fairly often'},
-                            {'value': 0, 'text': 'Very often'}
-                        ]
-                    },
-                    {
-                        'id': 'pss4_3',
-                        'text': 'In the last month, how often have you felt that things were going your way?',
-                        'options': [
-                            {'value': 4, 'text': 'Never'},
-                            {'value': 3, 'text': 'Almost never'},
-                            {'value': 2, 'text': 'Sometimes'},
-                            {'value': 1, 'text': 'Fairly often'},
-                            {'value': 0, 'text': 'Very often'}
-                        ]
-                    },
-                    {
-                        'id': 'pss4_4',
-                        'text': 'In the last month, how often have you felt difficulties were piling up so high that you could not overcome them?',
-                        'options': [
-                            {'value': 0, 'text': 'Never'},
-                            {'value': 1, 'text': 'Almost never'},
-                            {'value': 2, 'text': 'Sometimes'},
-                            {'value': 3, 'text': 'Fairly often'},
-                            {'value': 4, 'text': 'Very often'}
-                        ]
-                    }
-                ],
-                'scoring': {
-                    'min_score': 0,
-                    'max_score': 16,
-                    'categories': {
-                        'low_stress': (0, 6),
-                        'moderate_stress': (7, 10),
-                        'high_stress': (11, 16)
-                    }
-                }
-            }
-        }
+        Responses that all carry 'option_index' are scored from the template's
+        option table, so reverse-scored items (PSS-4 items 2 and 3) are handled
+        here; otherwise each response's 'value' is summed as before.
 
-    def _load_scoring_weights(self) -> Dict[str, float]:
-        """Load scoring weights for different assessments"""
-        return {
-            'depression_weight': 0.4,
-            'anxiety_weight': 0.3,
-            'stress_weight': 0.3
-        }
+        Args:
+            template_key: Assessment template key
+            responses: Responses to that questionnaire
+
+        Returns:
+            Total score
+
+        Raises:
+            ValueError: If an option_index is not one of its question's options
+        """
+        if not responses or not all('option_index' in r for r in responses):
+            return _sum_values(responses)
+
+        lut = self._score_luts[template_key]
+        rows = self._question_rows[template_key]
+        option_counts = self._option_counts[template_key]
+        question_idx = [rows[r['question_id']] for r in responses]
+        option_idx = [r['option_index'] for r in responses]
+
+        # Padding columns and negative indexes would silently score as another option
+        for q, o in zip(question_idx, option_idx):
+            if not 0 <= o < option_counts[q]:
+                raise ValueError(
+                    f"option_index {o} out of range for {template_key} question {q + 1} "
+                    f"({option_counts[q]} options)"
+                )
+
+        if HAS_SCIENTIFIC_STACK:
+            return int(lut[question_idx, option_idx].sum(dtype=np.int32))
+        return sum(lut[q][o] for q, o in zip(question_idx, option_idx))
+
+    def _categorize(self, template_key: str, total_score: int) -> str:
+        """
+        Map a total score onto its template's category
+
+        Args:
+            template_key: Assessment template key
+            total_score: Summed response values
+
+        Returns:
+            Category label (the first category when the score is out of range, as before)
+        """
+        thresholds, labels = self._category_tables[template_key]
+        index = _bucket_index(thresholds, total_score)
+        return labels[index] if index < len(labels) else labels[0]
 
     def assess(self, responses: List[Dict[str, Any]], assessment_type: str = 'comprehensive') -> Dict[str, Any]:
         """
@@ -326,6 +771,42 @@ class MentalHealthAssessor:
                 'assessment_type': assessment_type
             }
 
+    def assess_batch(self, responses_2d, assessment_type: str) -> List[Dict[str, Any]]:
+        """
+        Score one questionnaire for many users at once
+
+        Args:
+            responses_2d: (n_users, n_questions) response values, one row per user
+            assessment_type: Type of assessment ('depression', 'anxiety', 'stress')
+
+        Returns:
+            Per-user total score, category, and risk level, in row order
+        """
+        template_key = ASSESSMENT_TEMPLATE_KEYS.get(assessment_type)
+        if template_key is None:
+            raise ValueError(f"Unknown assessment type: {assessment_type}")
+
+        thresholds, labels = self._category_tables[template_key]
+
+        if HAS_SCIENTIFIC_STACK:
+            scores, category_indices = score_batch(np.asarray(responses_2d, dtype=np.int8), thresholds)
+            risk_levels = _risk_level_batch(assessment_type, scores).tolist()
+            scores = scores.tolist()
+            categories = [labels[i] if i < len(labels) else labels[0] for i in category_indices.tolist()]
+        else:
+            scores = [sum(row) for row in responses_2d]
+            categories = [self._categorize(template_key, score) for score in scores]
+            risk_levels = _risk_level_batch(assessment_type, scores)
+
+        return [
+            {
+                'total_score': score,
+                'category': category,
+                'risk_level': risk_level
+            }
+            for score, category, risk_level in zip(scores, categories, risk_levels)
+        ]
+
     def _comprehensive_assessment(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Perform comprehensive mental health assessment
@@ -336,44 +817,28 @@ class MentalHealthAssessor:
         Returns:
             Comprehensive assessment results
         """
-        # Group responses by assessment type
-        depression_responses = [r for r in responses if r.get('question_id', '').startswith('phq9_')]
-        anxiety_responses = [r for r in responses if r.get('question_id', '').startswith('gad7_')]
-        stress_responses = [r for r in responses if r.get('question_id', '').startswith('pss4_')]
+        # Total each questionnaire in one pass over the responses
+        depression_total, anxiety_total, stress_total = _tool_totals(responses)
 
         # Calculate individual scores
-        depression_result = self._depression_assessment(depression_responses) if depression_responses else None
-        anxiety_result = self._anxiety_assessment(anxiety_responses) if anxiety_responses else None
-        stress_result = self._stress_assessment(stress_responses) if stress_responses else None
-
-        # Calculate overall score
-        scores = []
-        weights = []
-
-        if depression_result:
-            scores.append(depression_result.get('overall_score', 0))
-            weights.append(self.scoring_weights['depression_weight'])
-
-        if anxiety_result:
-            scores.append(anxiety_result.get('overall_score', 0))
-            weights.append(self.scoring_weights['anxiety_weight'])
-
-        if stress_result:
-            scores.append(stress_result.get('overall_score', 0))
-            weights.append(self.scoring_weights['stress_weight'])
-
-        if scores:
-            # Normalize scores to 0-100 scale
-            normalized_scores = []
-            for score, result in zip(scores, [depression_result, anxiety_result, stress_result]):
-                if result:
-                    max_score = result.get('max_possible_score', 27)
-                    normalized_score = (score / max_score) * 100
-                    normalized_scores.append(normalized_score)
-
-            overall_score = np.average(normalized_scores, weights=weights[:len(normalized_scores)]) if HAS_SCIENTIFIC_STACK else sum(normalized_scores) / len(normalized_scores)
-        else:
-            overall_score = 0
+        depression_result = self._depression_result(depression_total) if depression_total is not None else None
+        anxiety_result = self._anxiety_result(anxiety_total) if anxiety_total is not None else None
+        stress_result = self._stress_result(stress_total) if stress_total is not None else None
+
+        # Calculate overall score as a weighted mean of the 0-100 normalized
+        # tool scores, accumulated in place (at most three terms)
+        weighted_sum = 0.0
+        total_weight = 0.0
+        for result, weight_key in ((depression_result, 'depression_weight'),
+                                   (anxiety_result, 'anxiety_weight'),
+                                   (stress_result, 'stress_weight')):
+            if result:
+                weight = self.scoring_weights[weight_key]
+                max_score = result.get('max_possible_score', 27)
+                weighted_sum += (result.get('overall_score', 0) / max_score) * 100 * weight
+                total_weight += weight
+
+        overall_score = weighted_sum / total_weight if total_weight else 0
 
         # Determine overall category
         overall_category = self._determine_overall_category(overall_score)
@@ -394,8 +859,8 @@ class MentalHealthAssessor:
                 'stress': stress_result
             },
             'recommendations': recommendations,
-            'timestamp': datetime.now().isoformat(),
-            'assessment_id': str(uuid.uuid4())
+            'timestamp': _timestamps.now(),
+            'assessment_id': _fast_uuid4()
         }
 
     def _depression_assessment(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -408,21 +873,23 @@ class MentalHealthAssessor:
         Returns:
             Depression assessment results
         """
-        template = self.assessment_templates['depression_phq9']
-        total_score = 0
+        return self._depression_result(self._score_responses('depression_phq9', responses))
+
+    def _depression_result(self, total_score: int) -> Dict[str, Any]:
+        """
+        Build PHQ-9 results from a total score
 
-        for response in responses:
-            question_id = response.get('question_id', '')
-            value = response.get('value', 0)
-            total_score += value
+        Args:
+            total_score: Summed PHQ-9 response values
+
+        Returns:
+            Depression assessment results
+        """
+        template = self.assessment_templates['depression_phq9']
 
         # Determine category
         scoring = template['scoring']
-        category = 'minimal'
-        for cat, (min_score, max_score) in scoring['categories'].items():
-            if min_score <= total_score <= max_score:
-                category = cat
-                break
+        category = self._categorize('depression_phq9', total_score)
 
         # Generate recommendations
         recommendations = self._generate_depression_recommendations(total_score, category)
@@ -449,21 +916,23 @@ class MentalHealthAssessor:
         Returns:
             Anxiety assessment results
         """
-        template = self.assessment_templates['anxiety_gad7']
-        total_score = 0
+        return self._anxiety_result(self._score_responses('anxiety_gad7', responses))
 
-        for response in responses:
-            question_id = response.get('question_id', '')
-            value = response.get('value', 0)
-            total_score += value
+    def _anxiety_result(self, total_score: int) -> Dict[str, Any]:
+        """
+        Build GAD-7 results from a total score
+
+        Args:
+            total_score: Summed GAD-7 response values
+
+        Returns:
+            Anxiety assessment results
+        """
+        template = self.assessment_templates['anxiety_gad7']
 
         # Determine category
         scoring = template['scoring']
-        category = 'minimal'
-        for cat, (min_score, max_score) in scoring['categories'].items():
-            if min_score <= total_score <= max_score:
-                category = cat
-                break
+        category = self._categorize('anxiety_gad7', total_score)
 
         # Generate recommendations
         recommendations = self._generate_anxiety_recommendations(total_score, category)
@@ -490,21 +959,23 @@ class MentalHealthAssessor:
         Returns:
             Stress assessment results
         """
-        template = self.assessment_templates['stress_pss4']
-        total_score = 0
+        return self._stress_result(self._score_responses('stress_pss4', responses))
+
+    def _stress_result(self, total_score: int) -> Dict[str, Any]:
+        """
+        Build PSS-4 results from a total score
 
-        for response in responses:
-            question_id = response.get('question_id', '')
-            value = response.get('value', 0)
-            total_score += value
+        Args:
+            total_score: Summed PSS-4 response values
+
+        Returns:
+            Stress assessment results
+        """
+        template = self.assessment_templates['stress_pss4']
 
         # Determine category
         scoring = template['scoring']
-        category = 'low_stress'
-        for cat, (min_score, max_score) in scoring['categories'].items():
-            if min_score <= total_score <= max_score:
-                category = cat
-                break
+        category = self._categorize('stress_pss4', total_score)
 
         # Generate recommendations
         recommendations = self._generate_stress_recommendations(total_score, category)
@@ -531,116 +1002,20 @@ class MentalHealthAssessor:
         Returns:
             Overall category
         """
-        if overall_score < 25:
-            return 'excellent'
-        elif overall_score < 40:
-            return 'good'
-        elif overall_score < 60:
-            return 'mild_concerns'
-        elif overall_score < 80:
-            return 'moderate_concerns'
-        else:
-            return 'significant_concerns'
+        # Bounds are whole numbers, so flooring the score never changes its band
+        return _overall_category(int(overall_score))
 
     def _generate_depression_recommendations(self, score: int, category: str) -> List[str]:
         """Generate depression-specific recommendations"""
-        recommendations = []
-
-        if score >= 20:
-            recommendations.extend([
-                "Seek immediate professional help from a mental health provider",
-                "Consider contacting a crisis helpline if you have thoughts of self-harm",
-                "Discuss treatment options with a healthcare provider"
-            ])
-        elif score >= 15:
-            recommendations.extend([
-                "Schedule an appointment with a mental health professional",
-                "Consider starting therapy or counseling",
-                "Discuss medication options with your doctor"
-            ])
-        elif score >= 10:
-            recommendations.extend([
-                "Consider talking to a counselor or therapist",
-                "Practice regular physical activity",
-                "Maintain a consistent sleep schedule",
-                "Reach out to friends and family for support"
-            ])
-        elif score >= 5:
-            recommendations.extend([
-                "Practice self-care activities",
-                "Engage in regular exercise",
-                "Ensure adequate sleep",
-                "Consider mindfulness or meditation"
-            ])
-        else:
-            recommendations.extend([
-                "Continue maintaining healthy habits",
-                "Stay connected with supportive relationships",
-                "Practice stress management techniques"
-            ])
-
-        return recommendations
+        return list(_DEP_RECS[_risk_level('depression', score)])
 
     def _generate_anxiety_recommendations(self, score: int, category: str) -> List[str]:
         """Generate anxiety-specific recommendations"""
-        recommendations = []
-
-        if score >= 15:
-            recommendations.extend([
-                "Seek professional help from a mental health provider",
-                "Consider cognitive behavioral therapy (CBT)",
-                "Discuss medication options with your doctor",
-                "Practice structured relaxation techniques"
-            ])
-        elif score >= 10:
-            recommendations.extend([
-                "Consider talking to a counselor about anxiety management",
-                "Practice regular deep breathing exercises",
-                "Try progressive muscle relaxation",
-                "Limit caffeine and alcohol intake"
-            ])
-        elif score >= 5:
-            recommendations.extend([
-                "Practice mindfulness meditation",
-                "Engage in regular physical activity",
-                "Maintain a consistent sleep schedule",
-                "Try journaling to process anxious thoughts"
-            ])
-        else:
-            recommendations.extend([
-                "Continue healthy stress management practices",
-                "Maintain work-life balance",
-                "Practice regular self-care"
-            ])
-
-        return recommendations
+        return list(_ANX_RECS[_risk_level('anxiety', score)])
 
     def _generate_stress_recommendations(self, score: int, category: str) -> List[str]:
         """Generate stress-specific recommendations"""
-        recommendations = []
-
-        if score >= 13:
-            recommendations.extend([
-                "Seek professional help for stress management",
-                "Consider therapy to develop coping strategies",
-                "Practice daily stress reduction techniques",
-                "Evaluate and reduce major stressors if possible"
-            ])
-        elif score >= 7:
-            recommendations.extend([
-                "Practice regular relaxation techniques",
-                "Ensure adequate sleep and rest",
-                "Engage in regular physical activity",
-                "Consider time management strategies"
-            ])
-        else:
-            recommendations.extend([
-                "Maintain current healthy coping strategies",
-                "Continue regular exercise and good sleep habits",
-                "Practice work-life balance"
-            ])
-
-        return recommendations
+        return list(_STR_RECS[_risk_level('stress', score)])
 
     def _generate_comprehensive_recommendations(self, depression_result: Dict,
                                              anxiety_result: Dict,
@@ -652,10 +1027,10 @@ class MentalHealthAssessor:
         # Add overall recommendations based on category
         if overall_category in ['moderate_concerns', 'significant_concerns']:
             recommendations.extend([
-                "Consider seeking professional mental health support",
-                "Practice regular self-care and stress management",
-                "Maintain a healthy lifestyle with exercise and good nutrition",
-                "Stay connected with supportive friends and family"
+                _REC['seek_support'],
+                _REC['self_care_and_stress_management'],
+                _REC['healthy_lifestyle'],
+                _REC['friends_and_family']
             ])
 
         # Add specific recommendations based on individual assessments
@@ -667,47 +1042,31 @@ class MentalHealthAssessor:
             recommendations.extend(stress_result.get('recommendations', []))
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec not in seen:
-                seen.add(rec)
-                unique_recommendations.append(rec)
-
-        return unique_recommendations
+        return list(dict.fromkeys(recommendations))
 
     def _depression_risk_level(self, score: int) -> str:
         """Determine depression risk level"""
-        if score >= 20:
-            return 'severe'
-        elif score >= 15:
-            return 'moderately_severe'
-        elif score >= 10:
-            return 'moderate'
-        elif score >= 5:
-            return 'mild'
-        else:
-            return 'minimal'
+        return _risk_level('depression', score)
+
+    def _depression_risk_level_batch(self, scores):
+        """Determine depression risk levels for an array of scores at once"""
+        return _risk_level_batch('depression', scores)
 
     def _anxiety_risk_level(self, score: int) -> str:
         """Determine anxiety risk level"""
-        if score >= 15:
-            return 'severe'
-        elif score >= 10:
-            return 'moderate'
-        elif score >= 5:
-            return 'mild'
-        else:
-            return 'minimal'
+        return _risk_level('anxiety', score)
+
+    def _anxiety_risk_level_batch(self, scores):
+        """Determine anxiety risk levels for an array of scores at once"""
+        return _risk_level_batch('anxiety', scores)
 
     def _stress_risk_level(self, score: int) -> str:
         """Determine stress risk level"""
-        if score >= 13:
-            return 'high'
-        elif score >= 7:
-            return 'moderate'
-        else:
-            return 'low'
+        return _risk_level('stress', score)
+
+    def _stress_risk_level_batch(self, scores):
+        """Determine stress risk levels for an array of scores at once"""
+        return _risk_level_batch('stress', scores)
 
     def get_assessment_template(self, assessment_type: str) -> Dict[str, Any]:
         """
@@ -728,11 +1087,4 @@ class MentalHealthAssessor:
         Returns:
             List of available assessments
         """
-        return [
-            {
-                'type': key,
-                'name': template['name'],
-                'description': template['description']
-            }
-            for key, template in self.assessment_templates.items()
-        ]
\ No newline at end of file
+        return list(self._available_assessments)
\ No newline at end of file
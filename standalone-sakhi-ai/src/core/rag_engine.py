@@ -4,36 +4,182 @@ RAG (Retrieval-Augmented Generation) Engine for Sakhi AI
 
 import os
 import uuid
+import hashlib
+import functools
+import itertools
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import sqlite3
+import threading
+import time
+import queue
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+import torch
+
 # Vector database
 import chromadb
 from chromadb.config import Settings
 
 # Text processing
 from sentence_transformers import SentenceTransformer
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
 import re
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
 from ..utils.logger import get_logger
+from ._rag_kernels import HAS_NUMBA
+
+if HAS_NUMBA:
+    from ._rag_kernels import chunk_bounds
 
 logger = get_logger(__name__)
 
+# Runs of whitespace collapsed before chunking
+_WS_RE = re.compile(r'\s+')
+
+# Characters that end a sentence when choosing chunk boundaries
+_SENTENCE_ENDINGS = '.!?'
+
+# Texts at least this long are chunked by the compiled kernel; below it the
+# pure-Python loop is faster than the array conversion
+JIT_CHUNK_MIN_CHARS = 10_000
+
+# Chunks embedded and upserted together while ingesting, bounding memory for
+# very large documents
+INGEST_BATCH_SIZE = 1024
+
+# Chunks per forward pass when embedding documents
+EMBEDDING_BATCH_SIZE = 64
+GPU_EMBEDDING_BATCH_SIZE = 1024
+
+# Run the embedding model in reduced precision: fp16 on CUDA, dynamically
+# quantized int8 Linear layers on CPU
+QUANTIZE_EMBEDDING_MODEL = True
+
+# Collection metadata, including the HNSW settings Chroma fixes at creation:
+# inner-product space (embeddings are L2-normalized, so it equals cosine),
+# M links per node, candidate list sizes for build and search
+COLLECTION_METADATA = {
+    "description": "Sakhi AI Medical Documents Collection",
+    "hnsw:space": "ip",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 64,
+    "hnsw:search_ef": 40
+}
+
+# Per-user collection handles kept open at once (least recently used closed first)
+MAX_OPEN_COLLECTIONS = 64
+
+# Retrieval takes RERANK_FACTOR candidates per requested result from the HNSW
+# index, then re-ranks them by exact similarity with their stored vectors
+RERANK_FACTOR = 4
+
+# Retrieval result cache: LRU size and the cosine similarity above which a
+# new query reuses a cached query's results
+QUERY_CACHE_SIZE = 512
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Concurrent retrieval: how long the query encoder waits to gather a batch,
+# the largest batch it encodes, and threads behind retrieve_context_async
+QUERY_BATCH_WINDOW_SECONDS = 0.005
+QUERY_BATCH_MAX_SIZE = 32
+RETRIEVAL_WORKERS = 4
+
+# How long health_check reuses a collection count
+HEALTH_COUNT_TTL_SECONDS = 5
+
+# On-disk chunk embedding cache (inside the persist directory), and how many
+# keys go into one SELECT ... IN (...) to stay under SQLite's variable limit
+EMBEDDING_CACHE_FILE = "embeddings.db"
+EMBEDDING_CACHE_QUERY_SIZE = 500
+
+# Sidecar index of each user's documents and chunk counts (inside the persist
+# directory), so listings and stats need not scan every chunk's metadata
+DOCUMENT_INDEX_FILE = "document_index.db"
+
+@functools.cache
+def _configure_torch():
+    """Give CPU encodes all but one core once per process, with a single inter-op thread"""
+    target = max(1, (os.cpu_count() or 1) - 1)
+    # Containers can start torch with a single intra-op thread; never lower a larger setting
+    if torch.get_num_threads() < target:
+        torch.set_num_threads(target)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed before any inter-op parallel work has started
+        pass
+
+@functools.cache
+def _warm_up_chunker():
+    """Compile the chunking kernel once per process rather than on the first large document"""
+    chunk_bounds(np.frombuffer('warm up. text'.encode('utf-32-le'), dtype=np.uint32), 8, 2)
+
+def _document_entry(document_id: str, chunks: int, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a document index entry in the shape get_user_documents returns"""
+    return {
+        'id': document_id,
+        'filename': metadata.get('filename', 'Unknown'),
+        'upload_date': metadata.get('created_at'),
+        'chunks': chunks,
+        'metadata': metadata
+    }
+
+class _QueryEncoder:
+    """Coalesces concurrent single-query encodes into batched forward passes"""
+
+    def __init__(self, model):
+        self._model = model
+        self._pending = queue.Queue()
+        threading.Thread(target=self._run, name='rag-query-encoder', daemon=True).start()
+
+    def encode(self, query: str):
+        """
+        Embed one query, sharing a forward pass with queries that arrive alongside it
+
+        Args:
+            query: Query text
+
+        Returns:
+            L2-normalized query embedding
+        """
+        future = Future()
+        self._pending.put((query, future))
+        return future.result()
+
+    def _run(self):
+        """Collect queries for up to QUERY_BATCH_WINDOW_SECONDS, then encode them together"""
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + QUERY_BATCH_WINDOW_SECONDS
+            while len(batch) < QUERY_BATCH_MAX_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                embeddings = self._model.encode(
+                    [query for query, _ in batch],
+                    batch_size=len(batch),
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
 class RAGEngine:
     """RAG Engine for document retrieval and context augmentation"""
 
@@ -51,14 +197,43 @@ class RAGEngine:
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.embedding_model_name = embedding_model
+        self.embedding_cache_path = os.path.join(persist_directory, EMBEDDING_CACHE_FILE)
+        self.document_index_path = os.path.join(persist_directory, DOCUMENT_INDEX_FILE)
 
         # Create persist directory if it doesn't exist
         os.makedirs(persist_directory, exist_ok=True)
 
         # Initialize components
         self.embedding_model = None
+        self.embedding_precision = 'fp32'
+        self._query_encoder = None
+        self._health_embedding = None
+        self._health_count = None  # (monotonic time, chunk count)
         self.chroma_client = None
-        self.collection = None
+
+        # user_id -> that user's collection; each user's chunks live in their own
+        # HNSW index so filtered search never walks other users' vectors
+        self._collections = OrderedDict()
+        self._collections_lock = threading.Lock()
+
+        # (user_id, query, top_k, threshold) -> (query embedding, context docs)
+        self._query_cache = OrderedDict()
+        # (user_id, top_k, threshold) -> (cache keys, stacked embeddings), built lazily
+        self._cache_matrices = {}
+        # Bumped on invalidation so searches begun before a change are not cached
+        self._cache_generation = 0
+        self._user_generations = Counter()
+        self._cache_lock = threading.Lock()
+
+        # user_id -> document_id -> document entry, mirrored to DOCUMENT_INDEX_FILE
+        self._user_docs = {}
+        # Running totals over the index: users holding each document_id, and chunks
+        self._document_refs = Counter()
+        self._chunk_total = 0
+        self._index_lock = threading.Lock()
+
+        # Runs retrieve_context for callers that should not block on it
+        self._executor = ThreadPoolExecutor(max_workers=RETRIEVAL_WORKERS, thread_name_prefix='rag')
 
         self._initialize()
 
@@ -68,8 +243,19 @@ class RAGEngine:
             logger.info("Initializing RAG Engine...")
 
             # Initialize embedding model
+            _configure_torch()
             logger.info(f"Loading embedding model: {self.embedding_model_name}")
             self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            if QUANTIZE_EMBEDDING_MODEL:
+                self._quantize_embedding_model()
+            self._query_encoder = _QueryEncoder(self.embedding_model)
+
+            # One test encode at startup doubles as warm-up; health checks reuse it
+            self._health_embedding = self.embedding_model.encode("test query")
+            self._init_embedding_cache()
+
+            if HAS_NUMBA:
+                _warm_up_chunker()
 
             # Initialize ChromaDB
             logger.info(f"Initializing ChromaDB with persist directory: {self.persist_directory}")
@@ -81,16 +267,8 @@ class RAGEngine:
                 )
             )
 
-            # Get or create collection
-            try:
-                self.collection = self.chroma_client.get_collection(name=self.collection_name)
-                logger.info(f"Connected to existing collection: {self.collection_name}")
-            except Exception:
-                self.collection = self.chroma_client.create_collection(
-                    name=self.collection_name,
-                    metadata={"description": "Sakhi AI Medical Documents Collection"}
-                )
-                logger.info(f"Created new collection: {self.collection_name}")
+            self._migrate_shared_collection()
+            self._load_document_index()
 
             logger.info("✅ RAG Engine initialized successfully")
 
@@ -98,6 +276,90 @@ class RAGEngine:
             logger.error(f"❌ Failed to initialize RAG Engine: {str(e)}")
             raise
 
+    def _quantize_embedding_model(self):
+        """Switch the embedding model to fp16 on CUDA or int8 Linear layers on CPU"""
+        try:
+            if self.embedding_model.device.type == 'cuda':
+                self.embedding_model.half()
+                self.embedding_precision = 'fp16'
+            else:
+                self.embedding_model = torch.quantization.quantize_dynamic(
+                    self.embedding_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                self.embedding_precision = 'int8'
+            logger.info(f"Embedding model running in {self.embedding_precision}")
+        except Exception as e:
+            logger.warning(f"Embedding model quantization failed, using fp32: {str(e)}")
+
+    def _user_collection_name(self, user_id: str) -> str:
+        """Chroma-safe collection name for a user's shard"""
+        return f"{self.collection_name}__{hashlib.sha256(user_id.encode('utf-8')).hexdigest()[:16]}"
+
+    def _collection(self, user_id: str):
+        """
+        Get (or create) the collection holding a user's chunks
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            ChromaDB collection for the user
+        """
+        with self._collections_lock:
+            collection = self._collections.get(user_id)
+            if collection is not None:
+                self._collections.move_to_end(user_id)
+                return collection
+
+            collection = self.chroma_client.get_or_create_collection(
+                name=self._user_collection_name(user_id),
+                metadata=COLLECTION_METADATA
+            )
+            self._collections[user_id] = collection
+            if len(self._collections) > MAX_OPEN_COLLECTIONS:
+                self._collections.popitem(last=False)
+            return collection
+
+    def _user_collections(self) -> List:
+        """All per-user collections in the database"""
+        prefix = f"{self.collection_name}__"
+        return [collection for collection in self.chroma_client.list_collections()
+                if collection.name.startswith(prefix)]
+
+    def _migrate_shared_collection(self):
+        """Move chunks from the pre-sharding shared collection into per-user collections"""
+        try:
+            shared = self.chroma_client.get_collection(name=self.collection_name)
+        except Exception:
+            return
+
+        logger.info(f"Migrating shared collection {self.collection_name} to per-user collections")
+        moved = 0
+        while True:
+            batch = shared.get(limit=INGEST_BATCH_SIZE, include=["documents", "metadatas", "embeddings"])
+            if not batch['ids']:
+                break
+
+            by_user = {}
+            for row in zip(batch['ids'], batch['documents'], batch['metadatas'], batch['embeddings']):
+                by_user.setdefault(row[2].get('user_id', 'default'), []).append(row)
+
+            for user_id, rows in by_user.items():
+                ids, documents, metadatas, embeddings = (list(column) for column in zip(*rows))
+                self._collection(user_id).upsert(
+                    ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
+                )
+
+            shared.delete(ids=batch['ids'])
+            moved += len(batch['ids'])
+
+        self.chroma_client.delete_collection(name=self.collection_name)
+        logger.info(f"✅ Migrated {moved} chunks to per-user collections")
+
+    def _total_chunks(self) -> int:
+        """Total chunk count across users, from the document index"""
+        return self._chunk_total
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check RAG Engine health
@@ -106,22 +368,26 @@ class RAGEngine:
             Health check result
         """
         try:
-            if not self.embedding_model or not self.collection:
+            if not self.embedding_model or not self.chroma_client:
                 return {
                     'status': 'unhealthy',
                     'message': 'Components not initialized'
                 }
 
-            # Test embedding
-            test_embedding = self.embedding_model.encode("test query")
+            # Test embedding (encoded once at startup)
+            test_embedding = self._health_embedding
             if test_embedding is None or len(test_embedding) == 0:
                 return {
                     'status': 'unhealthy',
                     'message': 'Embedding model not working'
                 }
 
-            # Test collection
-            collection_count = self.collection.count()
+            # Test database, reusing a recent check
+            now = time.monotonic()
+            if self._health_count is None or now - self._health_count[0] > HEALTH_COUNT_TTL_SECONDS:
+                self.chroma_client.heartbeat()
+                self._health_count = (now, self._total_chunks())
+            collection_count = self._health_count[1]
             return {
                 'status': 'healthy',
                 'message': 'RAG Engine is working',
@@ -153,46 +419,23 @@ class RAGEngine:
         try:
             logger.info(f"Adding document {document_id} to RAG system")
 
-            # Split content into chunks
-            chunks = self._chunk_text(content, chunk_size=1000, overlap=200)
+            added = self._upsert_chunks(self._iter_chunk_rows(document_id, content, metadata, user_id), user_id)
 
-            if not chunks:
+            if not added:
                 return {
                     'success': False,
                     'error': 'No content chunks created'
                 }
 
-            # Prepare data for ChromaDB
-            ids = []
-            documents = []
-            metadatas = []
-
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{document_id}_chunk_{i}"
-                ids.append(chunk_id)
-                documents.append(chunk)
-
-                chunk_metadata = {
-                    'document_id': document_id,
-                    'chunk_index': i,
-                    'user_id': user_id,
-                    'created_at': datetime.now().isoformat(),
-                    **(metadata or {})
-                }
-                metadatas.append(chunk_metadata)
+            chunk_count, first_metadata = added[document_id]
+            self._record_document(user_id, document_id, chunk_count, first_metadata)
+            self._invalidate_caches(user_id)
 
-            # Add to collection
-            self.collection.add(
-                ids=ids,
-                documents=documents,
-                metadatas=metadatas
-            )
-
-            logger.info(f"✅ Added {len(chunks)} chunks for document {document_id}")
+            logger.info(f"✅ Added {chunk_count} chunks for document {document_id}")
 
             return {
                 'success': True,
-                'chunk_count': len(chunks),
+                'chunk_count': chunk_count,
                 'document_id': document_id
             }
 
@@ -203,6 +446,303 @@ class RAGEngine:
                 'error': str(e)
             }
 
+    def add_documents(self, documents: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+                      user_id: str = "default") -> Dict[str, Any]:
+        """
+        Add several documents to RAG system, sharing encode and upsert batches
+
+        Args:
+            documents: (document_id, content, metadata) tuples
+            user_id: User ID for access control
+
+        Returns:
+            Addition result with per-document chunk counts
+        """
+        try:
+            logger.info(f"Adding {len(documents)} documents to RAG system")
+
+            added = self._upsert_chunks(itertools.chain.from_iterable(
+                self._iter_chunk_rows(document_id, content, metadata, user_id)
+                for document_id, content, metadata in documents
+            ), user_id)
+
+            if not added:
+                return {
+                    'success': False,
+                    'error': 'No content chunks created'
+                }
+
+            for document_id, (chunk_count, first_metadata) in added.items():
+                self._record_document(user_id, document_id, chunk_count, first_metadata)
+            self._invalidate_caches(user_id)
+
+            chunk_counts = {document_id: added.get(document_id, (0, None))[0]
+                            for document_id, _, _ in documents}
+            total_chunks = sum(chunk_counts.values())
+
+            logger.info(f"✅ Added {total_chunks} chunks for {len(chunk_counts)} documents")
+
+            return {
+                'success': True,
+                'chunk_count': total_chunks,
+                'chunk_counts': chunk_counts
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Failed to add documents: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def _iter_chunk_rows(self, document_id: str, content: str,
+                         metadata: Optional[Dict[str, Any]],
+                         user_id: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Chunk a document lazily, pairing each chunk with its ChromaDB id and metadata
+
+        Args:
+            document_id: Unique document identifier
+            content: Document text content
+            metadata: Document metadata
+            user_id: User ID for access control
+
+        Yields:
+            (chunk id, chunk text, chunk metadata) tuples
+        """
+        # Shared by every chunk; document metadata still overrides the defaults
+        base_metadata = {
+            'document_id': document_id,
+            'user_id': user_id,
+            'created_at': datetime.now().isoformat(),
+            **(metadata or {})
+        }
+
+        for i, chunk in enumerate(self._iter_chunks(content, chunk_size=1000, overlap=200)):
+            yield f"{document_id}_chunk_{i}", chunk, {'chunk_index': i, **base_metadata}
+
+    def _upsert_chunks(self, rows: Iterator[Tuple[str, str, Dict[str, Any]]],
+                       user_id: str) -> Dict[str, List]:
+        """
+        Embed and upsert chunk rows in batches of INGEST_BATCH_SIZE
+
+        Args:
+            rows: (chunk id, chunk text, chunk metadata) tuples
+            user_id: User whose collection receives the chunks
+
+        Returns:
+            document_id -> [chunk count, first chunk's metadata] for every document seen
+        """
+        collection = self._collection(user_id)
+        added = {}
+        while True:
+            batch = list(itertools.islice(rows, INGEST_BATCH_SIZE))
+            if not batch:
+                return added
+
+            ids, chunks, metadatas = (list(column) for column in zip(*batch))
+            collection.upsert(
+                ids=ids,
+                documents=chunks,
+                metadatas=metadatas,
+                embeddings=self._encode_chunks(chunks).tolist()
+            )
+
+            for chunk_metadata in metadatas:
+                entry = added.get(chunk_metadata['document_id'])
+                if entry is None:
+                    added[chunk_metadata['document_id']] = [1, chunk_metadata]
+                else:
+                    entry[0] += 1
+
+    def _load_document_index(self):
+        """Load the user -> document index, rebuilding it from the collection on first run"""
+        try:
+            with sqlite3.connect(self.document_index_path) as conn:
+                existed = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'documents'"
+                ).fetchone()
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS documents (
+                        user_id TEXT,
+                        document_id TEXT,
+                        chunks INTEGER,
+                        metadata TEXT,
+                        PRIMARY KEY (user_id, document_id)
+                    )
+                ''')
+                if existed:
+                    rows = conn.execute("SELECT user_id, document_id, chunks, metadata FROM documents")
+                    for user_id, document_id, chunks, metadata in rows:
+                        self._user_docs.setdefault(user_id, {})[document_id] = _document_entry(
+                            document_id, chunks, json.loads(metadata)
+                        )
+                    self._recount_document_index()
+                    return
+        except sqlite3.Error as e:
+            logger.warning(f"Document index unavailable, keeping it in memory: {str(e)}")
+
+        self._rebuild_document_index()
+
+    def _rebuild_document_index(self):
+        """Build the document index with one full scan of the collection"""
+        logger.info("Building document index from collections")
+        metadatas = itertools.chain.from_iterable(
+            collection.get(include=["metadatas"])['metadatas'] or []
+            for collection in self._user_collections()
+        )
+
+        for metadata in metadatas:
+            doc_id = metadata.get('document_id')
+            if not doc_id:
+                continue
+            docs = self._user_docs.setdefault(metadata.get('user_id'), {})
+            if doc_id not in docs:
+                docs[doc_id] = _document_entry(doc_id, 0, metadata)
+            docs[doc_id]['chunks'] += 1
+
+        self._persist_document_index(
+            "INSERT OR REPLACE INTO documents (user_id, document_id, chunks, metadata) VALUES (?, ?, ?, ?)",
+            [(user_id, doc_id, entry['chunks'], json.dumps(entry['metadata']))
+             for user_id, docs in self._user_docs.items() for doc_id, entry in docs.items()]
+        )
+        self._recount_document_index()
+
+    def _recount_document_index(self):
+        """Recompute the index totals after loading or rebuilding it"""
+        with self._index_lock:
+            self._document_refs = Counter(doc_id for docs in self._user_docs.values() for doc_id in docs)
+            self._chunk_total = sum(entry['chunks'] for docs in self._user_docs.values() for entry in docs.values())
+
+    def _persist_document_index(self, statement: str, rows: List[Tuple] = ((),)):
+        """
+        Apply a change to the on-disk document index
+
+        Args:
+            statement: SQL statement against the documents table
+            rows: Parameter tuples, one execution per tuple
+        """
+        try:
+            with sqlite3.connect(self.document_index_path) as conn:
+                conn.executemany(statement, rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist document index: {str(e)}")
+
+    def _record_document(self, user_id: str, document_id: str, chunk_count: int,
+                         first_metadata: Dict[str, Any]):
+        """
+        Index an upserted document and drop chunks left over from a longer previous version
+
+        Args:
+            user_id: User ID
+            document_id: Document identifier
+            chunk_count: Number of chunks upserted for the document
+            first_metadata: Metadata of the document's first chunk
+        """
+        with self._index_lock:
+            docs = self._user_docs.setdefault(user_id, {})
+            previous = docs.get(document_id)
+            docs[document_id] = _document_entry(document_id, chunk_count, first_metadata)
+            if previous:
+                self._chunk_total -= previous['chunks']
+            else:
+                self._document_refs[document_id] += 1
+            self._chunk_total += chunk_count
+
+        self._persist_document_index(
+            "INSERT OR REPLACE INTO documents (user_id, document_id, chunks, metadata) VALUES (?, ?, ?, ?)",
+            [(user_id, document_id, chunk_count, json.dumps(first_metadata))]
+        )
+
+        if previous and previous['chunks'] > chunk_count:
+            self._collection(user_id).delete(
+                ids=[f"{document_id}_chunk_{i}" for i in range(chunk_count, previous['chunks'])]
+            )
+
+    def _init_embedding_cache(self):
+        """Create the on-disk chunk embedding cache table"""
+        try:
+            with sqlite3.connect(self.embedding_cache_path) as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS cache (
+                        key BLOB PRIMARY KEY,
+                        emb BLOB
+                    )
+                ''')
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache unavailable: {str(e)}")
+
+    def _embedding_key(self, chunk: str) -> bytes:
+        """Cache key for a chunk's embedding under the current model and precision"""
+        return hashlib.sha256(f"{self.embedding_model_name}:{self.embedding_precision}\0{chunk}".encode('utf-8')).digest()
+
+    def _encode_chunks(self, chunks: List[str]):
+        """
+        Embed document chunks, reusing embeddings cached on disk
+
+        Args:
+            chunks: Chunk texts to embed
+
+        Returns:
+            (n_chunks, dim) array of L2-normalized embeddings
+        """
+        keys = [self._embedding_key(chunk) for chunk in chunks]
+
+        try:
+            with sqlite3.connect(self.embedding_cache_path) as conn:
+                cached = {}
+                for i in range(0, len(keys), EMBEDDING_CACHE_QUERY_SIZE):
+                    batch = keys[i:i + EMBEDDING_CACHE_QUERY_SIZE]
+                    placeholders = ','.join('?' * len(batch))
+                    cached.update(conn.execute(
+                        f"SELECT key, emb FROM cache WHERE key IN ({placeholders})", batch
+                    ))
+
+                # Embed each distinct uncached chunk once
+                missing = {key: chunk for key, chunk in zip(keys, chunks) if key not in cached}
+                computed = {}
+                if missing:
+                    computed = dict(zip(missing, self._embed_texts(list(missing.values()))))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO cache (key, emb) VALUES (?, ?)",
+                        [(key, emb.astype(np.float16).tobytes()) for key, emb in computed.items()]
+                    )
+
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed, encoding all chunks: {str(e)}")
+            return self._embed_texts(chunks)
+
+        if computed:
+            logger.info(f"Embedded {len(computed)} new chunks, {len(chunks) - len(computed)} from cache")
+
+        # Cached vectors are stored as float16 to halve disk use
+        return np.vstack([
+            computed[key] if key in computed else np.frombuffer(cached[key], dtype=np.float16)
+            for key in keys
+        ]).astype(np.float32)
+
+    def _embed_texts(self, texts: List[str]):
+        """
+        Embed texts in batched forward passes
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            (n_texts, dim) array of L2-normalized embeddings
+        """
+        device = getattr(self.embedding_model, 'device', None)
+        batch_size = GPU_EMBEDDING_BATCH_SIZE if getattr(device, 'type', None) == 'cuda' else EMBEDDING_BATCH_SIZE
+
+        # Passing the whole list lets sentence-transformers length-sort the batches
+        return self.embedding_model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
     def retrieve_context(self, query: str, user_id: str = "default",
                         top_k: int = 5, threshold: float = 0.5) -> List[Dict[str, Any]]:
         """
@@ -220,41 +760,158 @@ class RAGEngine:
         try:
             logger.info(f"Retrieving context for query: {query[:100]}...")
 
+            # Exact repeat of a recent query
+            cache_key = (user_id, query, top_k, threshold)
+            with self._cache_lock:
+                cached = self._query_cache.get(cache_key)
+                if cached is not None:
+                    self._query_cache.move_to_end(cache_key)
+                    logger.info("Retrieved context from query cache")
+                    return list(cached[1])
+                generation = (self._cache_generation, self._user_generations[user_id])
+
+            # Users without documents have no collection to search
+            with self._index_lock:
+                user_chunks = sum(entry['chunks'] for entry in self._user_docs.get(user_id, {}).values())
+            if not user_chunks:
+                return []
+
             # Generate query embedding
-            query_embedding = self.embedding_model.encode(query)
-
-            # Search in collection
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
-                where={"user_id": user_id},
-                include=["documents", "metadatas", "distances"]
+            query_embedding = self._query_encoder.encode(query)
+
+            # Near-duplicate of a recent query
+            cached_docs = self._lookup_similar_query(cache_key, query_embedding)
+            if cached_docs is not None:
+                logger.info("Retrieved context from semantic query cache")
+                return list(cached_docs)
+
+            # Take candidates from the user's HNSW index
+            results = self._collection(user_id).query(
+                query_embeddings=[query_embedding.tolist()],
+                n_results=min(top_k * RERANK_FACTOR, user_chunks),
+                include=["documents", "metadatas", "embeddings"]
             )
 
-            # Process results
+            # Re-rank the candidates by exact cosine similarity (stored vectors are
+            # normalized), keeping the top_k above the threshold
             context_docs = []
             if results['ids'] and results['ids'][0]:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    distance = results['distances'][0][i]
-                    similarity = 1 - distance  # Convert distance to similarity
-
-                    if similarity >= threshold:
-                        context_docs.append({
-                            'id': doc_id,
-                            'content': results['documents'][0][i],
-                            'metadata': results['metadatas'][0][i],
-                            'similarity': similarity,
-                            'document_id': results['metadatas'][0][i].get('document_id'),
-                            'chunk_index': results['metadatas'][0][i].get('chunk_index')
-                        })
+                similarities = np.asarray(results['embeddings'][0], dtype=np.float32) @ query_embedding
+                for i in np.argsort(-similarities)[:top_k]:
+                    similarity = float(similarities[i])
+                    if similarity < threshold:
+                        break
+                    metadata = results['metadatas'][0][i]
+                    context_docs.append({
+                        'id': results['ids'][0][i],
+                        'content': results['documents'][0][i],
+                        'metadata': metadata,
+                        'similarity': similarity,
+                        'document_id': metadata.get('document_id'),
+                        'chunk_index': metadata.get('chunk_index')
+                    })
+
+            self._cache_query(cache_key, query_embedding, context_docs, generation)
 
             logger.info(f"Retrieved {len(context_docs)} relevant context chunks")
-            return context_docs
+            return list(context_docs)
 
         except Exception as e:
             logger.error(f"❌ Failed to retrieve context: {str(e)}")
             return []
 
+    def retrieve_context_async(self, query: str, user_id: str = "default",
+                               top_k: int = 5, threshold: float = 0.5) -> Future:
+        """
+        Retrieve relevant context on the engine's worker pool
+
+        Args:
+            query: Query text
+            user_id: User ID for access control
+            top_k: Number of top results to retrieve
+            threshold: Similarity threshold
+
+        Returns:
+            Future resolving to the retrieve_context result
+        """
+        return self._executor.submit(self.retrieve_context, query, user_id, top_k, threshold)
+
+    def _lookup_similar_query(self, cache_key: Tuple, query_embedding) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find cached results for a query semantically equal to this one
+
+        Args:
+            cache_key: (user_id, query, top_k, threshold) of the new query
+            query_embedding: L2-normalized embedding of the new query
+
+        Returns:
+            Cached context docs, or None when no cached query is similar enough
+        """
+        user_id, _, top_k, threshold = cache_key
+        scope = (user_id, top_k, threshold)
+
+        with self._cache_lock:
+            entry = self._cache_matrices.get(scope)
+            if entry is None:
+                keys = [key for key in self._query_cache
+                        if (key[0], key[2], key[3]) == scope]
+                if not keys:
+                    return None
+                entry = (keys, np.vstack([self._query_cache[key][0] for key in keys]))
+                self._cache_matrices[scope] = entry
+
+            keys, matrix = entry
+            similarities = matrix @ query_embedding
+            best = int(similarities.argmax())
+            if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+                return None
+
+            self._query_cache.move_to_end(keys[best])
+            return self._query_cache[keys[best]][1]
+
+    def _cache_query(self, cache_key: Tuple, query_embedding, context_docs: List[Dict[str, Any]],
+                     generation: Tuple[int, int]):
+        """
+        Store retrieval results, evicting the least recently used entry when full
+
+        Args:
+            cache_key: (user_id, query, top_k, threshold) of the query
+            query_embedding: L2-normalized embedding of the query
+            context_docs: Retrieved context docs
+            generation: Cache generations read before the search; results are
+                dropped if the user's caches were invalidated since
+        """
+        with self._cache_lock:
+            if generation != (self._cache_generation, self._user_generations[cache_key[0]]):
+                return
+
+            self._query_cache[cache_key] = (query_embedding, context_docs)
+            self._cache_matrices.pop((cache_key[0], cache_key[2], cache_key[3]), None)
+
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                evicted, _ = self._query_cache.popitem(last=False)
+                self._cache_matrices.pop((evicted[0], evicted[2], evicted[3]), None)
+
+    def _invalidate_caches(self, user_id: Optional[str] = None):
+        """
+        Drop cached retrieval results after the collection changes
+
+        Args:
+            user_id: Only drop this user's caches; None drops everything
+        """
+        with self._cache_lock:
+            if user_id is None:
+                self._cache_generation += 1
+                self._query_cache.clear()
+                self._cache_matrices.clear()
+                return
+
+            self._user_generations[user_id] += 1
+            for key in [key for key in self._query_cache if key[0] == user_id]:
+                del self._query_cache[key]
+            for scope in [scope for scope in self._cache_matrices if scope[0] == user_id]:
+                del self._cache_matrices[scope]
+
     def delete_document(self, document_id: str, user_id: str = "default") -> bool:
         """
         Delete document from RAG system
@@ -269,14 +926,29 @@ class RAGEngine:
         try:
             logger.info(f"Deleting document {document_id} from RAG system")
 
-            # Find all chunks for this document
-            results = self.collection.get(
-                where={"document_id": document_id, "user_id": user_id}
-            )
+            with self._index_lock:
+                entry = self._user_docs.get(user_id, {}).pop(document_id, None)
+                if entry is not None:
+                    self._chunk_total -= entry['chunks']
+                    self._document_refs[document_id] -= 1
+                    if not self._document_refs[document_id]:
+                        del self._document_refs[document_id]
+
+            collection = self._collection(user_id)
+            if entry is not None:
+                self._persist_document_index(
+                    "DELETE FROM documents WHERE user_id = ? AND document_id = ?",
+                    [(user_id, document_id)]
+                )
+                ids = [f"{document_id}_chunk_{i}" for i in range(entry['chunks'])]
+            else:
+                # Not indexed: find all chunks for this document
+                ids = collection.get(where={"document_id": document_id})['ids']
 
-            if results['ids']:
-                self.collection.delete(ids=results['ids'])
-                logger.info(f"✅ Deleted {len(results['ids'])} chunks for document {document_id}")
+            if ids:
+                collection.delete(ids=ids)
+                self._invalidate_caches(user_id)
+                logger.info(f"✅ Deleted {len(ids)} chunks for document {document_id}")
                 return True
             else:
                 logger.warning(f"No chunks found for document {document_id}")
@@ -297,54 +969,46 @@ class RAGEngine:
             List of documents
         """
         try:
-            # Get all chunks for user
-            results = self.collection.get(
-                where={"user_id": user_id},
-                include=["metadatas"]
-            )
-
-            # Group chunks by document_id
-            documents = {}
-            if results['ids'] and results['metadatas']:
-                for metadata in results['metadatas']:
-                    doc_id = metadata.get('document_id')
-                    if doc_id and doc_id not in documents:
-                        documents[doc_id] = {
-                            'id': doc_id,
-                            'filename': metadata.get('filename', 'Unknown'),
-                            'upload_date': metadata.get('created_at'),
-                            'chunks': 0,
-                            'metadata': metadata
-                        }
-                    documents[doc_id]['chunks'] += 1
-
-            return list(documents.values())
+            with self._index_lock:
+                return [dict(entry) for entry in self._user_docs.get(user_id, {}).values()]
 
         except Exception as e:
             logger.error(f"❌ Failed to get user documents: {str(e)}")
             return []
 
-    def _chunk_text(self, text: str, chunk_size: int = 1000,
-                   overlap: int = 200) -> List[str]:
+    def _iter_chunks(self, text: str, chunk_size: int = 1000,
+                     overlap: int = 200) -> Iterator[str]:
         """
-        Split text into chunks
+        Split text into chunks lazily
 
         Args:
             text: Text to chunk
             chunk_size: Maximum chunk size
             overlap: Overlap between chunks
 
-        Returns:
-            List of text chunks
+        Yields:
+            Text chunks in document order
         """
         try:
             # Clean text
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _WS_RE.sub(' ', text).strip()
 
             if len(text) <= chunk_size:
-                return [text]
+                yield text
+                return
+
+            if HAS_NUMBA and len(text) >= JIT_CHUNK_MIN_CHARS:
+                # surrogatepass keeps one code unit per character for the lone
+                # surrogates PDF extraction can produce
+                chars = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+                bounds = chunk_bounds(chars, chunk_size, overlap)
+                del chars
+                for start, end in bounds:
+                    chunk = text[start:end].strip()
+                    if chunk:
+                        yield chunk
+                return
 
-            chunks = []
             start = 0
 
             while start < len(text):
@@ -352,11 +1016,10 @@ class RAGEngine:
 
                 # Try to break at sentence boundary
                 if end < len(text):
-                    # Find last sentence ending in chunk
-                    last_period = text.rfind('.', start, end)
-                    last_exclamation = text.rfind('!', start, end)
-                    last_question = text.rfind('?', start, end)
-                    last_sentence = max(last_period, last_exclamation, last_question)
+                    # Find last sentence ending in the back half of the chunk;
+                    # an earlier one would be rejected below anyway
+                    min_break = start + chunk_size // 2 + 1
+                    last_sentence = max(text.rfind(mark, min_break, end) for mark in _SENTENCE_ENDINGS)
 
                     if last_sentence > start + chunk_size // 2:
                         end = last_sentence + 1
@@ -368,30 +1031,32 @@ class RAGEngine:
 
                 chunk = text[start:end].strip()
                 if chunk:
-                    chunks.append(chunk)
+                    yield chunk
 
                 start = max(start + 1, end - overlap)
 
-            return chunks
-
         except Exception as e:
             logger.error(f"❌ Failed to chunk text: {str(e)}")
-            return []
 
     def reset_collection(self) -> bool:
         """
-        Reset the entire collection
+        Reset every user's collection
 
         Returns:
             True if successful, False otherwise
         """
         try:
             logger.warning("Resetting RAG collection")
-            self.chroma_client.delete_collection(name=self.collection_name)
-            self.collection = self.chroma_client.create_collection(
-                name=self.collection_name,
-                metadata={"description": "Sakhi AI Medical Documents Collection"}
-            )
+            with self._collections_lock:
+                for collection in self._user_collections():
+                    self.chroma_client.delete_collection(name=collection.name)
+                self._collections.clear()
+            with self._index_lock:
+                self._user_docs.clear()
+                self._document_refs.clear()
+                self._chunk_total = 0
+            self._persist_document_index("DELETE FROM documents")
+            self._invalidate_caches()
             logger.info("✅ RAG collection reset successfully")
             return True
 
@@ -407,20 +1072,11 @@ class RAGEngine:
             Statistics dictionary
         """
         try:
-            total_chunks = self.collection.count()
-
-            # Get unique document count
-            results = self.collection.get(include=["metadatas"])
-            unique_docs = set()
-            if results['metadatas']:
-                for metadata in results['metadatas']:
-                    doc_id = metadata.get('document_id')
-                    if doc_id:
-                        unique_docs.add(doc_id)
+            total_chunks = self._total_chunks()
 
             return {
                 'total_chunks': total_chunks,
-                'unique_documents': len(unique_docs),
+                'unique_documents': len(self._document_refs),
                 'embedding_model': self.embedding_model_name,
                 'collection_name': self.collection_name,
                 'persist_directory': self.persist_directory
@@ -3,49 +3,211 @@ Voice Engine for Sakhi AI - Text-to-Speech and Voice Processing
 """
 
 import os
-import uuid
+import secrets
+import itertools
+import hashlib
 import logging
 import io
+import re
 import base64
-from typing import Dict, Any, Optional
+import functools
+import importlib.util
+import atexit
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-# TTS engines
-try:
-    import pyttsx3
-    HAS_PYTTSX3 = True
-except ImportError:
-    HAS_PYTTSX3 = False
-    logging.warning("pyttsx3 not available. Install with: pip install pyttsx3")
-
-try:
-    import elevenlabs
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs import VoiceSettings
-    HAS_ELEVENLABS = True
-except ImportError:
-    HAS_ELEVENLABS = False
-    logging.warning("ElevenLabs not available. Install with: pip install elevenlabs")
-
-# Audio processing
-try:
-    import soundfile as sf
-    import numpy as np
-    HAS_AUDIO_PROCESSING = True
-except ImportError:
-    HAS_AUDIO_PROCESSING = False
-    logging.warning("Audio processing libraries not available")
+# TTS engines and soundfile are imported on first use, so processes that never
+# synthesize speech skip them. Their HAS_* flags stay None until the first attempt.
+HAS_PYTTSX3 = None
+HAS_ELEVENLABS = None
+HAS_SOUNDFILE = None
+
+def _has_pyttsx3() -> bool:
+    """Import pyttsx3 on first use; returns whether it is available"""
+    global HAS_PYTTSX3, pyttsx3
+    if HAS_PYTTSX3 is None:
+        try:
+            import pyttsx3
+            HAS_PYTTSX3 = True
+        except ImportError:
+            HAS_PYTTSX3 = False
+            logging.warning("pyttsx3 not available. Install with: pip install pyttsx3")
+    return HAS_PYTTSX3
+
+def _has_elevenlabs() -> bool:
+    """Import the ElevenLabs SDK on first use; returns whether it is available"""
+    global HAS_ELEVENLABS, ElevenLabs, VoiceSettings, httpx
+    if HAS_ELEVENLABS is None:
+        try:
+            import httpx
+            from elevenlabs.client import ElevenLabs
+            from elevenlabs import VoiceSettings
+            HAS_ELEVENLABS = True
+        except ImportError:
+            HAS_ELEVENLABS = False
+            logging.warning("ElevenLabs not available. Install with: pip install elevenlabs")
+    return HAS_ELEVENLABS
+
+def _has_soundfile() -> bool:
+    """Import soundfile on first use; returns whether it is available"""
+    global HAS_SOUNDFILE, sf
+    if HAS_SOUNDFILE is None:
+        try:
+            import soundfile as sf
+            HAS_SOUNDFILE = True
+        except ImportError:
+            HAS_SOUNDFILE = False
+            logging.warning("soundfile not available. Install with: pip install soundfile")
+    return HAS_SOUNDFILE
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default ElevenLabs output format for saved files; opus_48000_32 is smaller
+# for the same quality on browsers that play Ogg Opus
+ELEVENLABS_FILE_FORMAT = "mp3_22050_32"
+
+# Codecs whose per-sentence outputs concatenate into one playable file
+_CONCATENABLE_CODECS = frozenset({'mp3', 'pcm', 'ulaw'})
+
+# How long the ElevenLabs voice list is reused before refetching
+VOICE_LIST_TTL_SECONDS = 300
+
+# Pooled ElevenLabs connections, reused across requests to skip TLS handshakes;
+# HTTP/2 (when the h2 package is installed) multiplexes parallel sentence requests
+ELEVENLABS_MAX_CONNECTIONS = 16
+ELEVENLABS_MAX_KEEPALIVE = 8
+ELEVENLABS_TIMEOUT_SECONDS = 30.0
+ELEVENLABS_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# Write buffer for saved audio; coalesces the SDK's small HTTP chunks
+AUDIO_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Default ElevenLabs model; the turbo/flash models have the lowest latency
+ELEVENLABS_MODEL_ID = "eleven_turbo_v2_5"
+
+# Sentence boundaries in streamed text: terminal punctuation followed by
+# whitespace (so decimals like 3.5 never split), skipping abbreviations and
+# fragments shorter than MIN_SENTENCE_CHARS
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+_ABBREVIATIONS = frozenset({'Dr.', 'Mr.', 'Mrs.', 'Ms.', 'St.', 'AM.', 'PM.', 'a.m.', 'p.m.', 'e.g.', 'i.e.', 'etc.', 'vs.'})
+MIN_SENTENCE_CHARS = 10
+
+# Emotion -> ElevenLabs (stability, similarity_boost, style)
+_EMOTION_VOICE_PARAMS = {
+    "caring": (0.85, 0.8, 0.6),
+    "empathetic": (0.7, 0.75, 0.7),
+    "calm": (0.9, 0.7, 0.3),
+    "encouraging": (0.6, 0.8, 0.8),
+    "concerned": (0.65, 0.7, 0.6),
+}
+_DEFAULT_VOICE_PARAMS = (0.75, 0.75, 0.5)
+
+# Emotion -> pyttsx3 (rate, volume)
+_EMOTION_PYTTSX3 = {
+    "caring": (180, 0.85),
+    "empathetic": (170, 0.8),
+    "calm": (160, 0.75),
+    "encouraging": (220, 0.95),
+    "concerned": (175, 0.8),
+}
+_DEFAULT_PYTTSX3 = (200, 0.9)
+
+def _voice_settings(stability: float, similarity_boost: float, style: float) -> "VoiceSettings":
+    """ElevenLabs VoiceSettings with speaker boost enabled"""
+    return VoiceSettings(
+        stability=stability,
+        similarity_boost=similarity_boost,
+        style=style,
+        use_speaker_boost=True
+    )
+
+@functools.cache
+def _emotion_voice_settings() -> Tuple[Dict[str, "VoiceSettings"], "VoiceSettings"]:
+    """Emotion -> VoiceSettings table and default, built once; the SDK only reads them"""
+    table = {emotion: _voice_settings(*params) for emotion, params in _EMOTION_VOICE_PARAMS.items()}
+    return table, _voice_settings(*_DEFAULT_VOICE_PARAMS)
+
+def _audio_mimetype(output_format: str) -> str:
+    """MIME type for an ElevenLabs output format such as pcm_16000 or mp3_22050_32"""
+    codec, _, rate = output_format.partition('_')
+    if codec == 'pcm':
+        return f"audio/L16; rate={rate}; channels=1"
+    if codec == 'ulaw':
+        return f"audio/basic; rate={rate}"
+    if codec == 'opus':
+        return "audio/ogg; codecs=opus"
+    return "audio/mpeg"
+
+class _SentenceBuffer:
+    """Accumulates streamed text tokens and releases complete sentences"""
+
+    def __init__(self, min_chars: int = MIN_SENTENCE_CHARS):
+        self._buffer = ""
+        self._min_chars = min_chars
+
+    def push(self, token: str) -> List[str]:
+        """
+        Add a token
+
+        Args:
+            token: Next piece of streamed text
+
+        Returns:
+            Sentences completed by this token, in order
+        """
+        self._buffer += token
+        sentences = []
+        start = 0
+        for match in _SENTENCE_BREAK_RE.finditer(self._buffer):
+            sentence = self._buffer[start:match.start()].strip()
+            last_word = sentence.rsplit(None, 1)[-1] if sentence else ""
+            # Keep going past abbreviations, initials ("J.") and short fragments
+            if (last_word in _ABBREVIATIONS or (len(last_word) == 2 and last_word[0].isalpha())
+                    or len(sentence) < self._min_chars):
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> List[str]:
+        """
+        Release whatever text remains once the stream has ended
+
+        Returns:
+            The trailing text as a final sentence, if any
+        """
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
+
+def _iter_sentences(text_iter: Iterable[str]) -> Iterator[str]:
+    """Regroup streamed text tokens into whole sentences"""
+    buffer = _SentenceBuffer()
+    for token in text_iter:
+        for sentence in buffer.push(token):
+            yield sentence + " "
+    for sentence in buffer.flush():
+        yield sentence + " "
+
 class VoiceEngine:
     """Voice Engine for text-to-speech conversion"""
 
     def __init__(self, elevenlabs_api_key: Optional[str] = None,
                  default_voice_id: str = "Rachel",
-                 tts_engine: str = "pyttsx3"):
+                 tts_engine: str = "pyttsx3",
+                 stream_output_format: str = "pcm_16000",
+                 file_output_format: str = ELEVENLABS_FILE_FORMAT,
+                 model_id: str = ELEVENLABS_MODEL_ID,
+                 optimize_streaming_latency: int = 3,
+                 tts_concurrency: int = 3,
+                 tts_cache_dir: str = "cache",
+                 tts_cache_max_bytes: int = 256 * 1024 * 1024):
         """
         Initialize Voice Engine
 
@@ -53,41 +215,120 @@ class VoiceEngine:
             elevenlabs_api_key: ElevenLabs API key
             default_voice_id: Default voice ID for ElevenLabs
             tts_engine: Preferred TTS engine ("pyttsx3" or "elevenlabs")
+            stream_output_format: ElevenLabs output format for streamed audio
+            file_output_format: ElevenLabs output format for saved audio files
+            model_id: ElevenLabs model ID
+            optimize_streaming_latency: ElevenLabs streaming latency optimization (0-4)
+            tts_concurrency: Sentences synthesized in parallel by ElevenLabs
+            tts_cache_dir: Subdirectory of the audio output directory for cached speech
+            tts_cache_max_bytes: Byte budget for cached speech, enforced as new entries are cached
         """
         self.elevenlabs_api_key = elevenlabs_api_key or os.getenv('ELEVENLABS_API_KEY')
         self.default_voice_id = default_voice_id
         self.tts_engine = tts_engine
+        self.stream_output_format = stream_output_format
+        self.file_output_format = file_output_format
+        self.model_id = model_id
+        self.optimize_streaming_latency = optimize_streaming_latency
+        self.tts_concurrency = tts_concurrency
+
+        # Bounds concurrent ElevenLabs requests for multi-sentence text
+        self._tts_executor = ThreadPoolExecutor(max_workers=max(1, tts_concurrency))
+
+        # pyttsx3 is not thread-safe; all of its synthesis runs on one worker
+        self._pyttsx3_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")
 
         # Audio output directory
         self.audio_output_dir = "static/audio"
         os.makedirs(self.audio_output_dir, exist_ok=True)
 
+        # Content-addressed cache of ElevenLabs speech
+        self.tts_cache_dir = os.path.join(self.audio_output_dir, tts_cache_dir)
+        self.tts_cache_max_bytes = tts_cache_max_bytes
+        os.makedirs(self.tts_cache_dir, exist_ok=True)
+
+        # Running size of the speech cache; None until the first trim measures it.
+        # Publishing past the budget schedules a trim on the synthesis workers.
+        self._tts_cache_bytes = None
+        self._tts_cache_trim_pending = False
+        self._tts_cache_lock = threading.Lock()
+
         # Initialize engines
         self.pyttsx3_engine = None
+        self.pyttsx3_voices = []
         self.elevenlabs_client = None
+        self._http_client = None
+
+        # Unique, chronologically ordered audio file names
+        self._file_seq = itertools.count()
+
+        # ElevenLabs voice list, refetched after VOICE_LIST_TTL_SECONDS
+        self._voices_cache = None
+        self._voices_cache_ts = 0.0
+        self._voices_cache_ttl = VOICE_LIST_TTL_SECONDS
 
         self._initialize_engines()
+        atexit.register(self.close)
 
     def _initialize_engines(self):
         """Initialize TTS engines"""
         # Initialize pyttsx3
-        if HAS_PYTTSX3:
+        if _has_pyttsx3():
             try:
-                self.pyttsx3_engine = pyttsx3.init()
+                # The driver (COM/SAPI on Windows) is bound to the thread that
+                # creates it, so the engine is created on the pyttsx3 worker
+                self.pyttsx3_engine, self.pyttsx3_voices = (
+                    self._pyttsx3_executor.submit(self._create_pyttsx3).result()
+                )
                 logger.info("✅ pyttsx3 TTS engine initialized")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize pyttsx3: {str(e)}")
                 self.pyttsx3_engine = None
 
         # Initialize ElevenLabs
-        if HAS_ELEVENLABS and self.elevenlabs_api_key:
+        if self.elevenlabs_api_key and _has_elevenlabs():
             try:
-                self.elevenlabs_client = ElevenLabs(api_key=self.elevenlabs_api_key)
+                self._http_client = httpx.Client(
+                    http2=importlib.util.find_spec('h2') is not None,
+                    timeout=httpx.Timeout(ELEVENLABS_TIMEOUT_SECONDS, connect=ELEVENLABS_CONNECT_TIMEOUT_SECONDS),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=ELEVENLABS_MAX_KEEPALIVE,
+                        max_connections=ELEVENLABS_MAX_CONNECTIONS
+                    )
+                )
+                self.elevenlabs_client = ElevenLabs(
+                    api_key=self.elevenlabs_api_key,
+                    httpx_client=self._http_client
+                )
                 logger.info("✅ ElevenLabs TTS engine initialized")
+                # Open the pooled connection before the first user request needs it
+                threading.Thread(target=self._warm_up_elevenlabs, daemon=True).start()
             except Exception as e:
                 logger.error(f"❌ Failed to initialize ElevenLabs: {str(e)}")
                 self.elevenlabs_client = None
 
+    def _warm_up_elevenlabs(self):
+        """Synthesize one character so TLS, HTTP/2 and the model are warm; also checks the API key"""
+        try:
+            for _ in self._stream_elevenlabs(".", {
+                'voice_id': self.default_voice_id,
+                'model_id': self.model_id,
+                'output_format': self.stream_output_format,
+                'voice_settings': self._get_voice_settings_for_emotion("caring")
+            }):
+                pass
+            logger.debug("ElevenLabs connection warmed up")
+        except Exception as e:
+            logger.debug(f"ElevenLabs warm-up failed: {str(e)}")
+
+    def close(self):
+        """Close pooled ElevenLabs connections and stop synthesis workers"""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+        self._tts_executor.shutdown(wait=False)
+        self._pyttsx3_executor.shutdown(wait=False)
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check Voice Engine health
@@ -98,24 +339,16 @@ class VoiceEngine:
         engines_status = {}
 
         if self.pyttsx3_engine:
-            try:
-                voices = self.pyttsx3_engine.getProperty('voices')
-                engines_status['pyttsx3'] = {
-                    'available': True,
-                    'voice_count': len(voices) if voices else 0
-                }
-            except Exception as e:
-                engines_status['pyttsx3'] = {
-                    'available': False,
-                    'error': str(e)
-                }
+            engines_status['pyttsx3'] = {
+                'available': True,
+                'voice_count': len(self.pyttsx3_voices)
+            }
         else:
             engines_status['pyttsx3'] = {'available': False}
 
         if self.elevenlabs_client:
             try:
-                # Test ElevenLabs with a simple request
-                voices = list(self.elevenlabs_client.voices.get_all())
+                voices = self._get_elevenlabs_voices()
                 engines_status['elevenlabs'] = {
                     'available': True,
                     'voice_count': len(voices),
@@ -142,7 +375,10 @@ class VoiceEngine:
 
     def synthesize_speech(self, text: str, emotion: str = "caring",
                          voice_id: Optional[str] = None,
-                         engine: Optional[str] = None) -> Dict[str, Any]:
+                         engine: Optional[str] = None,
+                         stream: bool = False,
+                         output_format: Optional[str] = None,
+                         model_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Synthesize speech from text
 
@@ -151,6 +387,11 @@ class VoiceEngine:
             emotion: Emotion for voice modulation
             voice_id: Voice ID (for ElevenLabs)
             engine: TTS engine to use
+            stream: With ElevenLabs, return an 'audio_stream' iterator of audio
+                bytes as they arrive instead of saving a file
+            output_format: ElevenLabs output format overriding the engine's
+                stream or file default
+            model_id: ElevenLabs model ID overriding the engine's default
 
         Returns:
             Speech synthesis result
@@ -169,7 +410,8 @@ class VoiceEngine:
 
             # Try ElevenLabs first if available and preferred
             if selected_engine == "elevenlabs" and self.elevenlabs_client:
-                return self._synthesize_with_elevenlabs(text, emotion, voice_id)
+                return self._synthesize_with_elevenlabs(text, emotion, voice_id, stream,
+                                                        output_format, model_id)
 
             # Fall back to pyttsx3
             elif self.pyttsx3_engine:
@@ -189,7 +431,10 @@ class VoiceEngine:
             }
 
     def _synthesize_with_elevenlabs(self, text: str, emotion: str = "caring",
-                                   voice_id: Optional[str] = None) -> Dict[str, Any]:
+                                   voice_id: Optional[str] = None,
+                                   stream: bool = False,
+                                   output_format: Optional[str] = None,
+                                   model_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Synthesize speech using ElevenLabs
 
@@ -197,6 +442,9 @@ class VoiceEngine:
             text: Text to synthesize
             emotion: Emotion for voice modulation
             voice_id: Voice ID
+            stream: Return the audio as a chunk iterator instead of saving a file
+            output_format: ElevenLabs output format (defaults per mode)
+            model_id: ElevenLabs model ID
 
         Returns:
             Speech synthesis result
@@ -214,23 +462,67 @@ class VoiceEngine:
             # Generate speech
             logger.info(f"Using ElevenLabs with voice: {selected_voice_id}")
 
-            response = self.elevenlabs_client.text_to_speech.convert(
-                text=text,
-                voice_id=selected_voice_id,
-                output_format="mp3_22050_32",
-                voice_settings=voice_settings
-            )
+            selected_format = output_format or (self.stream_output_format if stream else self.file_output_format)
 
-            # Save audio file
-            filename = f"speech_{uuid.uuid4().hex[:8]}.mp3"
-            filepath = os.path.join(self.audio_output_dir, filename)
+            # Parameters shared by every ElevenLabs call for this request
+            tts_request = {
+                'voice_id': selected_voice_id,
+                'model_id': model_id or self.model_id,
+                'output_format': selected_format,
+                'voice_settings': voice_settings
+            }
 
-            with open(filepath, "wb") as f:
-                for chunk in response:
-                    f.write(chunk)
+            if stream:
+                cache_path = self._tts_cache_path(text, emotion, tts_request)
+                if os.path.exists(cache_path):
+                    os.utime(cache_path)
+                    audio_stream = self._read_audio_chunks(cache_path)
+                else:
+                    # Cache the audio as it is relayed to the client
+                    audio_stream = self._write_through(
+                        self._stream_elevenlabs(text, tts_request), cache_path
+                    )
+                return {
+                    'success': True,
+                    'audio_stream': audio_stream,
+                    'output_format': selected_format,
+                    'mimetype': _audio_mimetype(selected_format),
+                    'engine': 'elevenlabs',
+                    'voice_id': selected_voice_id,
+                    'emotion': emotion
+                }
+
+            # Identical requests are served from the speech cache
+            filepath = self._tts_cache_path(text, emotion, tts_request)
+            filename = os.path.relpath(filepath, self.audio_output_dir).replace(os.sep, '/')
+
+            if os.path.exists(filepath):
+                # Refresh recency for least-recently-used eviction
+                os.utime(filepath)
+                logger.info(f"✅ ElevenLabs speech served from cache: {filename}")
+                return {
+                    'success': True,
+                    'filename': filename,
+                    'filepath': filepath,
+                    'duration': self._measure_audio_duration(filepath, text),
+                    'output_format': selected_format,
+                    'mimetype': _audio_mimetype(selected_format),
+                    'engine': 'elevenlabs',
+                    'voice_id': selected_voice_id,
+                    'emotion': emotion,
+                    'cached': True
+                }
 
-            # Get audio duration (approximate)
-            duration = len(text) * 0.08  # Rough estimate: 80ms per character
+            buffer = _SentenceBuffer()
+            sentences = buffer.push(text) + buffer.flush()
+            if len(sentences) > 1 and selected_format.partition('_')[0] in _CONCATENABLE_CODECS:
+                response = self._parallel_synthesize(sentences, tts_request)
+            else:
+                response = self._convert_elevenlabs(text, tts_request)
+
+            # Save audio file
+            for _ in self._write_through(response, filepath):
+                pass
 
             logger.info(f"✅ ElevenLabs speech synthesis complete: {filename}")
 
@@ -238,10 +530,13 @@ class VoiceEngine:
                 'success': True,
                 'filename': filename,
                 'filepath': filepath,
-                'duration': duration,
+                'duration': self._measure_audio_duration(filepath, text),
+                'output_format': selected_format,
+                'mimetype': _audio_mimetype(selected_format),
                 'engine': 'elevenlabs',
                 'voice_id': selected_voice_id,
-                'emotion': emotion
+                'emotion': emotion,
+                'cached': False
             }
 
         except Exception as e:
@@ -253,6 +548,211 @@ class VoiceEngine:
             else:
                 raise
 
+    def _convert_elevenlabs(self, text: str, tts_request: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Synthesize text to audio for a file with ElevenLabs
+
+        Args:
+            text: Text to synthesize
+            tts_request: voice_id, model_id, output_format and voice_settings
+
+        Returns:
+            Iterator of audio chunks in the requested output format
+        """
+        return self.elevenlabs_client.text_to_speech.convert(text=text, **tts_request)
+
+    def _synth_one_sentence(self, sentence: str, tts_request: Dict[str, Any]) -> bytes:
+        """Synthesize one sentence and collect its audio"""
+        return b"".join(self._convert_elevenlabs(sentence, tts_request))
+
+    def _parallel_synthesize(self, sentences: List[str], tts_request: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Synthesize sentences concurrently, yielding their audio in order
+
+        Up to tts_concurrency requests are in flight at once; MP3 frames and
+        raw samples concatenate cleanly, so the pieces form one playable file.
+
+        Args:
+            sentences: Sentences to synthesize
+            tts_request: ElevenLabs parameters; the output format must be one
+                of _CONCATENABLE_CODECS
+
+        Returns:
+            Iterator of each sentence's audio, in submission order
+        """
+        futures = [
+            self._tts_executor.submit(self._synth_one_sentence, sentence, tts_request)
+            for sentence in sentences
+        ]
+        for future in futures:
+            yield future.result()
+
+    def _tts_cache_path(self, text: str, emotion: str, tts_request: Dict[str, Any]) -> str:
+        """
+        Speech cache path for a synthesis request
+
+        Args:
+            text: Text to synthesize
+            emotion: Emotion for voice modulation
+            tts_request: voice_id, model_id and output_format of the request
+
+        Returns:
+            Path named by the SHA-256 of the request, with an extension for its codec
+        """
+        output_format = tts_request['output_format']
+        cache_key = hashlib.sha256(
+            f"{text}|{tts_request['voice_id']}|{emotion}|{output_format}|{tts_request['model_id']}".encode('utf-8')
+        ).hexdigest()
+        return os.path.join(self.tts_cache_dir, f"{cache_key}.{output_format.partition('_')[0]}")
+
+    def _write_through(self, chunks: Iterable[bytes], filepath: str) -> Iterator[bytes]:
+        """
+        Yield audio chunks while saving them to a file
+
+        The file is written under a temporary name and only published once the
+        source is exhausted, so an abandoned stream never leaves a partial file.
+
+        Args:
+            chunks: Audio chunks
+            filepath: Destination file path
+
+        Returns:
+            Iterator over the same chunks
+        """
+        temp_path = f"{filepath}.{self._next_file_token()}.tmp"
+        try:
+            with open(temp_path, "wb", buffering=AUDIO_WRITE_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            # Atomic publish so concurrent readers never see a partial file
+            os.replace(temp_path, filepath)
+            self._count_cached_bytes(os.path.getsize(filepath))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _count_cached_bytes(self, size: int):
+        """
+        Add a newly cached file to the cache size, trimming once it exceeds the budget
+
+        Args:
+            size: Size of the published file in bytes
+        """
+        with self._tts_cache_lock:
+            if self._tts_cache_bytes is not None:
+                self._tts_cache_bytes += size
+                if self._tts_cache_bytes <= self.tts_cache_max_bytes:
+                    return
+            if self._tts_cache_trim_pending:
+                return
+            self._tts_cache_trim_pending = True
+
+        try:
+            self._tts_executor.submit(self._trim_tts_cache)
+        except RuntimeError:
+            # Executor already shut down
+            with self._tts_cache_lock:
+                self._tts_cache_trim_pending = False
+
+    def _trim_tts_cache(self):
+        """Evict least recently used cached speech beyond the byte budget"""
+        try:
+            with os.scandir(self.tts_cache_dir) as entries:
+                cached = sorted(
+                    (entry for entry in entries
+                     if entry.is_file(follow_symlinks=False) and not entry.name.endswith('.tmp')),
+                    key=lambda entry: entry.stat().st_atime
+                )
+            cache_bytes = sum(entry.stat().st_size for entry in cached)
+            for entry in cached:
+                if cache_bytes <= self.tts_cache_max_bytes:
+                    break
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                cache_bytes -= entry.stat().st_size
+                logger.debug(f"Evicted cached speech: {entry.name}")
+
+            with self._tts_cache_lock:
+                self._tts_cache_bytes = cache_bytes
+        except Exception as e:
+            logger.error(f"Failed to trim speech cache: {str(e)}")
+        finally:
+            with self._tts_cache_lock:
+                self._tts_cache_trim_pending = False
+
+    def _read_audio_chunks(self, filepath: str) -> Iterator[bytes]:
+        """Yield a saved audio file in AUDIO_WRITE_BUFFER_SIZE chunks"""
+        with open(filepath, "rb") as f:
+            while True:
+                chunk = f.read(AUDIO_WRITE_BUFFER_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def synthesize_stream(self, text_iter: Iterable[str], emotion: str = "caring",
+                          voice_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Synthesize speech from text that is still being generated
+
+        Tokens are regrouped into sentences and sent to ElevenLabs as each
+        sentence completes, so synthesis overlaps with text generation.
+
+        Args:
+            text_iter: Iterable of text tokens, e.g. from a streaming LLM
+            emotion: Emotion for voice modulation
+            voice_id: Voice ID
+
+        Returns:
+            Speech synthesis result with an 'audio_stream' iterator of audio bytes
+        """
+        if not self.elevenlabs_client:
+            return {
+                'success': False,
+                'error': 'Streaming synthesis requires ElevenLabs'
+            }
+
+        selected_voice_id = voice_id or self.default_voice_id
+        audio_stream = self.elevenlabs_client.text_to_speech.convert_realtime(
+            voice_id=selected_voice_id,
+            text=_iter_sentences(text_iter),
+            model_id=self.model_id,
+            output_format=self.stream_output_format,
+            voice_settings=self._get_voice_settings_for_emotion(emotion)
+        )
+
+        return {
+            'success': True,
+            'audio_stream': audio_stream,
+            'output_format': self.stream_output_format,
+            'mimetype': _audio_mimetype(self.stream_output_format),
+            'engine': 'elevenlabs',
+            'voice_id': selected_voice_id,
+            'emotion': emotion
+        }
+
+    def _stream_elevenlabs(self, text: str, tts_request: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Stream synthesized audio from ElevenLabs
+
+        Args:
+            text: Text to synthesize
+            tts_request: voice_id, model_id, output_format and voice_settings
+
+        Returns:
+            Iterator of audio chunks in the requested output format, yielded as they arrive
+        """
+        tts = self.elevenlabs_client.text_to_speech
+        # Newer SDKs renamed convert_as_stream to stream
+        stream = getattr(tts, 'convert_as_stream', None) or tts.stream
+        return stream(
+            text=text,
+            optimize_streaming_latency=self.optimize_streaming_latency,
+            **tts_request
+        )
+
     def _synthesize_with_pyttsx3(self, text: str, emotion: str = "caring") -> Dict[str, Any]:
         """
         Synthesize speech using pyttsx3
@@ -268,21 +768,12 @@ class VoiceEngine:
             if not self.pyttsx3_engine:
                 raise Exception("pyttsx3 engine not initialized")
 
-            # Adjust voice properties based on emotion
-            self._set_pyttsx3_emotion_properties(emotion)
-
             # Generate filename
-            filename = f"speech_{uuid.uuid4().hex[:8]}.mp3"
+            filename = f"speech_{self._next_file_token()}.mp3"
             filepath = os.path.join(self.audio_output_dir, filename)
 
-            # Save to file
-            self.pyttsx3_engine.save_to_file(text, filepath)
-            self.pyttsx3_engine.runAndWait()
-
-            # Get approximate duration
-            words_per_minute = self.pyttsx3_engine.getProperty('rate') / 10
-            word_count = len(text.split())
-            duration = (word_count / words_per_minute) * 60 if words_per_minute > 0 else len(text) * 0.08
+            # Concurrent requests queue here rather than racing the engine's run loop
+            self._pyttsx3_executor.submit(self._render_pyttsx3, text, emotion, filepath).result()
 
             logger.info(f"✅ pyttsx3 speech synthesis complete: {filename}")
 
@@ -290,7 +781,7 @@ class VoiceEngine:
                 'success': True,
                 'filename': filename,
                 'filepath': filepath,
-                'duration': duration,
+                'duration': self._measure_audio_duration(filepath, text),
                 'engine': 'pyttsx3',
                 'emotion': emotion
             }
@@ -299,7 +790,57 @@ class VoiceEngine:
             logger.error(f"❌ pyttsx3 synthesis failed: {str(e)}")
             raise
 
-    def _get_voice_settings_for_emotion(self, emotion: str) -> VoiceSettings:
+    def _create_pyttsx3(self) -> tuple:
+        """
+        Create the pyttsx3 engine; runs on the pyttsx3 worker thread
+
+        Returns:
+            (engine, voices) - enumerating system voices is slow, so it is done once
+        """
+        engine = pyttsx3.init()
+        return engine, engine.getProperty('voices') or []
+
+    def _get_pyttsx3_properties(self) -> tuple:
+        """Read the current (rate, volume); runs on the pyttsx3 worker thread"""
+        return self.pyttsx3_engine.getProperty('rate'), self.pyttsx3_engine.getProperty('volume')
+
+    def _render_pyttsx3(self, text: str, emotion: str, filepath: str):
+        """
+        Render speech to a file with pyttsx3; runs on the pyttsx3 worker thread
+
+        Args:
+            text: Text to synthesize
+            emotion: Emotion for voice modulation
+            filepath: Output file path
+        """
+        # Adjust voice properties based on emotion
+        self._set_pyttsx3_emotion_properties(emotion)
+
+        # Save to file
+        self.pyttsx3_engine.save_to_file(text, filepath)
+        self.pyttsx3_engine.runAndWait()
+
+    def _measure_audio_duration(self, filepath: str, text: str) -> float:
+        """
+        Get the duration of a saved audio file
+
+        Args:
+            filepath: Audio file path
+            text: Text that was synthesized, for the fallback estimate
+
+        Returns:
+            Duration in seconds from the file header, or roughly 80ms per
+            character when soundfile is unavailable or cannot read the file
+        """
+        if _has_soundfile():
+            try:
+                info = sf.info(filepath)
+                return info.frames / info.samplerate
+            except Exception as e:
+                logger.debug(f"Could not read audio duration from {filepath}: {str(e)}")
+        return len(text) * 0.08
+
+    def _get_voice_settings_for_emotion(self, emotion: str) -> "VoiceSettings":
         """
         Get voice settings for specific emotion
 
@@ -309,40 +850,8 @@ class VoiceEngine:
         Returns:
             VoiceSettings object
         """
-        # Default settings
-        stability = 0.75
-        similarity_boost = 0.75
-        style = 0.5
-        use_speaker_boost = True
-
-        # Adjust based on emotion
-        if emotion == "caring":
-            stability = 0.85
-            similarity_boost = 0.8
-            style = 0.6
-        elif emotion == "empathetic":
-            stability = 0.7
-            similarity_boost = 0.75
-            style = 0.7
-        elif emotion == "calm":
-            stability = 0.9
-            similarity_boost = 0.7
-            style = 0.3
-        elif emotion == "encouraging":
-            stability = 0.6
-            similarity_boost = 0.8
-            style = 0.8
-        elif emotion == "concerned":
-            stability = 0.65
-            similarity_boost = 0.7
-            style = 0.6
-
-        return VoiceSettings(
-            stability=stability,
-            similarity_boost=similarity_boost,
-            style=style,
-            use_speaker_boost=use_speaker_boost
-        )
+        table, default = _emotion_voice_settings()
+        return table.get(emotion, default)
 
     def _set_pyttsx3_emotion_properties(self, emotion: str):
         """
@@ -354,26 +863,7 @@ class VoiceEngine:
         if not self.pyttsx3_engine:
             return
 
-        # Default properties
-        rate = 200
-        volume = 0.9
-
-        # Adjust based on emotion
-        if emotion == "caring":
-            rate = 180
-            volume = 0.85
-        elif emotion == "empathetic":
-            rate = 170
-            volume = 0.8
-        elif emotion == "calm":
-            rate = 160
-            volume = 0.75
-        elif emotion == "encouraging":
-            rate = 220
-            volume = 0.95
-        elif emotion == "concerned":
-            rate = 175
-            volume = 0.8
+        rate, volume = _EMOTION_PYTTSX3.get(emotion, _DEFAULT_PYTTSX3)
 
         # Set properties
         self.pyttsx3_engine.setProperty('rate', rate)
@@ -394,7 +884,7 @@ class VoiceEngine:
         # pyttsx3 voices
         if self.pyttsx3_engine:
             try:
-                pyttsx3_voices = self.pyttsx3_engine.getProperty('voices')
+                pyttsx3_voices = self.pyttsx3_voices
                 voices_info['pyttsx3'] = [
                     {
                         'id': voice.id,
@@ -411,7 +901,7 @@ class VoiceEngine:
         # ElevenLabs voices
         if self.elevenlabs_client:
             try:
-                elevenlabs_voices = list(self.elevenlabs_client.voices.get_all())
+                elevenlabs_voices = self._get_elevenlabs_voices()
                 voices_info['elevenlabs'] = [
                     {
                         'id': voice.voice_id,
@@ -427,25 +917,48 @@ class VoiceEngine:
 
         return voices_info
 
+    def _next_file_token(self) -> str:
+        """Unique file name token: a process-local sequence plus random bits across restarts"""
+        return f"{next(self._file_seq):08x}_{secrets.token_hex(4)}"
+
+    def _get_elevenlabs_voices(self) -> List[Any]:
+        """
+        Get ElevenLabs voices, reusing the last fetch within the TTL
+
+        Returns:
+            List of ElevenLabs voice objects
+        """
+        now = time.monotonic()
+        if self._voices_cache is None or now - self._voices_cache_ts >= self._voices_cache_ttl:
+            response = self.elevenlabs_client.voices.get_all()
+            # The SDK returns a GetVoicesResponse wrapping the list
+            self._voices_cache = list(getattr(response, 'voices', response))
+            self._voices_cache_ts = now
+        return self._voices_cache
+
     def cleanup_old_files(self, max_age_hours: int = 24):
         """
-        Clean up old audio files
+        Clean up old audio files and trim the speech cache to its byte budget
 
         Args:
             max_age_hours: Maximum age of files in hours
         """
         try:
-            import time
             current_time = time.time()
             max_age_seconds = max_age_hours * 3600
 
-            for filename in os.listdir(self.audio_output_dir):
-                filepath = os.path.join(self.audio_output_dir, filename)
-                if os.path.isfile(filepath):
-                    file_age = current_time - os.path.getmtime(filepath)
-                    if file_age > max_age_seconds:
-                        os.remove(filepath)
-                        logger.debug(f"Removed old audio file: {filename}")
+            # DirEntry caches its stat, so each file costs one stat call at most
+            with os.scandir(self.audio_output_dir) as entries:
+                expired = [
+                    entry for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                    and current_time - entry.stat().st_mtime > max_age_seconds
+                ]
+            for entry in expired:
+                os.remove(entry.path)
+                logger.debug(f"Removed old audio file: {entry.name}")
+
+            self._trim_tts_cache()
 
         except Exception as e:
             logger.error(f"Failed to cleanup old audio files: {str(e)}")
@@ -466,11 +979,11 @@ class VoiceEngine:
         if self.pyttsx3_engine:
             info['engines_available'].append('pyttsx3')
             try:
-                voices = self.pyttsx3_engine.getProperty('voices')
+                rate, volume = self._pyttsx3_executor.submit(self._get_pyttsx3_properties).result()
                 info['pyttsx3'] = {
-                    'voice_count': len(voices) if voices else 0,
-                    'current_rate': self.pyttsx3_engine.getProperty('rate'),
-                    'current_volume': self.pyttsx3_engine.getProperty('volume')
+                    'voice_count': len(self.pyttsx3_voices),
+                    'current_rate': rate,
+                    'current_volume': volume
                 }
             except:
                 info['pyttsx3'] = {'error': 'Failed to get properties'}
@@ -482,4 +995,24 @@ class VoiceEngine:
                 'api_configured': bool(self.elevenlabs_api_key)
             }
 
-        return info
\ No newline at end of file
+        return info
+
+_voice_engine_singleton: Optional[VoiceEngine] = None
+_voice_engine_lock = threading.Lock()
+
+def get_voice_engine(**kwargs) -> VoiceEngine:
+    """
+    Get the process-wide Voice Engine, creating it on first use
+
+    Args:
+        **kwargs: VoiceEngine arguments, used only by the call that creates it
+
+    Returns:
+        Shared VoiceEngine instance
+    """
+    global _voice_engine_singleton
+    if _voice_engine_singleton is None:
+        with _voice_engine_lock:
+            if _voice_engine_singleton is None:
+                _voice_engine_singleton = VoiceEngine(**kwargs)
+    return _voice_engine_singleton
@@ -3,68 +3,139 @@ Configuration management for Sakhi AI
 """
 
 import os
-from typing import Dict, Any
+import logging
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Typed application settings, parsed from the environment once by Config.init_app"""
+
+    # Flask Configuration
+    secret_key: str
+    flask_env: str
+    flask_debug: bool
+
+    # Database Configuration
+    database_url: str
+
+    # API Configuration
+    api_host: str
+    api_port: int
+    api_prefix: str
+
+    # File Upload Configuration
+    upload_folder: str
+    max_content_length: int
+    use_x_sendfile: bool
+
+    # AI Model Configuration
+    google_api_key: Optional[str]
+    openai_api_key: Optional[str]
+    elevenlabs_api_key: Optional[str]
+    elevenlabs_voice_id: str
+    tts_engine: str
+    elevenlabs_output_format: str
+    elevenlabs_file_format: str
+    elevenlabs_model_id: str
+    elevenlabs_latency_mode: int
+    tts_concurrency: int
+    tts_cache_dir: str
+    tts_cache_max_bytes: int
+
+    # RAG Configuration
+    chroma_persist_directory: str
+    chroma_collection_name: str
+    embedding_model: str
+
+    # Mental Health Assessment Configuration
+    assessment_model_path: str
+    sentiment_model_path: str
+
+    # Logging Configuration
+    log_level: str
+    log_file: str
+
+    # Security Configuration
+    cors_origins: List[str]
+    rate_limit_per_minute: int
+
+    # Feature Flags
+    enable_voice_recognition: bool
+    enable_face_emotion_detection: bool
+    enable_document_upload: bool
+    enable_rag_system: bool
+    enable_mental_health_assessment: bool
 
 class Config:
     """Configuration class for Sakhi AI application"""
 
-    _app_config = {}
+    _instance: Optional[AppConfig] = None
 
     @classmethod
     def init_app(cls, app):
         """Initialize Flask app with configuration"""
-        cls._app_config = {
+        cls._instance = AppConfig(
             # Flask Configuration
-            'SECRET_KEY': os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production'),
-            'FLASK_ENV': os.getenv('FLASK_ENV', 'development'),
-            'FLASK_DEBUG': os.getenv('FLASK_DEBUG', 'True').lower() == 'true',
+            secret_key=os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production'),
+            flask_env=os.getenv('FLASK_ENV', 'development'),
+            flask_debug=os.getenv('FLASK_DEBUG', 'True').lower() == 'true',
 
             # Database Configuration
-            'DATABASE_URL': os.getenv('DATABASE_URL', 'sqlite:///sakhi_ai.db'),
+            database_url=os.getenv('DATABASE_URL', 'sqlite:///sakhi_ai.db'),
 
             # API Configuration
-            'API_HOST': os.getenv('API_HOST', '0.0.0.0'),
-            'API_PORT': int(os.getenv('API_PORT', '5000')),
-            'API_PREFIX': os.getenv('API_PREFIX', '/api/v1'),
+            api_host=os.getenv('API_HOST', '0.0.0.0'),
+            api_port=int(os.getenv('API_PORT', '5000')),
+            api_prefix=os.getenv('API_PREFIX', '/api/v1'),
 
             # File Upload Configuration
-            'UPLOAD_FOLDER': os.getenv('UPLOAD_FOLDER', 'uploads'),
-            'MAX_CONTENT_LENGTH': int(os.getenv('MAX_CONTENT_LENGTH', '16777216')),  # 16MB
+            upload_folder=os.getenv('UPLOAD_FOLDER', 'uploads'),
+            max_content_length=int(os.getenv('MAX_CONTENT_LENGTH', '16777216')),  # 16MB
+            # Let a fronting nginx/Apache send audio files itself (X-Sendfile)
+            use_x_sendfile=os.getenv('USE_X_SENDFILE', 'False').lower() == 'true',
 
             # AI Model Configuration
-            'GOOGLE_API_KEY': os.getenv('GOOGLE_API_KEY'),
-            'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY'),
-            'ELEVENLABS_API_KEY': os.getenv('ELEVENLABS_API_KEY'),
-            'ELEVENLABS_VOICE_ID': os.getenv('ELEVENLABS_VOICE_ID', 'Rachel'),
-            'TTS_ENGINE': os.getenv('TTS_ENGINE', 'pyttsx3'),
+            google_api_key=os.getenv('GOOGLE_API_KEY'),
+            openai_api_key=os.getenv('OPENAI_API_KEY'),
+            elevenlabs_api_key=os.getenv('ELEVENLABS_API_KEY'),
+            elevenlabs_voice_id=os.getenv('ELEVENLABS_VOICE_ID', 'Rachel'),
+            tts_engine=os.getenv('TTS_ENGINE', 'pyttsx3'),
+            elevenlabs_output_format=os.getenv('ELEVENLABS_OUTPUT_FORMAT', 'pcm_16000'),
+            elevenlabs_file_format=os.getenv('ELEVENLABS_FILE_FORMAT', 'mp3_22050_32'),
+            elevenlabs_model_id=os.getenv('ELEVENLABS_MODEL_ID', 'eleven_turbo_v2_5'),
+            elevenlabs_latency_mode=int(os.getenv('ELEVENLABS_LATENCY_MODE', '3')),
+            tts_concurrency=int(os.getenv('TTS_CONCURRENCY', '3')),
+            tts_cache_dir=os.getenv('TTS_CACHE_DIR', 'cache'),
+            tts_cache_max_bytes=int(os.getenv('TTS_CACHE_MAX_BYTES', str(256 * 1024 * 1024))),
 
             # RAG Configuration
-            'CHROMA_PERSIST_DIRECTORY': os.getenv('CHROMA_PERSIST_DIRECTORY', './chroma_db'),
-            'CHROMA_COLLECTION_NAME': os.getenv('CHROMA_COLLECTION_NAME', 'sakhi_medical_docs'),
-            'EMBEDDING_MODEL': os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
+            chroma_persist_directory=os.getenv('CHROMA_PERSIST_DIRECTORY', './chroma_db'),
+            chroma_collection_name=os.getenv('CHROMA_COLLECTION_NAME', 'sakhi_medical_docs'),
+            embedding_model=os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
 
             # Mental Health Assessment Configuration
-            'ASSESSMENT_MODEL_PATH': os.getenv('ASSESSMENT_MODEL_PATH', './models/mental_health_classifier.joblib'),
-            'SENTIMENT_MODEL_PATH': os.getenv('SENTIMENT_MODEL_PATH', './models/sentiment_analyzer.joblib'),
+            assessment_model_path=os.getenv('ASSESSMENT_MODEL_PATH', './models/mental_health_classifier.joblib'),
+            sentiment_model_path=os.getenv('SENTIMENT_MODEL_PATH', './models/sentiment_analyzer.joblib'),
 
             # Logging Configuration
-            'LOG_LEVEL': os.getenv('LOG_LEVEL', 'INFO'),
-            'LOG_FILE': os.getenv('LOG_FILE', './logs/sakhi_ai.log'),
+            log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            log_file=os.getenv('LOG_FILE', './logs/sakhi_ai.log'),
 
             # Security Configuration
-            'CORS_ORIGINS': os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:3001,http://localhost:8050').split(','),
-            'RATE_LIMIT_PER_MINUTE': int(os.getenv('RATE_LIMIT_PER_MINUTE', '60')),
+            cors_origins=os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:3001,http://localhost:8050').split(','),
+            rate_limit_per_minute=int(os.getenv('RATE_LIMIT_PER_MINUTE', '60')),
 
             # Feature Flags
-            'ENABLE_VOICE_RECOGNITION': os.getenv('ENABLE_VOICE_RECOGNITION', 'True').lower() == 'true',
-            'ENABLE_FACE_EMOTION_DETECTION': os.getenv('ENABLE_FACE_EMOTION_DETECTION', 'True').lower() == 'true',
-            'ENABLE_DOCUMENT_UPLOAD': os.getenv('ENABLE_DOCUMENT_UPLOAD', 'True').lower() == 'true',
-            'ENABLE_RAG_SYSTEM': os.getenv('ENABLE_RAG_SYSTEM', 'True').lower() == 'true',
-            'ENABLE_MENTAL_HEALTH_ASSESSMENT': os.getenv('ENABLE_MENTAL_HEALTH_ASSESSMENT', 'True').lower() == 'true',
-        }
+            enable_voice_recognition=os.getenv('ENABLE_VOICE_RECOGNITION', 'True').lower() == 'true',
+            enable_face_emotion_detection=os.getenv('ENABLE_FACE_EMOTION_DETECTION', 'True').lower() == 'true',
+            enable_document_upload=os.getenv('ENABLE_DOCUMENT_UPLOAD', 'True').lower() == 'true',
+            enable_rag_system=os.getenv('ENABLE_RAG_SYSTEM', 'True').lower() == 'true',
+            enable_mental_health_assessment=os.getenv('ENABLE_MENTAL_HEALTH_ASSESSMENT', 'True').lower() == 'true'
+        )
 
         # Update Flask app config
-        app.config.update(cls._app_config)
+        app.config.update({key.upper(): value for key, value in asdict(cls._instance).items()})
 
         # Create necessary directories
         cls._create_directories()
@@ -72,25 +143,32 @@ class Config:
     @classmethod
     def get(cls, key: str, default=None):
         """Get configuration value"""
-        return cls._app_config.get(key, default)
+        return getattr(cls._instance, key.lower(), default)
 
     @classmethod
     def _create_directories(cls):
         """Create necessary directories if they don't exist"""
-        directories = [
-            cls.get('UPLOAD_FOLDER'),
-            os.path.dirname(cls.get('LOG_FILE')),
-            cls.get('CHROMA_PERSIST_DIRECTORY'),
-            os.path.dirname(cls.get('ASSESSMENT_MODEL_PATH')),
-            os.path.dirname(cls.get('SENTIMENT_MODEL_PATH')),
-            'static/audio',
-            'templates',
-            'logs'
-        ]
-
-        for directory in directories:
-            if directory and not os.path.exists(directory):
+        directories = {
+            os.path.normpath(directory)
+            for directory in (
+                cls.get('UPLOAD_FOLDER'),
+                os.path.dirname(cls.get('LOG_FILE')),
+                cls.get('CHROMA_PERSIST_DIRECTORY'),
+                os.path.dirname(cls.get('ASSESSMENT_MODEL_PATH')),
+                os.path.dirname(cls.get('SENTIMENT_MODEL_PATH')),
+                'static/audio',
+                'templates',
+                'logs'
+            )
+            if directory
+        }
+
+        # Parents sort before their children; exist_ok makes a separate existence check unnecessary
+        try:
+            for directory in sorted(directories):
                 os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            logging.error(f"Failed to create directories: {str(e)}")
 
     @classmethod
     def validate_config(cls) -> Dict[str, Any]:
@@ -4,13 +4,240 @@ Database management for Sakhi AI
 
 import sqlite3
 import json
+import logging
 import os
+import queue
+import time
+import atexit
+import threading
+import zlib
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
+
+# Fast JSON (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logging.warning("orjson not available. Install with: pip install orjson")
+
+# Chat text compression (optional, zlib otherwise)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+    logging.warning("zstandard not available. Install with: pip install zstandard")
+
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Applied to every connection: WAL lets readers proceed during a save, and with
+# synchronous=NORMAL a commit no longer waits on fsync of the journal
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA foreign_keys=ON',
+)
+
+if HAS_ORJSON:
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string with orjson, accepting non-string keys and NumPy values"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+    json_loads = orjson.loads
+else:
+    def _json_default(obj: Any) -> Any:
+        """Convert NumPy scalars and arrays, which json cannot encode, to Python values"""
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string with json, accepting NumPy values"""
+        return json.dumps(obj, default=_json_default)
+
+    json_loads = json.loads
+
+# Chat text at least this long is stored as a compressed BLOB whose first byte
+# tags the codec; shorter text stays plain TEXT, as do rows written before
+COMPRESS_MIN_CHARS = 512
+ZSTD_LEVEL = 3
+_ZSTD_TAG = b'\x01'
+_ZLIB_TAG = b'\x02'
+
+# zstandard contexts are not safe to share between threads
+_codec_state = threading.local()
+
+def _zstd_contexts() -> Any:
+    """Get this thread's (compressor, decompressor) pair, creating it on first use"""
+    contexts = getattr(_codec_state, 'zstd', None)
+    if contexts is None:
+        contexts = _codec_state.zstd = (
+            zstandard.ZstdCompressor(level=ZSTD_LEVEL),
+            zstandard.ZstdDecompressor()
+        )
+    return contexts
+
+def pack_text(text: Optional[str]) -> Any:
+    """
+    Compress long text for storage
+
+    Args:
+        text: Text to store
+
+    Returns:
+        Tagged compressed bytes, or the text itself if short or incompressible
+    """
+    if text is None or len(text) < COMPRESS_MIN_CHARS:
+        return text
+    raw = text.encode('utf-8')
+    if HAS_ZSTD:
+        packed = _ZSTD_TAG + _zstd_contexts()[0].compress(raw)
+    else:
+        packed = _ZLIB_TAG + zlib.compress(raw)
+    return packed if len(packed) < len(raw) else text
+
+def unpack_text(value: Any) -> Optional[str]:
+    """
+    Reverse pack_text
+
+    Args:
+        value: Stored column value
+
+    Returns:
+        Original text
+    """
+    if not isinstance(value, bytes):
+        return value
+    tag, payload = value[:1], value[1:]
+    if tag == _ZLIB_TAG:
+        return zlib.decompress(payload).decode('utf-8')
+    if tag == _ZSTD_TAG:
+        if not HAS_ZSTD:
+            raise RuntimeError("zstandard is required to read this session: pip install zstandard")
+        return _zstd_contexts()[1].decompress(payload).decode('utf-8')
+    raise ValueError(f"Unknown stored text tag: {tag!r}")
+
+def epoch_millis(value: Any = None) -> Any:
+    """
+    Convert a session timestamp to Unix epoch milliseconds for storage
+
+    Args:
+        value: datetime or ISO-format string; None for now
+
+    Returns:
+        Epoch milliseconds, or the value unchanged if it is not a timestamp
+    """
+    if value is None:
+        return time.time_ns() // 1_000_000
+    if isinstance(value, str):
+        try:
+            return int(datetime.fromisoformat(value).timestamp() * 1000)
+        except ValueError:
+            return value
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return value
+
+def millis_to_iso(value: Any) -> Any:
+    """
+    Convert stored epoch milliseconds back to an ISO-format string
+
+    Args:
+        value: Stored column value
+
+    Returns:
+        ISO-format local time, or the value unchanged if it is not an integer
+    """
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value / 1000).isoformat()
+    return value
+
+# Keys with their own columns; any other keys of a document or chat message are
+# kept in its metadata column so load_session can rebuild the original dict
+_DOCUMENT_COLUMNS = frozenset({'id', 'filename', 'upload_date', 'pages', 'chunks'})
+_CHAT_COLUMNS = frozenset({'role', 'content', 'timestamp', 'sources', 'rag_enabled'})
+
+# Columns of a get_session_list entry, in SELECT order
+_SESSION_SUMMARY_FIELDS = ('id', 'created_at', 'updated_at', 'chat_history_count',
+                           'documents_count', 'emotions_count', 'assessments_count')
+
+_SQL_SESSION_LIST = f'''
+    SELECT {', '.join(_SESSION_SUMMARY_FIELDS)}
+    FROM sessions
+    ORDER BY updated_at DESC
+    LIMIT ?
+'''
+
+# Per-session child tables, each keyed by (session_id, seq)
+CHILD_TABLES = ('documents', 'emotions', 'assessments', 'chat_history')
+
+# Connections kept open and shared by all threads; WAL lets them read concurrently
+POOL_SIZE = 4
+
+# How long get_database_stats reuses the database file size
+DB_SIZE_TTL_SECONDS = 5.0
+
+# Prepared statements each pooled connection keeps compiled, keyed by SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Group commit: the writer thread folds saves queued within this window, up
+# to this many, into one transaction so they share a single commit
+GROUP_COMMIT_WINDOW_SECONDS = 0.005
+GROUP_COMMIT_MAX_SAVES = 64
+
+# Statements issued on every save, kept as constants so each call passes the
+# same SQL text and hits the connection's statement cache
+_SQL_SESSION_SAVE_STATE = '''
+    SELECT data IS NOT NULL, documents_count, emotions_count, assessments_count, chat_history_count
+    FROM sessions WHERE id = ?
+'''
+
+_SQL_UPSERT_SESSION = '''
+    INSERT INTO sessions
+    (id, created_at, updated_at, chat_history_count, documents_count, emotions_count, assessments_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at,
+        data = NULL,
+        chat_history_count = excluded.chat_history_count,
+        documents_count = excluded.documents_count,
+        emotions_count = excluded.emotions_count,
+        assessments_count = excluded.assessments_count
+'''
+
+_SQL_INSERT_DOCUMENT = '''
+    INSERT INTO documents (session_id, seq, id, filename, upload_date, pages, chunks, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_EMOTION = '''
+    INSERT INTO emotions (session_id, seq, emotion, confidence, emotion_type, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_ASSESSMENT = '''
+    INSERT INTO assessments (session_id, seq, id, assessment_type, score, category, recommendations, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_CHAT = '''
+    INSERT INTO chat_history (session_id, seq, role, content, timestamp, sources, rag_enabled, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_DELETE_SESSION_ROWS = {
+    table: f'DELETE FROM {table} WHERE session_id = ?' for table in CHILD_TABLES
+}
+
 class DatabaseManager:
     """SQLite database manager for Sakhi AI"""
 
@@ -24,25 +251,140 @@ class DatabaseManager:
         self.database_url = database_url
         self.db_path = database_url.replace('sqlite:///', '')
         self._ensure_db_directory()
+        self._db_size = (0.0, 0)  # (expires at, size in bytes)
+
+        # Reused connections, so calls skip reopening the database and its WAL files
+        self._pool = queue.Queue(maxsize=POOL_SIZE)
+        for _ in range(POOL_SIZE):
+            self._pool.put(self._connect())
+
+        # Background saves run on a single writer thread, so request threads
+        # neither wait on the commit nor contend for the lock
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name='db-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self._stop_writer)
 
     def _ensure_db_directory(self):
         """Ensure database directory exists"""
         db_dir = os.path.dirname(self.db_path)
-        if db_dir and not os.path.exists(db_dir):
+        if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a pool connection in autocommit mode with CONNECTION_PRAGMAS applied"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection, waiting if all are in use"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements as one write transaction, rolled back on error"""
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+                conn.execute('COMMIT')
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+
+    def _write_loop(self):
+        """Commit queued saves in batches, in order, until the stop sentinel arrives"""
+        stopping = False
+        while not stopping:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            batch = [item]
+
+            # Gather whatever else is queued within the group commit window
+            deadline = time.monotonic() + GROUP_COMMIT_WINDOW_SECONDS
+            while len(batch) < GROUP_COMMIT_MAX_SAVES:
+                try:
+                    item = self._write_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[Any]):
+        """
+        Write a batch of queued saves in one transaction and resolve their futures
+
+        Each save runs under its own savepoint, so a failing session is rolled
+        back alone and the rest of the batch still commits.
+
+        Args:
+            batch: (session_data, future) pairs taken from the write queue
+        """
+        pending = [(session_data, future) for session_data, future in batch
+                   if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+
+        results = []
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                for session_data, _ in pending:
+                    cursor.execute('SAVEPOINT session_save')
+                    try:
+                        self._write_session(cursor, session_data)
+                        results.append(True)
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO session_save')
+                        logger.error("Failed to save session: %s", e)
+                        results.append(False)
+                    cursor.execute('RELEASE session_save')
+            logger.debug("Committed %s queued session saves", len(pending))
+        except Exception as e:
+            logger.error("Failed to commit queued session saves: %s", e)
+            results = [False] * len(pending)
+
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+    def _stop_writer(self):
+        """Finish queued writes and stop the writer thread"""
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+
+    def close(self):
+        """Finish queued writes and close all pooled connections"""
+        self._stop_writer()
+        for _ in range(POOL_SIZE):
+            self._pool.get().close()
+
     def init_db(self):
         """Initialize database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
                 # Sessions table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS sessions (
                         id TEXT PRIMARY KEY,
-                        created_at TIMESTAMP,
-                        updated_at TIMESTAMP,
+                        created_at INTEGER,
+                        updated_at INTEGER,
                         data TEXT,
                         chat_history_count INTEGER DEFAULT 0,
                         documents_count INTEGER DEFAULT 0,
@@ -51,77 +393,166 @@ class DatabaseManager:
                     )
                 ''')
 
+                # Child tables are clustered by (session_id, seq): a session's rows
+                # sit together in list order, and the primary key doubles as the
+                # session index, and deleting a session cascades to them. Tables
+                # from an older layout are moved aside first.
+                legacy_tables = self._rename_outdated_tables(cursor)
+                self._convert_session_timestamps(cursor)
+
                 # Documents table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS documents (
-                        id TEXT PRIMARY KEY,
-                        session_id TEXT,
+                        session_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        id TEXT,
                         filename TEXT,
                         upload_date TIMESTAMP,
                         file_size INTEGER,
                         pages INTEGER,
                         chunks INTEGER,
                         metadata TEXT,
-                        FOREIGN KEY (session_id) REFERENCES sessions (id)
-                    )
+                        PRIMARY KEY (session_id, seq),
+                        FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+                    ) WITHOUT ROWID
                 ''')
 
                 # Emotions table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS emotions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        session_id TEXT,
+                        session_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
                         emotion TEXT,
                         confidence REAL,
                         emotion_type TEXT,
                         timestamp TIMESTAMP,
-                        FOREIGN KEY (session_id) REFERENCES sessions (id)
-                    )
+                        PRIMARY KEY (session_id, seq),
+                        FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+                    ) WITHOUT ROWID
                 ''')
 
                 # Assessments table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS assessments (
-                        id TEXT PRIMARY KEY,
-                        session_id TEXT,
+                        session_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        id TEXT,
                         assessment_type TEXT,
                         score REAL,
                         category TEXT,
                         recommendations TEXT,
                         timestamp TIMESTAMP,
-                        FOREIGN KEY (session_id) REFERENCES sessions (id)
-                    )
+                        PRIMARY KEY (session_id, seq),
+                        FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+                    ) WITHOUT ROWID
                 ''')
 
                 # Chat history table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS chat_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        session_id TEXT,
+                        session_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
                         role TEXT,
                         content TEXT,
                         timestamp TIMESTAMP,
                         sources TEXT,
                         rag_enabled BOOLEAN,
                         metadata TEXT,
-                        FOREIGN KEY (session_id) REFERENCES sessions (id)
-                    )
+                        PRIMARY KEY (session_id, seq),
+                        FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+                    ) WITHOUT ROWID
                 ''')
 
-                # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_id ON sessions (id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_documents_session_id ON documents (session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_emotions_session_id ON emotions (session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_assessments_session_id ON assessments (session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_chat_history_session_id ON chat_history (session_id)')
+                self._copy_legacy_rows(cursor, legacy_tables)
+
+                # Covering index for get_session_list: newest sessions first, with
+                # every selected column, so listing never touches the table or sorts.
+                # Lookups by id use the primary key, making idx_sessions_id redundant.
+                cursor.execute('DROP INDEX IF EXISTS idx_sessions_id')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (
+                        updated_at DESC, id, created_at, chat_history_count,
+                        documents_count, emotions_count, assessments_count
+                    )
+                ''')
 
-                conn.commit()
                 logger.info("✅ Database initialized successfully")
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize database: {str(e)}")
+            logger.error("❌ Failed to initialize database: %s", e)
             raise
 
+    def _convert_session_timestamps(self, cursor: sqlite3.Cursor):
+        """
+        Rewrite session timestamps stored as text to epoch milliseconds
+
+        Args:
+            cursor: Cursor inside the init transaction
+        """
+        rows = cursor.execute('''
+            SELECT id, created_at, updated_at FROM sessions
+            WHERE typeof(created_at) = 'text' OR typeof(updated_at) = 'text'
+        ''').fetchall()
+        if not rows:
+            return
+
+        # Values that do not parse are kept as they are
+        cursor.executemany(
+            'UPDATE sessions SET created_at = ?, updated_at = ? WHERE id = ?',
+            [(epoch_millis(created_at), epoch_millis(updated_at), session_id)
+             for session_id, created_at, updated_at in rows]
+        )
+        logger.info("Converted timestamps of %s sessions to epoch milliseconds", len(rows))
+
+    def _rename_outdated_tables(self, cursor: sqlite3.Cursor) -> List[str]:
+        """
+        Move child tables without the (session_id, seq) key or the cascading
+        session foreign key aside as <table>_legacy
+
+        Args:
+            cursor: Cursor inside the init transaction
+
+        Returns:
+            Names of the tables that were moved
+        """
+        renamed = []
+        for table in CHILD_TABLES:
+            columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table})')]
+            if not columns:
+                continue
+            on_delete = [row[6] for row in cursor.execute(f'PRAGMA foreign_key_list({table})')]
+            if 'seq' not in columns or on_delete != ['CASCADE']:
+                cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+                renamed.append(table)
+        return renamed
+
+    def _copy_legacy_rows(self, cursor: sqlite3.Cursor, tables: List[str]):
+        """
+        Copy rows of existing sessions from <table>_legacy into the new tables,
+        numbering each session's rows in their original order where the legacy
+        table has no seq column, then drop the legacy tables
+
+        Args:
+            cursor: Cursor inside the init transaction
+            tables: Tables returned by _rename_outdated_tables
+        """
+        for table in tables:
+            legacy_columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table}_legacy)')]
+            columns = ', '.join(
+                row[1] for row in cursor.execute(f'PRAGMA table_info({table})') if row[1] != 'seq'
+            )
+            if 'seq' in legacy_columns:
+                seq = 'seq'
+            else:
+                seq = 'ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY rowid) - 1'
+            cursor.execute(f'''
+                INSERT INTO {table} (seq, {columns})
+                SELECT {seq}, {columns}
+                FROM {table}_legacy WHERE session_id IN (SELECT id FROM sessions)
+            ''')
+            cursor.execute(f'DROP TABLE {table}_legacy')
+            logger.info("Migrated %s to per-session clustered rows", table)
+
     def save_session(self, session_data: Dict[str, Any]) -> bool:
         """
         Save or update a session
@@ -133,112 +564,185 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                # Update timestamp
-                session_data['updated_at'] = datetime.now().isoformat()
-
-                # Convert complex data to JSON
-                session_json = json.dumps({
-                    'chat_history': session_data.get('chat_history', []),
-                    'documents': session_data.get('documents', []),
-                    'emotions': session_data.get('emotions', []),
-                    'assessments': session_data.get('assessments', [])
-                })
-
-                # Insert or replace session
-                cursor.execute('''
-                    INSERT OR REPLACE INTO sessions
-                    (id, created_at, updated_at, data, chat_history_count, documents_count, emotions_count, assessments_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    session_data['id'],
-                    session_data.get('created_at', datetime.now().isoformat()),
-                    session_data['updated_at'],
-                    session_json,
-                    len(session_data.get('chat_history', [])),
-                    len(session_data.get('documents', [])),
-                    len(session_data.get('emotions', [])),
-                    len(session_data.get('assessments', []))
-                ))
-
-                # Save individual components for better querying
-
-                # Save documents
-                if 'documents' in session_data:
-                    cursor.execute('DELETE FROM documents WHERE session_id = ?', (session_data['id'],))
-                    for doc in session_data['documents']:
-                        cursor.execute('''
-                            INSERT INTO documents (id, session_id, filename, upload_date, pages, chunks, metadata)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            doc['id'],
-                            session_data['id'],
-                            doc['filename'],
-                            doc.get('upload_date'),
-                            doc.get('pages', 0),
-                            doc.get('chunks', 0),
-                            json.dumps(doc.get('metadata', {}))
-                        ))
-
-                # Save emotions
-                if 'emotions' in session_data:
-                    cursor.execute('DELETE FROM emotions WHERE session_id = ?', (session_data['id'],))
-                    for emotion in session_data['emotions']:
-                        cursor.execute('''
-                            INSERT INTO emotions (session_id, emotion, confidence, emotion_type, timestamp)
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (
-                            session_data['id'],
-                            emotion.get('emotion'),
-                            emotion.get('confidence', 0.0),
-                            emotion.get('type', 'text'),
-                            emotion.get('timestamp')
-                        ))
-
-                # Save assessments
-                if 'assessments' in session_data:
-                    cursor.execute('DELETE FROM assessments WHERE session_id = ?', (session_data['id'],))
-                    for assessment in session_data['assessments']:
-                        cursor.execute('''
-                            INSERT INTO assessments (id, session_id, assessment_type, score, category, recommendations, timestamp)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            assessment['id'],
-                            session_data['id'],
-                            assessment.get('type', 'mental_health'),
-                            assessment.get('score'),
-                            assessment.get('category'),
-                            json.dumps(assessment.get('recommendations', [])),
-                            assessment.get('timestamp')
-                        ))
-
-                # Save chat history
-                if 'chat_history' in session_data:
-                    cursor.execute('DELETE FROM chat_history WHERE session_id = ?', (session_data['id'],))
-                    for i, message in enumerate(session_data['chat_history']):
-                        cursor.execute('''
-                            INSERT INTO chat_history (session_id, role, content, timestamp, sources, rag_enabled, metadata)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            session_data['id'],
-                            message.get('role'),
-                            message.get('content'),
-                            message.get('timestamp'),
-                            json.dumps(message.get('sources', [])),
-                            message.get('rag_enabled', False),
-                            json.dumps(message.get('metadata', {}))
-                        ))
-
-                conn.commit()
-                logger.debug(f"Session {session_data['id']} saved successfully")
+            # One transaction for the session row and all of its child rows
+            with self._transaction() as conn:
+                self._write_session(conn.cursor(), session_data)
+                logger.debug("Session %s saved successfully", session_data['id'])
                 return True
 
         except Exception as e:
-            logger.error(f"Failed to save session: {str(e)}")
+            logger.error("Failed to save session: %s", e)
             return False
 
+    def _write_session(self, cursor: sqlite3.Cursor, session_data: Dict[str, Any]):
+        """
+        Write a session row and its new child rows inside an open transaction
+
+        Args:
+            cursor: Cursor inside a write transaction
+            session_data: Session data dictionary
+        """
+        session_id = session_data['id']
+        get = session_data.get
+
+        # Update timestamp; one clock read also serves as created_at for new
+        # sessions. Both are stored as epoch milliseconds.
+        now = epoch_millis()
+        session_data['updated_at'] = millis_to_iso(now)
+
+        # The session row records how many rows each child table holds, so one
+        # point read replaces a COUNT per table. Child rows of a session that
+        # still has a legacy data blob use the old metadata layout, so they
+        # are rewritten rather than extended.
+        state = cursor.execute(_SQL_SESSION_SAVE_STATE, (session_id,)).fetchone()
+        if state:
+            rewrite = bool(state[0])
+            stored_counts = dict(zip(CHILD_TABLES, (count or 0 for count in state[1:])))
+        else:
+            rewrite = False
+            stored_counts = dict.fromkeys(CHILD_TABLES, 0)
+
+        # Lists missing from session_data leave their rows, and counts, as they are
+        counts = {
+            table: len(session_data[table]) if table in session_data else stored_counts[table]
+            for table in CHILD_TABLES
+        }
+
+        # Insert or update session in place, since REPLACE would delete the
+        # row and cascade to its children; contents live only in the child
+        # tables, so the legacy data column is cleared
+        cursor.execute(_SQL_UPSERT_SESSION, (
+            session_id,
+            epoch_millis(get('created_at', now)),
+            now,
+            counts['chat_history'],
+            counts['documents'],
+            counts['emotions'],
+            counts['assessments']
+        ))
+
+        # Save individual components: only items past the rows already
+        # stored, with one prepared statement per table
+        dumps = json_dumps
+        pack = pack_text
+
+        # Save documents
+        if 'documents' in session_data:
+            stored = self._stored_prefix(cursor, 'documents', session_id, counts['documents'],
+                                         stored_counts['documents'], rewrite)
+            cursor.executemany(_SQL_INSERT_DOCUMENT, [
+                (
+                    session_id,
+                    seq,
+                    doc['id'],
+                    doc['filename'],
+                    doc.get('upload_date'),
+                    doc.get('pages', 0),
+                    doc.get('chunks', 0),
+                    dumps({key: value for key, value in doc.items() if key not in _DOCUMENT_COLUMNS})
+                )
+                for seq, doc in enumerate(session_data['documents'][stored:], stored)
+            ])
+
+        # Save emotions
+        if 'emotions' in session_data:
+            stored = self._stored_prefix(cursor, 'emotions', session_id, counts['emotions'],
+                                         stored_counts['emotions'], rewrite)
+            cursor.executemany(_SQL_INSERT_EMOTION, [
+                (
+                    session_id,
+                    seq,
+                    emotion.get('emotion'),
+                    emotion.get('confidence', 0.0),
+                    emotion.get('type', 'text'),
+                    emotion.get('timestamp')
+                )
+                for seq, emotion in enumerate(session_data['emotions'][stored:], stored)
+            ])
+
+        # Save assessments
+        if 'assessments' in session_data:
+            stored = self._stored_prefix(cursor, 'assessments', session_id, counts['assessments'],
+                                         stored_counts['assessments'], rewrite)
+            cursor.executemany(_SQL_INSERT_ASSESSMENT, [
+                (
+                    session_id,
+                    seq,
+                    assessment['id'],
+                    assessment.get('type', 'mental_health'),
+                    assessment.get('score'),
+                    assessment.get('category'),
+                    dumps(assessment.get('recommendations', [])),
+                    assessment.get('timestamp')
+                )
+                for seq, assessment in enumerate(session_data['assessments'][stored:], stored)
+            ])
+
+        # Save chat history
+        if 'chat_history' in session_data:
+            stored = self._stored_prefix(cursor, 'chat_history', session_id, counts['chat_history'],
+                                         stored_counts['chat_history'], rewrite)
+            cursor.executemany(_SQL_INSERT_CHAT, [
+                (
+                    session_id,
+                    seq,
+                    message.get('role'),
+                    pack(message.get('content')),
+                    message.get('timestamp'),
+                    pack(dumps(message.get('sources', []))),
+                    message.get('rag_enabled', False),
+                    pack(dumps({key: value for key, value in message.items() if key not in _CHAT_COLUMNS}))
+                )
+                for seq, message in enumerate(session_data['chat_history'][stored:], stored)
+            ])
+
+    def save_session_async(self, session_data: Dict[str, Any]) -> Future:
+        """
+        Queue a session save on the writer thread and return without waiting
+
+        The session's lists are copied first, so later appends by the caller
+        do not race with the save. Saves run in the order they were queued, and
+        those queued close together share one commit.
+
+        Args:
+            session_data: Session data dictionary
+
+        Returns:
+            Future resolving to True if the save committed, False otherwise
+        """
+        snapshot = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in session_data.items()
+        }
+        future = Future()
+        self._write_queue.put((snapshot, future))
+        return future
+
+    def _stored_prefix(self, cursor: sqlite3.Cursor, table: str, session_id: str,
+                       item_count: int, stored: int, rewrite: bool) -> int:
+        """
+        Count the leading items of a session list whose rows are already stored
+
+        Session lists only grow, so their stored rows stay valid and only the
+        tail needs inserting; an unchanged list touches nothing. A list that
+        got shorter, or a forced rewrite, clears the session's rows instead.
+
+        Args:
+            cursor: Cursor inside the save transaction
+            table: Child table name
+            session_id: Session ID
+            item_count: Current length of the session's list
+            stored: Rows stored for the list, as recorded on the session row
+            rewrite: Discard all stored rows
+
+        Returns:
+            Number of leading items to skip when inserting
+        """
+        if not rewrite and stored <= item_count:
+            return stored
+        cursor.execute(_SQL_DELETE_SESSION_ROWS[table], (session_id,))
+        return 0
+
     def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Load a session from database
@@ -250,31 +754,92 @@ class DatabaseManager:
             Session data dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
                 # Get session data
-                cursor.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
+                cursor.execute('SELECT id, created_at, updated_at, data FROM sessions WHERE id = ?', (session_id,))
                 row = cursor.fetchone()
 
                 if not row:
                     return None
 
-                # Parse session data
-                session_data = json.loads(row[3]) if row[3] else {}
+                if row[3]:
+                    # Saved while the whole session was also kept as a JSON blob
+                    session_data = json_loads(row[3])
+                else:
+                    session_data = self._load_session_rows(cursor, session_id)
                 session_data.update({
                     'id': row[0],
-                    'created_at': row[1],
-                    'updated_at': row[2]
+                    'created_at': millis_to_iso(row[1]),
+                    'updated_at': millis_to_iso(row[2])
                 })
 
-                logger.debug(f"Session {session_id} loaded successfully")
+                logger.debug("Session %s loaded successfully", session_id)
                 return session_data
 
         except Exception as e:
-            logger.error(f"Failed to load session: {str(e)}")
+            logger.error("Failed to load session: %s", e)
             return None
 
+    def _load_session_rows(self, cursor: sqlite3.Cursor, session_id: str) -> Dict[str, Any]:
+        """
+        Rebuild a session's lists from its child table rows
+
+        Args:
+            cursor: Cursor on a pooled connection
+            session_id: Session ID
+
+        Returns:
+            Dictionary with documents, emotions, assessments and chat_history in saved order
+        """
+        cursor.execute('''
+            SELECT id, filename, upload_date, pages, chunks, metadata
+            FROM documents WHERE session_id = ? ORDER BY seq
+        ''', (session_id,))
+        documents = [
+            {'id': doc_id, 'filename': filename, 'upload_date': upload_date,
+             'pages': pages, 'chunks': chunks, **json_loads(metadata)}
+            for doc_id, filename, upload_date, pages, chunks, metadata in cursor.fetchall()
+        ]
+
+        cursor.execute('''
+            SELECT emotion, confidence, emotion_type, timestamp
+            FROM emotions WHERE session_id = ? ORDER BY seq
+        ''', (session_id,))
+        emotions = [
+            {'emotion': emotion, 'confidence': confidence, 'type': emotion_type, 'timestamp': timestamp}
+            for emotion, confidence, emotion_type, timestamp in cursor.fetchall()
+        ]
+
+        cursor.execute('''
+            SELECT id, assessment_type, score, category, recommendations, timestamp
+            FROM assessments WHERE session_id = ? ORDER BY seq
+        ''', (session_id,))
+        assessments = [
+            {'id': assessment_id, 'type': assessment_type, 'score': score, 'category': category,
+             'recommendations': json_loads(recommendations), 'timestamp': timestamp}
+            for assessment_id, assessment_type, score, category, recommendations, timestamp in cursor.fetchall()
+        ]
+
+        cursor.execute('''
+            SELECT role, content, timestamp, sources, rag_enabled, metadata
+            FROM chat_history WHERE session_id = ? ORDER BY seq
+        ''', (session_id,))
+        chat_history = [
+            {'role': role, 'content': unpack_text(content), 'timestamp': timestamp,
+             'sources': json_loads(unpack_text(sources)), 'rag_enabled': bool(rag_enabled),
+             **json_loads(unpack_text(metadata))}
+            for role, content, timestamp, sources, rag_enabled, metadata in cursor.fetchall()
+        ]
+
+        return {
+            'chat_history': chat_history,
+            'documents': documents,
+            'emotions': emotions,
+            'assessments': assessments
+        }
+
     def get_session_list(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get list of sessions
@@ -286,34 +851,21 @@ class DatabaseManager:
             List of session summaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
-                cursor.execute('''
-                    SELECT id, created_at, updated_at, chat_history_count, documents_count, emotions_count, assessments_count
-                    FROM sessions
-                    ORDER BY updated_at DESC
-                    LIMIT ?
-                ''', (limit,))
-
-                rows = cursor.fetchall()
-                sessions = []
-
-                for row in rows:
-                    sessions.append({
-                        'id': row[0],
-                        'created_at': row[1],
-                        'updated_at': row[2],
-                        'chat_history_count': row[3],
-                        'documents_count': row[4],
-                        'emotions_count': row[5],
-                        'assessments_count': row[6]
-                    })
-
-                return sessions
+                cursor.execute(_SQL_SESSION_LIST, (limit,))
+
+                # Build each dict straight from the cursor, without an
+                # intermediate fetchall() list; timestamps leave as ISO strings
+                fields = _SESSION_SUMMARY_FIELDS
+                return [
+                    dict(zip(fields, (session_id, millis_to_iso(created_at), millis_to_iso(updated_at), *counts)))
+                    for session_id, created_at, updated_at, *counts in cursor
+                ]
 
         except Exception as e:
-            logger.error(f"Failed to get session list: {str(e)}")
+            logger.error("Failed to get session list: %s", e)
             return []
 
     def delete_session(self, session_id: str) -> bool:
@@ -327,26 +879,28 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
 
-                # Delete related data
-                cursor.execute('DELETE FROM documents WHERE session_id = ?', (session_id,))
-                cursor.execute('DELETE FROM emotions WHERE session_id = ?', (session_id,))
-                cursor.execute('DELETE FROM assessments WHERE session_id = ?', (session_id,))
-                cursor.execute('DELETE FROM chat_history WHERE session_id = ?', (session_id,))
-
-                # Delete session
+                # Delete session; related data follows via ON DELETE CASCADE
                 cursor.execute('DELETE FROM sessions WHERE id = ?', (session_id,))
 
-                conn.commit()
-                logger.info(f"Session {session_id} deleted successfully")
+                logger.info("Session %s deleted successfully", session_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Failed to delete session: {str(e)}")
+            logger.error("Failed to delete session: %s", e)
             return False
 
+    def _database_size(self) -> int:
+        """Size of the database file in bytes, re-read at most every DB_SIZE_TTL_SECONDS"""
+        expires_at, size = self._db_size
+        now = time.monotonic()
+        if now >= expires_at:
+            size = os.stat(self.db_path).st_size
+            self._db_size = (now + DB_SIZE_TTL_SECONDS, size)
+        return size
+
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get database statistics
@@ -355,36 +909,33 @@ class DatabaseManager:
             Database statistics dictionary
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
-                stats = {}
-
-                # Count sessions
-                cursor.execute('SELECT COUNT(*) FROM sessions')
-                stats['total_sessions'] = cursor.fetchone()[0]
-
-                # Count documents
-                cursor.execute('SELECT COUNT(*) FROM documents')
-                stats['total_documents'] = cursor.fetchone()[0]
-
-                # Count emotions
-                cursor.execute('SELECT COUNT(*) FROM emotions')
-                stats['total_emotions'] = cursor.fetchone()[0]
-
-                # Count assessments
-                cursor.execute('SELECT COUNT(*) FROM assessments')
-                stats['total_assessments'] = cursor.fetchone()[0]
+                # All table counts in one statement
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM sessions),
+                        (SELECT COUNT(*) FROM documents),
+                        (SELECT COUNT(*) FROM emotions),
+                        (SELECT COUNT(*) FROM assessments),
+                        (SELECT COUNT(*) FROM chat_history)
+                ''')
+                sessions, documents, emotions, assessments, chat_messages = cursor.fetchone()
 
-                # Count chat messages
-                cursor.execute('SELECT COUNT(*) FROM chat_history')
-                stats['total_chat_messages'] = cursor.fetchone()[0]
+                stats = {
+                    'total_sessions': sessions,
+                    'total_documents': documents,
+                    'total_emotions': emotions,
+                    'total_assessments': assessments,
+                    'total_chat_messages': chat_messages
+                }
 
                 # Database size
-                stats['database_size_mb'] = os.path.getsize(self.db_path) / (1024 * 1024)
+                stats['database_size_mb'] = self._database_size() / (1024 * 1024)
 
                 return stats
 
         except Exception as e:
-            logger.error(f"Failed to get database stats: {str(e)}")
+            logger.error("Failed to get database stats: %s", e)
             return {}
\ No newline at end of file
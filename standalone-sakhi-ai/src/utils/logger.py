@@ -4,13 +4,30 @@ Logging configuration for Sakhi AI
 
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import queue
+import atexit
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Dict, Optional
+
+# Background listeners that own each configured logger's real handlers
+_listeners: Dict[str, QueueListener] = {}
+
+def _stop_listeners():
+    """Flush queued records and stop all listener threads"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+atexit.register(_stop_listeners)
 
 def setup_logger(name: str, log_file: str, level: str = 'INFO') -> logging.Logger:
     """
     Set up a logger with console and file handlers
 
+    Records are handed to the handlers through a queue drained by a
+    background listener. The calling thread still merges the message with
+    its arguments; the listener thread does the handler formatting and I/O.
+
     Args:
         name: Logger name
         log_file: Path to log file
@@ -24,6 +41,9 @@ def setup_logger(name: str, log_file: str, level: str = 'INFO') -> logging.Logge
 
     # Clear existing handlers to avoid duplicates
     logger.handlers.clear()
+    previous = _listeners.pop(name, None)
+    if previous:
+        previous.stop()
 
     # Set logging level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -44,7 +64,7 @@ def setup_logger(name: str, log_file: str, level: str = 'INFO') -> logging.Logge
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (with rotation)
     if log_file:
@@ -60,7 +80,16 @@ def setup_logger(name: str, log_file: str, level: str = 'INFO') -> logging.Logge
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Queue in front of the handlers; the listener thread does the I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
 
     return logger
 